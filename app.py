@@ -4,10 +4,12 @@ from dotenv import load_dotenv
 load_dotenv(Path(__file__).resolve().parent / ".env")
 
 import streamlit as st
+from components.custom_theme import inject_custom_css
 from components.html_utils import escape_html
 from config.env_flags import is_demo_mode
+from config.navigation import ADMIN_SECTION, LOGIN_PAGE, NAV_SECTIONS
 from config.runtime_config import RuntimeConfigError, load_admin_bootstrap_config
-from db.database import get_connection, init_db
+from db.database import db_cursor, init_db, warm_shared_connection
 from services.admin_service import ensure_bootstrap_admin, reset_accounts_once
 
 st.set_page_config(
@@ -19,6 +21,35 @@ st.set_page_config(
 
 LOGGER = logging.getLogger(__name__)
 
+# Sidebar greeting card; only the escaped display name and journey label vary.
+_SIDEBAR_TMPL = (
+    '<div style="background:#FFFFFF;border:1px solid rgba(0,0,0,0.10);'
+    'border-radius:16px;padding:16px;margin-bottom:12px;text-align:center">'
+    '<div style="font-size:2rem;margin-bottom:4px">&#128075;</div>'
+    '<div style="font-family:\'Google Sans\',\'Product Sans\',-apple-system,BlinkMacSystemFont,'
+    '\'Segoe UI\',Roboto,system-ui,sans-serif;font-size:17px;line-height:22px;'
+    'font-weight:600;color:#1D1B20">{display}</div>'
+    '<div style="font-size:11px;line-height:13px;color:#79747E;'
+    'margin-top:4px">{journey_label}</div>'
+    '</div>'
+)
+
+
+@st.fragment
+def _render_sidebar() -> None:
+    """Greeting card + logout; a fragment so its widgets don't rerun the page."""
+    display = escape_html(st.session_state.get("display_name", "User"))
+    account_role = st.session_state.get("account_role", "user")
+    journey_label = "Administrator" if account_role == "admin" else "Lifestyle Medicine Journey"
+    st.markdown(
+        _SIDEBAR_TMPL.format(display=display, journey_label=journey_label),
+        unsafe_allow_html=True,
+    )
+    if st.button("Logout", use_container_width=True):
+        for key in list(st.session_state.keys()):
+            del st.session_state[key]
+        st.rerun(scope="app")
+
 
 @st.cache_resource(show_spinner=False)
 def _bootstrap_app_data() -> bool:
@@ -54,14 +85,12 @@ def _bootstrap_app_data() -> bool:
         except Exception:
             LOGGER.exception("Failed to provision the configured administrator")
 
-    conn = get_connection()
-    try:
-        demo_row = conn.execute(
+    warm_shared_connection()
+    with db_cursor() as cur:
+        demo_row = cur.execute(
             "SELECT id, email FROM users WHERE username = ?",
             ("maria.silva",),
         ).fetchone()
-    finally:
-        conn.close()
 
     try:
         from seed_demo import (
@@ -93,11 +122,8 @@ def _bootstrap_app_data() -> bool:
         elif demo_exists:
             # Ensure wearable table exists before backfill
             from services.wearable_wheel_service import _ensure_wearable_measurements_schema
-            _bconn = get_connection()
-            try:
-                _ensure_wearable_measurements_schema(_bconn)
-            finally:
-                _bconn.close()
+            with db_cursor() as cur:
+                _ensure_wearable_measurements_schema(cur.connection)
 
             # Keep the built-in demo account synchronized in every environment.
             backfill_summary = ensure_demo_organ_score_prereqs(
@@ -124,103 +150,32 @@ def _bootstrap_app_data() -> bool:
 
 _bootstrap_app_data()
 
-# Inject Apple Design System + Tailwind utility CSS
-from components.custom_theme import inject_custom_css
-inject_custom_css()
-
 # ── Authentication gate ─────────────────────────────────────────────────────
 if "user_id" not in st.session_state:
+    _login_path, _login_title, _login_icon = LOGIN_PAGE
     pg = st.navigation(
-        [st.Page("pages/login.py", title="Login", icon=":material/login:", default=True)],
+        [st.Page(_login_path, title=_login_title, icon=_login_icon, default=True)],
         position="hidden",
     )
 else:
-    navigation_sections = {
-            "Overview": [
-                st.Page("pages/clinical_command_center.py", title="Clinical Summary", icon=":material/clinical_notes:", default=True),
-                st.Page("pages/precision_plans.py", title="Precision Plans", icon=":material/auto_awesome:"),
-                st.Page("pages/dashboard.py", title="Dashboard", icon=":material/dashboard:"),
-                st.Page("pages/wheel_assessment.py", title="Wheel of Life", icon=":material/donut_large:"),
-                st.Page("pages/recovery.py", title="Recovery", icon=":material/hotel:"),
-            ],
-            "Planning": [
-                st.Page("pages/weekly_plan.py", title="Weekly Plan", icon=":material/calendar_view_week:"),
-                st.Page("pages/monthly_plan.py", title="Monthly Plan", icon=":material/calendar_month:"),
-                st.Page("pages/goals.py", title="Goals", icon=":material/flag:"),
-                st.Page("pages/microhabits.py", title="Micro Habits", icon=":material/psychology_alt:"),
-            ],
-            "Tracking": [
-                st.Page("pages/progress.py", title="Progress", icon=":material/trending_up:"),
-                st.Page("pages/exercise_tracker.py", title="Exercise", icon=":material/fitness_center:"),
-                st.Page("pages/exercise_library.py", title="Exercise Library", icon=":material/menu_book:"),
-                st.Page("pages/exercise_prescription.py", title="Training Program", icon=":material/assignment:"),
-                st.Page("pages/hpr_movement_lab.py", title="HPR Movement Lab", icon=":material/directions_run:"),
-                st.Page("pages/running_training.py", title="Running Training", icon=":material/directions_run:"),
-                st.Page("pages/cycling_prescription.py", title="Cycling Training", icon=":material/directions_bike:"),
-                st.Page("pages/body_metrics.py", title="Body Metrics", icon=":material/monitor_weight:"),
-                st.Page("pages/inbody_report.py", title="InBody Coach", icon=":material/scale:"),
-                st.Page("pages/cpet_report.py", title="CPET Coach", icon=":material/monitor_heart:"),
-                st.Page("pages/biomarkers.py", title="Biomarkers", icon=":material/bloodtype:"),
-                st.Page("pages/organ_health.py", title="Organ Scores", icon=":material/monitor_heart:"),
-                st.Page("pages/healthscore_v2.py", title="Health Score v2 (beta)", icon=":material/science:"),
-                st.Page("pages/sleep_tracker.py", title="Sleep", icon=":material/bedtime:"),
-                st.Page("pages/nutrition_logger.py", title="Nutrition", icon=":material/restaurant:"),
-                st.Page("pages/diet_assessment.py", title="Diet Pattern", icon=":material/eco:"),
-                st.Page("pages/fasting_tracker.py", title="Fasting", icon=":material/timer:"),
-                st.Page("pages/sibo_tracker.py", title="SIBO & FODMAP", icon=":material/science:"),
-                st.Page("pages/analytics.py", title="Analytics", icon=":material/insights:"),
-                st.Page("pages/ai_coach.py", title="AI Coach", icon=":material/psychology:"),
-            ],
-            "Science": [
-                st.Page("pages/science_review.py", title="Science Review", icon=":material/fact_check:"),
-                st.Page("pages/research_library.py", title="Research Library", icon=":material/science:"),
-                st.Page("pages/protocols.py", title="Daily Protocols", icon=":material/labs:"),
-            ],
-            "Growth": [
-                st.Page("pages/daily_growth.py", title="Daily Growth", icon=":material/spa:"),
-                st.Page("pages/lessons.py", title="Micro-Lessons", icon=":material/school:"),
-                st.Page("pages/challenges.py", title="Challenges", icon=":material/emoji_events:"),
-                st.Page("pages/future_self.py", title="Future Self", icon=":material/mail:"),
-            ],
-            "Reports": [
-                st.Page("pages/reports.py", title="Health Report", icon=":material/summarize:"),
-            ],
-            "Wearables": [
-                st.Page("pages/wearable_wheel.py", title="Wearable Wheel", icon=":material/watch:"),
-            ],
-            "Account": [
-                st.Page("pages/settings_page.py", title="Settings", icon=":material/settings:"),
-                st.Page("pages/garmin_import.py", title="Garmin Connect", icon=":material/watch:"),
-            ],
-        }
+    nav_entries = dict(NAV_SECTIONS)
     if st.session_state.get("account_role") == "admin":
-        navigation_sections["Administration"] = [
-            st.Page(
-                "pages/admin_console.py",
-                title="Admin Console",
-                icon=":material/admin_panel_settings:",
-            )
+        admin_name, admin_pages = ADMIN_SECTION
+        nav_entries[admin_name] = admin_pages
+    _default_path = next(iter(NAV_SECTIONS.values()))[0][0]
+    navigation_sections = {
+        section: [
+            st.Page(path, title=title, icon=icon, default=path == _default_path)
+            for path, title, icon in pages
         ]
+        for section, pages in nav_entries.items()
+    }
     pg = st.navigation(navigation_sections)
     with st.sidebar:
-        display = escape_html(st.session_state.get("display_name", "User"))
-        account_role = st.session_state.get("account_role", "user")
-        journey_label = "Administrator" if account_role == "admin" else "Lifestyle Medicine Journey"
-        sidebar_html = (
-            '<div style="background:#FFFFFF;border:1px solid rgba(0,0,0,0.10);'
-            'border-radius:16px;padding:16px;margin-bottom:12px;text-align:center">'
-            '<div style="font-size:2rem;margin-bottom:4px">&#128075;</div>'
-            f'<div style="font-family:\'Google Sans\',\'Product Sans\',-apple-system,BlinkMacSystemFont,'
-            f'\'Segoe UI\',Roboto,system-ui,sans-serif;font-size:17px;line-height:22px;'
-            f'font-weight:600;color:#1D1B20">{display}</div>'
-            '<div style="font-size:11px;line-height:13px;color:#79747E;'
-            f'margin-top:4px">{journey_label}</div>'
-            '</div>'
-        )
-        st.markdown(sidebar_html, unsafe_allow_html=True)
-        if st.button("Logout", use_container_width=True):
-            for key in list(st.session_state.keys()):
-                del st.session_state[key]
-            st.rerun()
+        _render_sidebar()
+
+# Inject the theme CSS after the navigation tree is registered so the nav
+# shell is emitted first; it still lands before the page body renders.
+inject_custom_css()
 
 pg.run()
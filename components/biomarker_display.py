@@ -1,19 +1,67 @@
 """Biomarker display components — range bars, status badges, score gauge."""
 
+from functools import lru_cache
+
 import streamlit as st
 from components.custom_theme import APPLE
+from services.biomarker_service import classify_result, get_classification_display
 
 A = APPLE
 
+# Theme tokens resolved once at import; render paths reference these names.
+_BG_ELEVATED = A["bg_elevated"]
+_SEPARATOR = A["separator"]
+_RADIUS_MD = A["radius_md"]
+_FONT_DISPLAY = A["font_display"]
+_LABEL_PRIMARY = A["label_primary"]
+_LABEL_TERTIARY = A["label_tertiary"]
+_BG_TERTIARY = A["bg_tertiary"]
+_FONT_TEXT = A["font_text"]
+_LABEL_SECONDARY = A["label_secondary"]
+_RADIUS_LG = A["radius_lg"]
+
+# Range-bar card with theme tokens baked in once at import; only the
+# per-result fields remain as str.format placeholders.
+_BAR_TMPL = (
+    f'<div style="background:{_BG_ELEVATED};border:1px solid {_SEPARATOR};'
+    f'border-radius:{_RADIUS_MD};padding:14px 16px 32px 16px;margin-bottom:8px">'
+    '<div style="display:flex;justify-content:space-between;align-items:center;margin-bottom:4px">'
+    f'<div style="font-family:{_FONT_DISPLAY};font-size:14px;font-weight:600;'
+    f'color:{_LABEL_PRIMARY}">{{name}}</div>'
+    '<div style="display:flex;align-items:center;gap:6px">'
+    '<span style="font-size:14px;font-weight:700;color:{color}">'
+    '{value} {unit}</span>'
+    '<span style="font-size:10px;font-weight:600;padding:2px 6px;'
+    'border-radius:4px;background:{color}20;'
+    'color:{color}">{cls_label}</span>'
+    '</div>'
+    '</div>'
+    f'<div style="font-size:11px;color:{_LABEL_TERTIARY};margin-bottom:8px">'
+    '{range_text}</div>'
+    f'<div style="position:relative;height:14px;background:{_BG_TERTIARY};'
+    'border-radius:7px;overflow:visible">'
+    '{zones}'
+    # Value marker
+    '<div style="position:absolute;left:{val_pct}%;top:-2px;'
+    'width:3px;height:calc(100% + 4px);background:{color};'
+    'border-radius:2px;transform:translateX(-50%)"></div>'
+    # Value label below
+    '<div style="position:absolute;left:{val_pct}%;top:18px;'
+    'transform:translateX(-50%);font-size:11px;font-weight:700;'
+    'color:{color}">{value}</div>'
+    '</div>'
+    '</div>'
+)
+
 
-def render_biomarker_range_bar(result, definition=None):
-    """Render a horizontal range bar versus reference and critical bands."""
+def _build_bar_html(result, definition=None):
+    """Return range-bar HTML for one result, or "" when it has no value."""
     if definition is None:
         definition = result
 
     value = result.get("value")
     if value is None:
-        return
+        return ""
 
     name = definition.get("name", "")
     unit = definition.get("unit", "")
@@ -22,95 +70,91 @@ def render_biomarker_range_bar(result, definition=None):
     crit_low = definition.get("critical_low")
     crit_high = definition.get("critical_high")
 
-    from services.biomarker_service import classify_result, get_classification_display
     classification = classify_result(value, definition)
     cls_display = get_classification_display(classification)
 
     # Determine bar range (min to max for display)
-    all_vals = [v for v in [crit_low, std_low, std_high, crit_high, value] if v is not None]
-    if not all_vals:
-        return
-    bar_min = min(all_vals) * 0.7
-    bar_max = max(all_vals) * 1.3
+    lo = hi = None
+    for v in (crit_low, std_low, std_high, crit_high, value):
+        if v is None:
+            continue
+        if lo is None or v < lo:
+            lo = v
+        if hi is None or v > hi:
+            hi = v
+    if lo is None:
+        return ""
+    bar_min = lo * 0.7
+    bar_max = hi * 1.3
     if bar_min == bar_max:
         bar_max = bar_min + 1
     bar_range = bar_max - bar_min
 
-    def pct(v):
+    def pct(v, _min=bar_min, _range=bar_range):
         if v is None:
             return None
-        return max(0, min(100, ((v - bar_min) / bar_range) * 100))
+        return max(0, min(100, ((v - _min) / _range) * 100))
 
     val_pct = pct(value)
 
     # Build zone backgrounds
-    zones_html = ""
+    zones = []
     # Reference zone (subtle blue)
     if std_low is not None and std_high is not None:
         left = pct(std_low)
         width = pct(std_high) - left
-        zones_html += (
+        zones.append(
             f'<div style="position:absolute;left:{left}%;width:{width}%;'
             f'height:100%;background:#64D2FF15;border-radius:4px"></div>'
         )
 
-    # Value marker
-    marker_html = (
-        f'<div style="position:absolute;left:{val_pct}%;top:-2px;'
-        f'width:3px;height:calc(100% + 4px);background:{cls_display["color"]};'
-        f'border-radius:2px;transform:translateX(-50%)"></div>'
-    )
-
-    # Value label below
-    val_label_html = (
-        f'<div style="position:absolute;left:{val_pct}%;top:18px;'
-        f'transform:translateX(-50%);font-size:11px;font-weight:700;'
-        f'color:{cls_display["color"]}">{value}</div>'
-    )
-
     # Build reference range text
-    range_parts = []
     if std_low is not None and std_high is not None:
-        range_parts.append(f"Ref: {std_low}-{std_high} {unit}")
+        range_text = f"Ref: {std_low}-{std_high} {unit}"
     elif std_high is not None:
-        range_parts.append(f"Ref: &lt;{std_high} {unit}")
+        range_text = f"Ref: &lt;{std_high} {unit}"
     elif std_low is not None:
-        range_parts.append(f"Ref: &gt;{std_low} {unit}")
-    range_text = " &middot; ".join(range_parts)
-
-    bar_html = (
-        f'<div style="background:{A["bg_elevated"]};border:1px solid {A["separator"]};'
-        f'border-radius:{A["radius_md"]};padding:14px 16px 32px 16px;margin-bottom:8px">'
-        f'<div style="display:flex;justify-content:space-between;align-items:center;margin-bottom:4px">'
-        f'<div style="font-family:{A["font_display"]};font-size:14px;font-weight:600;'
-        f'color:{A["label_primary"]}">{name}</div>'
-        f'<div style="display:flex;align-items:center;gap:6px">'
-        f'<span style="font-size:14px;font-weight:700;color:{cls_display["color"]}">'
-        f'{value} {unit}</span>'
-        f'<span style="font-size:10px;font-weight:600;padding:2px 6px;'
-        f'border-radius:4px;background:{cls_display["color"]}20;'
-        f'color:{cls_display["color"]}">{cls_display["label"]}</span>'
-        f'</div>'
-        f'</div>'
-        f'<div style="font-size:11px;color:{A["label_tertiary"]};margin-bottom:8px">'
-        f'{range_text}</div>'
-        f'<div style="position:relative;height:14px;background:{A["bg_tertiary"]};'
-        f'border-radius:7px;overflow:visible">'
-        f'{zones_html}'
-        f'{marker_html}'
-        f'{val_label_html}'
-        f'</div>'
-        f'</div>'
+        range_text = f"Ref: &gt;{std_low} {unit}"
+    else:
+        range_text = ""
+
+    return _BAR_TMPL.format(
+        name=name,
+        value=value,
+        unit=unit,
+        color=cls_display["color"],
+        cls_label=cls_display["label"],
+        range_text=range_text,
+        zones="".join(zones),
+        val_pct=val_pct,
     )
-    st.markdown(bar_html, unsafe_allow_html=True)
 
 
-def render_biomarker_score_gauge(score, label="Biomarker Score"):
-    """Render a circular score gauge for the composite biomarker score."""
-    if score is None:
-        st.caption("No biomarker data yet. Log your first lab results to see your score.")
-        return
+def render_biomarker_range_bar(result, definition=None):
+    """Render a horizontal range bar versus reference and critical bands."""
+    bar_html = _build_bar_html(result, definition)
+    if bar_html:
+        st.markdown(bar_html, unsafe_allow_html=True)
+
+
+def render_biomarker_range_bars(results):
+    """Render range bars for many results in a single markdown element.
 
+    Prefer this over looping ``render_biomarker_range_bar`` for lists: one
+    Streamlit element instead of one per biomarker.
+    """
+    bars_html = "".join(_build_bar_html(r) for r in results)
+    if bars_html:
+        st.markdown(bars_html, unsafe_allow_html=True)
+
+
+_GAUGE_RADIUS = 54
+_GAUGE_CIRCUMFERENCE = 2 * 3.14159 * _GAUGE_RADIUS
+
+
+@lru_cache(maxsize=512, typed=True)
+def _gauge_html(score, label):
+    """Return the SVG gauge HTML; pure in ``(score, label)`` so it is memoized."""
     if score >= 85:
         color = "#30D158"
         zone = "Excellent"
@@ -124,52 +168,60 @@ def render_biomarker_score_gauge(score, label="Biomarker Score"):
         color = "#FF453A"
         zone = "Needs Attention"
 
-    # SVG circular gauge
-    radius = 54
-    circumference = 2 * 3.14159 * radius
+    radius = _GAUGE_RADIUS
+    circumference = _GAUGE_CIRCUMFERENCE
     offset = circumference * (1 - score / 100)
 
-    gauge_html = (
+    return (
         f'<div style="text-align:center;padding:16px">'
         f'<svg width="140" height="140" viewBox="0 0 140 140">'
-        f'<circle cx="70" cy="70" r="{radius}" fill="none" stroke="{A["bg_tertiary"]}" stroke-width="10"/>'
+        f'<circle cx="70" cy="70" r="{radius}" fill="none" stroke="{_BG_TERTIARY}" stroke-width="10"/>'
         f'<circle cx="70" cy="70" r="{radius}" fill="none" stroke="{color}" stroke-width="10" '
         f'stroke-linecap="round" stroke-dasharray="{circumference}" '
         f'stroke-dashoffset="{offset}" transform="rotate(-90 70 70)"/>'
-        f'<text x="70" y="64" text-anchor="middle" fill="{A["label_primary"]}" '
-        f'font-family="{A["font_display"]}" font-size="28" font-weight="700">{score}</text>'
-        f'<text x="70" y="84" text-anchor="middle" fill="{A["label_tertiary"]}" '
-        f'font-family="{A["font_text"]}" font-size="11" font-weight="600">{zone}</text>'
+        f'<text x="70" y="64" text-anchor="middle" fill="{_LABEL_PRIMARY}" '
+        f'font-family="{_FONT_DISPLAY}" font-size="28" font-weight="700">{score}</text>'
+        f'<text x="70" y="84" text-anchor="middle" fill="{_LABEL_TERTIARY}" '
+        f'font-family="{_FONT_TEXT}" font-size="11" font-weight="600">{zone}</text>'
         f'</svg>'
-        f'<div style="font-size:12px;font-weight:600;color:{A["label_secondary"]};'
+        f'<div style="font-size:12px;font-weight:600;color:{_LABEL_SECONDARY};'
         f'text-transform:uppercase;letter-spacing:0.06em;margin-top:4px">{label}</div>'
         f'</div>'
     )
-    st.markdown(gauge_html, unsafe_allow_html=True)
+
+
+def render_biomarker_score_gauge(score, label="Biomarker Score"):
+    """Render a circular score gauge for the composite biomarker score."""
+    if score is None:
+        st.caption("No biomarker data yet. Log your first lab results to see your score.")
+        return
+    st.markdown(_gauge_html(score, label), unsafe_allow_html=True)
+
+
+# (label, summary key, color) for each count in the summary strip.
+_SUMMARY_ITEMS = (
+    ("In Range", "in_range", "#30D158"),
+    ("Below Range", "low", "#FF9F0A"),
+    ("Above Range", "high", "#FF9F0A"),
+    ("Abnormal", "abnormal", "#FF9F0A"),
+    ("Critical", "critical", "#FF453A"),
+)
 
 
 def render_biomarker_summary_strip(summary):
     """Render a summary strip of biomarker classification counts."""
-    items = [
-        ("In Range", summary.get("in_range", 0), "#30D158"),
-        ("Below Range", summary.get("low", 0), "#FF9F0A"),
-        ("Above Range", summary.get("high", 0), "#FF9F0A"),
-        ("Abnormal", summary.get("abnormal", 0), "#FF9F0A"),
-        ("Critical", summary.get("critical", 0), "#FF453A"),
-    ]
-    cards = ""
-    for label, count, color in items:
-        cards += (
-            f'<div style="text-align:center;min-width:60px">'
-            f'<div style="font-family:{A["font_display"]};font-size:22px;'
-            f'font-weight:700;color:{color}">{count}</div>'
-            f'<div style="font-size:10px;font-weight:600;text-transform:uppercase;'
-            f'letter-spacing:0.06em;color:{A["label_tertiary"]}">{label}</div>'
-            f'</div>'
-        )
+    cards = "".join(
+        f'<div style="text-align:center;min-width:60px">'
+        f'<div style="font-family:{_FONT_DISPLAY};font-size:22px;'
+        f'font-weight:700;color:{color}">{summary.get(key, 0)}</div>'
+        f'<div style="font-size:10px;font-weight:600;text-transform:uppercase;'
+        f'letter-spacing:0.06em;color:{_LABEL_TERTIARY}">{label}</div>'
+        f'</div>'
+        for label, key, color in _SUMMARY_ITEMS
+    )
     strip_html = (
-        f'<div style="background:{A["bg_elevated"]};border:1px solid {A["separator"]};'
-        f'border-radius:{A["radius_lg"]};padding:16px;margin-bottom:16px">'
+        f'<div style="background:{_BG_ELEVATED};border:1px solid {_SEPARATOR};'
+        f'border-radius:{_RADIUS_LG};padding:16px;margin-bottom:16px">'
         f'<div style="display:flex;justify-content:space-around;flex-wrap:wrap;gap:8px">'
         f'{cards}'
         f'</div>'
@@ -184,8 +236,8 @@ def render_category_header(category_key, category_info):
         f'<div style="display:flex;align-items:center;gap:8px;'
         f'margin-top:20px;margin-bottom:12px">'
         f'<span style="font-size:18px">{category_info.get("icon", "")}</span>'
-        f'<span style="font-family:{A["font_display"]};font-size:17px;'
-        f'font-weight:600;color:{A["label_primary"]}">'
+        f'<span style="font-family:{_FONT_DISPLAY};font-size:17px;'
+        f'font-weight:600;color:{_LABEL_PRIMARY}">'
         f'{category_info.get("label", category_key)}</span>'
         f'</div>'
     )
@@ -1,5 +1,4 @@
 import streamlit as st
-import plotly.graph_objects as go
 from datetime import date, timedelta
 import calendar
 
@@ -8,50 +7,44 @@ def render_calendar_heatmap(year: int, month: int, day_values: dict, height: int
     """Render a monthly calendar heatmap.
     day_values = {date_str: float} where float is 0.0-1.0 (completion rate).
     """
+    import numpy as np
+    import plotly.graph_objects as go
+
     cal = calendar.Calendar(firstweekday=0)  # Monday start
     month_days = list(cal.itermonthdates(year, month))
 
-    # Build grid: weeks as rows, days as columns
-    weeks = []
-    week = []
-    for d in month_days:
-        week.append(d)
-        if len(week) == 7:
-            weeks.append(week)
-            week = []
+    # One lookup per in-month day; NaN marks padding days from adjacent months
+    # (Plotly renders NaN cells as gaps, like None).
+    flat_vals = np.array(
+        [day_values.get(d.isoformat(), 0) if d.month == month else np.nan for d in month_days],
+        dtype=float,
+    )
+    z_values = flat_vals.reshape(-1, 7)
+    n_weeks = z_values.shape[0]
+    in_month = ~np.isnan(flat_vals)
+    label_colors = np.where(flat_vals > 0.5, "white", "black")
 
-    z_values = []
-    hover_text = []
-    for week in weeks:
-        z_row = []
-        hover_row = []
-        for d in week:
-            if d.month == month:
-                val = day_values.get(d.isoformat(), 0)
-                z_row.append(val)
-                hover_row.append(f"{d.strftime('%b %d')}: {val:.0%}")
-            else:
-                z_row.append(None)
-                hover_row.append("")
-        z_values.append(z_row)
-        hover_text.append(hover_row)
+    hover_flat = [
+        f"{d.strftime('%b %d')}: {v:.0%}" if keep else ""
+        for d, v, keep in zip(month_days, flat_vals.tolist(), in_month.tolist())
+    ]
+    hover_text = [hover_flat[i:i + 7] for i in range(0, len(hover_flat), 7)]
 
     # Annotate with day numbers
-    annotations = []
-    for wi, week in enumerate(weeks):
-        for di, d in enumerate(week):
-            if d.month == month:
-                annotations.append(dict(
-                    x=di, y=wi,
-                    text=str(d.day),
-                    showarrow=False,
-                    font=dict(size=10, color="white" if day_values.get(d.isoformat(), 0) > 0.5 else "black"),
-                ))
+    annotations = [
+        dict(
+            x=int(idx % 7), y=int(idx // 7),
+            text=str(month_days[idx].day),
+            showarrow=False,
+            font=dict(size=10, color=str(label_colors[idx])),
+        )
+        for idx in np.flatnonzero(in_month)
+    ]
 
     fig = go.Figure(data=go.Heatmap(
         z=z_values,
         x=["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"],
-        y=[f"Week {i+1}" for i in range(len(weeks))],
+        y=[f"Week {i+1}" for i in range(n_weeks)],
         hovertext=hover_text,
         hoverinfo="text",
         colorscale=[[0, "#f5f5f5"], [0.3, "#C8E6C9"], [0.6, "#66BB6A"], [1.0, "#2E7D32"]],
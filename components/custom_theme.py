@@ -9,14 +9,24 @@ CRITICAL: Streamlit's st.markdown() processes HTML through a Markdown parser.
 The <style> block targets only Streamlit's own component selectors which DO work.
 """
 
+import hashlib
+import re
+import sys
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Final, NamedTuple
+
 import streamlit as st
 
+from components.html_utils import escape_html
+
 
 # ══════════════════════════════════════════════════════════════════════════════
 # MATERIAL YOU DESIGN TOKENS — Light Theme
 # ══════════════════════════════════════════════════════════════════════════════
 
-APPLE = {
+_APPLE_TOKENS = {
     # BACKGROUNDS (light)
     "bg_primary": "#F7F7FA",
     "bg_elevated": "#FFFFFF",
@@ -62,356 +72,56 @@ APPLE = {
     "chart_text": "#49454F",
 }
 
+# Read-only view over the tokens so no page can restyle the app for everyone
+# by mutating the shared dict; values are interned since they are repeated
+# verbatim across every component module.
+APPLE = MappingProxyType({k: sys.intern(v) for k, v in _APPLE_TOKENS.items()})
+
+
+# Readable source for the theme stylesheet lives next to this module and is
+# read and minified once at import.
+_APPLE_CSS_PATH = Path(__file__).resolve().with_name("apple_theme.css")
+_APPLE_CSS: Final[str] = _APPLE_CSS_PATH.read_text(encoding="utf-8")
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and collapse whitespace the stylesheet does not need.
+
+    Spaces are only dropped around ``{ } ; , >``, after ``:`` and before
+    ``!important``; never before ``:`` (``a :hover`` and ``a:hover`` are
+    different selectors). Quoted strings are left untouched.
+    """
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    parts = re.split(r"""('[^']*'|"[^"]*")""", css)
+    for i in range(0, len(parts), 2):
+        chunk = re.sub(r"\s+", " ", parts[i])
+        chunk = re.sub(r"\s*([{};,>])\s*", r"\1", chunk)
+        chunk = re.sub(r":\s+", ":", chunk)
+        parts[i] = re.sub(r"\s+!important", "!important", chunk)
+    return "".join(parts).replace(";}", "}").strip()
+
+
+# Single-line <style> element built once at import.
+_APPLE_CSS_MIN: Final[str] = f'<style id="lm-theme">{_minify_css(_APPLE_CSS)}</style>'
+
+# Web fonts load through their own <link> rather than an @import inside the
+# theme sheet, so the theme rules never wait on the Google Fonts round trip;
+# text renders in the system fallback until the font arrives.
+_FONT_LINKS: Final[str] = (
+    '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>'
+    '<link rel="stylesheet" href="https://fonts.googleapis.com/css2?'
+    'family=Google+Sans:wght@400;500;700&amp;'
+    'family=Google+Sans+Text:wght@400;500;600;700&amp;display=swap">'
+)
+
+# inject_custom_css() re-emits this same object on every rerun (Streamlit
+# drops any element a rerun does not re-emit).
+_THEME_HTML: Final[str] = _APPLE_CSS_MIN + _FONT_LINKS
+
 
 def inject_custom_css() -> None:
     """Inject Material You CSS targeting Streamlit's own selectors."""
-
-    st.markdown("""<style>
-@import url('https://fonts.googleapis.com/css2?family=Google+Sans:wght@400;500;700&family=Google+Sans+Text:wght@400;500;600;700&display=swap');
-:root {
-    --bg-primary: #F7F7FA;
-    --bg-primary-elevated: #FFFFFF;
-    --bg-secondary: #F0F0F5;
-    --bg-tertiary: #E5E5EA;
-    --label-primary: #1D1B20;
-    --label-secondary: #49454F;
-    --label-tertiary: #79747E;
-    --label-quaternary: #938F99;
-    --fill-tertiary: rgba(0,0,0,0.06);
-    --separator: rgba(0,0,0,0.10);
-    --separator-opaque: #E0E0E0;
-    --blue: #1A73E8;
-    --green: #1E8E3E;
-    --red: #D93025;
-    --orange: #E8710A;
-    --yellow: #F9AB00;
-    --pink: #D01884;
-    --purple: #7B1FA2;
-    --teal: #007B83;
-    --indigo: #6750A4;
-    --move: #D93025;
-    --font-display: 'Google Sans', 'Product Sans', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', system-ui, sans-serif;
-    --font-text: 'Google Sans Text', 'Roboto', -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Helvetica Neue', system-ui, sans-serif;
-    --ease-default: 0.25s cubic-bezier(0.4, 0, 0.2, 1);
-    --ease-spring: 0.45s cubic-bezier(0.34, 1.56, 0.64, 1);
-}
-[data-testid="stDecoration"] { display:none !important; }
-[data-testid="stStatusWidget"] { visibility:hidden !important; }
-footer { visibility:hidden !important; height:0 !important; }
-header[data-testid="stHeader"] { background:rgba(247,247,250,0.92) !important; backdrop-filter:blur(20px); -webkit-backdrop-filter:blur(20px); border-bottom: 1px solid rgba(0,0,0,0.06); }
-.stApp {
-    background-color: var(--bg-primary) !important;
-    font-family: var(--font-text) !important;
-    -webkit-font-smoothing: antialiased;
-}
-section.main .block-container {
-    padding-top: 32px;
-    padding-bottom: 40px;
-    max-width: 1200px;
-}
-[data-testid="stAppViewContainer"] .main .block-container {
-    padding-top: 32px;
-    padding-bottom: 40px;
-    max-width: 1200px;
-}
-.main .block-container {
-    animation: anim-fade-up 0.4s cubic-bezier(0.4,0,0.2,1) both !important;
-}
-html, body, [class*="css"] { font-family: var(--font-text) !important; }
-.stApp, .stApp p, .stApp span, .stApp li, .stApp td, .stApp th,
-.stApp label, .stApp div { color: #1D1B20; }
-.stApp [data-testid="stWidgetLabel"] label,
-.stApp [data-testid="stWidgetLabel"] p,
-.stApp .stRadio label,
-.stApp .stCheckbox label,
-.stApp .stSelectbox label,
-.stApp .stMultiSelect label,
-.stApp .stSlider label,
-.stApp .stNumberInput label,
-.stApp .stDateInput label,
-.stApp .stTimeInput label,
-.stApp .stTextInput label,
-.stApp .stTextArea label,
-.stApp .stFileUploader label {
-    color: #49454F !important;
-    font-weight: 500 !important;
-}
-.stApp .stRadio div[role="radiogroup"] label span,
-.stApp .stCheckbox label span {
-    color: #1D1B20 !important;
-}
-.stApp .stSelectbox [data-baseweb="select"] span,
-.stApp [data-baseweb="select"] .css-1dimb5e-singleValue {
-    color: #1D1B20 !important;
-}
-[data-testid="stCaptionContainer"], [data-testid="stCaptionContainer"] * {
-    color: #79747E !important;
-}
-.stApp [data-testid="stMarkdownContainer"] p {
-    color: #1D1B20 !important;
-}
-.stApp [data-testid="stMarkdownContainer"] strong {
-    color: #1D1B20 !important;
-}
-[data-testid="stSidebarNavSeparator"] span {
-    color: #79747E !important;
-}
-section[data-testid="stSidebar"] [data-testid="stSidebarNavLink"] span {
-    color: #49454F !important;
-}
-section[data-testid="stSidebar"] [data-testid="stSidebarNavLink"][aria-selected="true"] span,
-section[data-testid="stSidebar"] [data-testid="stSidebarNavLink"][aria-current="page"] span {
-    color: #6750A4 !important;
-    font-weight: 600 !important;
-}
-.stMarkdown h1, [data-testid="stMarkdownContainer"] h1 {
-    font-family: var(--font-display) !important;
-    font-size: 34px !important; font-weight: 700 !important;
-    line-height: 41px !important; letter-spacing: -0.02em;
-    color: #1D1B20 !important;
-}
-.stMarkdown h2, [data-testid="stMarkdownContainer"] h2 {
-    font-family: var(--font-display) !important;
-    font-size: 22px !important; font-weight: 700 !important;
-    line-height: 28px !important; letter-spacing: -0.013em;
-    color: #1D1B20 !important;
-}
-.stMarkdown h3, [data-testid="stMarkdownContainer"] h3 {
-    font-family: var(--font-display) !important;
-    font-size: 20px !important; font-weight: 600 !important;
-    line-height: 24px !important; letter-spacing: -0.01em;
-    color: #1D1B20 !important;
-}
-[data-testid="stSidebarCollapseButton"],
-[data-testid="stExpandSidebarButton"] {
-    background: var(--indigo) !important;
-    color: white !important;
-    border-radius: 12px !important;
-    min-width: 40px !important; min-height: 40px !important;
-    border: none !important;
-    opacity: 1 !important;
-}
-[data-testid="stSidebarCollapseButton"] svg,
-[data-testid="stExpandSidebarButton"] svg {
-    color: white !important;
-    fill: white !important;
-    stroke: white !important;
-}
-[data-testid="stSidebarCollapseButton"]:hover,
-[data-testid="stExpandSidebarButton"]:hover {
-    background: #7E67C1 !important;
-}
-section[data-testid="stSidebar"] {
-    background: #FFFFFF !important;
-    border-right: 1px solid rgba(0,0,0,0.08) !important;
-}
-section[data-testid="stSidebar"] [data-testid="stSidebarNavLink"] {
-    transition: var(--ease-default) !important;
-    border-radius: 12px !important; margin: 2px 8px !important;
-}
-section[data-testid="stSidebar"] [data-testid="stSidebarNavLink"]:hover {
-    background: rgba(103,80,164,0.06) !important;
-}
-section[data-testid="stSidebar"] [data-testid="stSidebarNavLink"][aria-selected="true"],
-section[data-testid="stSidebar"] [data-testid="stSidebarNavLink"][aria-current="page"] {
-    background: #E8DEF8 !important;
-}
-[data-testid="stMetric"] {
-    background: #FFFFFF !important;
-    border: 1px solid rgba(0,0,0,0.08) !important;
-    border-radius: 16px !important; padding: 20px !important;
-    box-shadow: 0 1px 3px rgba(0,0,0,0.06) !important;
-    transition: var(--ease-default) !important;
-}
-[data-testid="stMetric"]:hover {
-    box-shadow: 0 4px 12px rgba(0,0,0,0.10) !important;
-    transform: translateY(-2px) !important;
-}
-[data-testid="stVerticalBlockBorderWrapper"] {
-    background: rgba(255,255,255,0.92) !important;
-    border: 1px solid rgba(0,0,0,0.08) !important;
-    border-radius: 16px !important;
-    box-shadow: 0 1px 3px rgba(0,0,0,0.04) !important;
-    transition: var(--ease-default) !important;
-}
-[data-testid="stVerticalBlockBorderWrapper"]:hover {
-    box-shadow: 0 6px 18px rgba(0,0,0,0.10) !important;
-    transform: translateY(-1px) !important;
-}
-[data-testid="stMetricLabel"] {
-    font-family: var(--font-text) !important;
-    font-size: 11px !important; font-weight: 600 !important;
-    letter-spacing: 0.06em !important; text-transform: uppercase !important;
-    color: #79747E !important;
-}
-[data-testid="stMetricValue"] {
-    font-family: var(--font-display) !important;
-    font-size: 28px !important; font-weight: 700 !important;
-    letter-spacing: -0.016em !important;
-    color: #1D1B20 !important;
-    font-variant-numeric: tabular-nums !important;
-}
-.stButton > button {
-    border-radius: 9999px !important;
-    font-family: var(--font-text) !important;
-    font-size: 15px !important; font-weight: 600 !important;
-    min-height: 44px !important;
-    transition: var(--ease-default) !important;
-    border: 1px solid rgba(0,0,0,0.12) !important;
-    color: #1D1B20 !important;
-}
-.stButton > button:hover {
-    transform: translateY(-1px) scale(1.01) !important;
-    box-shadow: 0 2px 8px rgba(0,0,0,0.12) !important;
-}
-.stButton > button:active { transform: scale(0.97) !important; }
-.stButton > button[kind="primary"] {
-    background: #6750A4 !important;
-    border: none !important;
-    box-shadow: 0 2px 8px rgba(103,80,164,0.30) !important;
-    color: white !important;
-}
-.stButton > button[kind="primary"]:hover {
-    background: #7E67C1 !important;
-    box-shadow: 0 4px 16px rgba(103,80,164,0.35) !important;
-}
-[data-testid="stLinkButton"] > a {
-    border-radius: 9999px !important;
-    min-height: 40px !important;
-    padding: 8px 14px !important;
-    border: 1px solid rgba(26,115,232,0.32) !important;
-    background: linear-gradient(135deg, rgba(26,115,232,0.10), rgba(103,80,164,0.08)) !important;
-    color: #1A73E8 !important;
-    font-weight: 600 !important;
-    transition: var(--ease-default) !important;
-}
-[data-testid="stLinkButton"] > a:hover {
-    border-color: rgba(26,115,232,0.55) !important;
-    box-shadow: 0 4px 14px rgba(26,115,232,0.16) !important;
-    transform: translateY(-1px) !important;
-}
-[data-testid="stDownloadButton"] > button {
-    border-radius: 9999px !important;
-    min-height: 44px !important;
-    font-weight: 700 !important;
-    border: none !important;
-    color: #FFFFFF !important;
-    background: linear-gradient(135deg, #1A73E8, #6750A4) !important;
-    box-shadow: 0 4px 16px rgba(26,115,232,0.25) !important;
-}
-[data-testid="stDownloadButton"] > button:hover {
-    transform: translateY(-1px) !important;
-    box-shadow: 0 6px 20px rgba(26,115,232,0.30) !important;
-}
-.stTextInput > div > div > input,
-.stTextArea > div > div > textarea {
-    background: #FFFFFF !important;
-    border: 1px solid rgba(0,0,0,0.12) !important;
-    border-radius: 12px !important;
-    font-family: var(--font-text) !important;
-    font-size: 16px !important;
-    color: #1D1B20 !important;
-    transition: var(--ease-default) !important;
-    min-height: 44px !important;
-}
-.stTextInput > div > div > input:focus,
-.stTextArea > div > div > textarea:focus,
-[data-testid="stTextInput"] input:focus,
-[data-testid="stTextArea"] textarea:focus {
-    border-color: var(--indigo) !important;
-    box-shadow: 0 0 0 3px rgba(103,80,164,0.15) !important;
-}
-[data-testid="stProgress"] > div > div {
-    background: rgba(0,0,0,0.06) !important;
-    border-radius: 9999px !important; height: 8px !important;
-}
-[data-testid="stProgress"] > div > div > div {
-    background: linear-gradient(90deg, var(--indigo), #9F84D6) !important;
-    border-radius: 9999px !important;
-    position: relative; overflow: hidden;
-}
-[data-testid="stProgress"] > div > div > div::after {
-    content:''; position:absolute; inset:0;
-    background: linear-gradient(90deg, transparent, rgba(255,255,255,0.3), transparent);
-    animation: anim-shimmer 2.5s ease-in-out infinite;
-}
-.stTabs [data-baseweb="tab-list"] {
-    background: #FFFFFF !important;
-    border-radius: 12px !important; padding: 4px !important;
-    gap: 2px !important;
-    border: 1px solid rgba(0,0,0,0.08) !important;
-    box-shadow: 0 1px 3px rgba(0,0,0,0.04) !important;
-}
-.stTabs [data-baseweb="tab"] {
-    border-radius: 8px !important;
-    font-family: var(--font-text) !important;
-    font-size: 13px !important; font-weight: 600 !important;
-    color: #79747E !important;
-    transition: var(--ease-default) !important;
-}
-.stTabs [aria-selected="true"] {
-    background: #E8DEF8 !important;
-    color: #6750A4 !important;
-    border-bottom-color: transparent !important;
-}
-[data-testid="stForm"] {
-    background: #FFFFFF !important;
-    border: 1px solid rgba(0,0,0,0.08) !important;
-    border-radius: 16px !important; padding: 20px !important;
-    box-shadow: 0 1px 3px rgba(0,0,0,0.04) !important;
-}
-[data-testid="stExpander"] {
-    background: #FFFFFF !important;
-    border: 1px solid rgba(0,0,0,0.08) !important;
-    border-radius: 16px !important; overflow: hidden;
-    box-shadow: 0 1px 3px rgba(0,0,0,0.04) !important;
-}
-[data-testid="stExpander"]:hover { border-color: rgba(0,0,0,0.15) !important; }
-[data-testid="stExpander"] summary { font-weight: 600; padding: 12px 16px; color: #1D1B20; }
-[data-testid="stAlert"] { border-radius: 12px !important; }
-.stSlider [role="slider"] { transition: var(--ease-default) !important; }
-.stSlider [role="slider"]:hover {
-    transform: scale(1.12) !important;
-    box-shadow: 0 0 12px rgba(103,80,164,0.25) !important;
-}
-[data-testid="stDivider"], hr {
-    border: none !important; height: 1px !important;
-    background: rgba(0,0,0,0.08) !important; margin: 24px 0 !important;
-}
-[data-testid="stPlotlyChart"] {
-    background: #FFFFFF !important;
-    border: 1px solid rgba(0,0,0,0.08) !important;
-    border-radius: 16px !important; overflow: hidden !important;
-    padding: 8px !important;
-    box-shadow: 0 1px 3px rgba(0,0,0,0.04) !important;
-}
-::-webkit-scrollbar { width:6px; height:6px; }
-::-webkit-scrollbar-track { background:transparent; }
-::-webkit-scrollbar-thumb { background:rgba(0,0,0,0.12); border-radius:9999px; }
-::-webkit-scrollbar-thumb:hover { background:rgba(0,0,0,0.20); }
-* { scrollbar-width:thin; scrollbar-color:rgba(0,0,0,0.12) transparent; }
-@keyframes anim-fade-up {
-    from { opacity:0; transform:translateY(12px); }
-    to { opacity:1; transform:translateY(0); }
-}
-@keyframes anim-shimmer {
-    from { transform: translateX(-100%); }
-    to { transform: translateX(200%); }
-}
-@keyframes anim-orb-drift {
-    from { transform: translate(0,0) scale(1); }
-    to { transform: translate(30px,20px) scale(1.1); }
-}
-[data-testid="stHorizontalBlock"] > div:nth-child(1) { animation: anim-fade-up 0.4s cubic-bezier(0.34,1.56,0.64,1) both; animation-delay:0.05s; }
-[data-testid="stHorizontalBlock"] > div:nth-child(2) { animation: anim-fade-up 0.4s cubic-bezier(0.34,1.56,0.64,1) both; animation-delay:0.10s; }
-[data-testid="stHorizontalBlock"] > div:nth-child(3) { animation: anim-fade-up 0.4s cubic-bezier(0.34,1.56,0.64,1) both; animation-delay:0.15s; }
-[data-testid="stHorizontalBlock"] > div:nth-child(4) { animation: anim-fade-up 0.4s cubic-bezier(0.34,1.56,0.64,1) both; animation-delay:0.20s; }
-[data-testid="stHorizontalBlock"] > div:nth-child(5) { animation: anim-fade-up 0.4s cubic-bezier(0.34,1.56,0.64,1) both; animation-delay:0.25s; }
-@media (max-width: 768px) {
-    section.main .block-container { padding-top:16px; padding-left:12px; padding-right:12px; }
-    .stTabs [data-baseweb="tab"] { font-size:11px !important; padding:6px 8px !important; }
-}
-</style>""", unsafe_allow_html=True)
+    st.markdown(_THEME_HTML, unsafe_allow_html=True)
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -422,170 +132,299 @@ section[data-testid="stSidebar"] [data-testid="stSidebarNavLink"][aria-current="
 
 A = APPLE
 
+# Module-level names for the tokens the helpers below interpolate, so the
+# templates and render paths skip the APPLE dict lookup.
+_FONT_DISPLAY = A["font_display"]
+_FONT_TEXT = A["font_text"]
+_LABEL_PRIMARY = A["label_primary"]
+_LABEL_SECONDARY = A["label_secondary"]
+_LABEL_TERTIARY = A["label_tertiary"]
+_RADIUS_LG = A["radius_lg"]
+_RADIUS_XL = A["radius_xl"]
+_RADIUS_2XL = A["radius_2xl"]
+_HERO_GRADIENT = A["hero_gradient"]
+_GREEN = A["green"]
+
+
+class HeroStat(NamedTuple):
+    """One stat card for ``render_hero_stats``; field order matches the card."""
+
+    icon: str = ""
+    value: Any = ""
+    label: str = ""
+    color: str = _GREEN
+    delta: Any = None
+
+# Card templates with theme tokens baked in at import; only the per-call
+# fields remain as str.format placeholders.
+_HERO_BANNER_SUB_TMPL = (
+    f'<div style="font-family:{_FONT_TEXT};font-size:15px;'
+    'line-height:20px;color:#49454F;font-style:italic;'
+    'max-width:600px">{subtitle}</div>'
+)
+
+_HERO_BANNER_TMPL = (
+    f'<div style="background:{_HERO_GRADIENT};border-radius:{_RADIUS_2XL};'
+    'padding:32px;position:relative;overflow:hidden;margin-bottom:24px;contain:paint;'
+    'box-shadow:0 2px 8px rgba(103,80,164,0.12)">'
+    '<div style="position:absolute;top:-60px;left:-60px;width:280px;height:280px;'
+    'background:radial-gradient(circle,rgba(103,80,164,0.20) 0%,transparent 70%);'
+    'pointer-events:none;border-radius:50%;'
+    'animation:anim-orb-drift 8s ease-in-out infinite alternate;will-change:transform"></div>'
+    '<div style="position:absolute;bottom:-70px;right:-30px;width:320px;height:320px;'
+    'background:radial-gradient(circle,rgba(26,115,232,0.15) 0%,transparent 70%);'
+    'pointer-events:none;border-radius:50%;'
+    'animation:anim-orb-drift 10s ease-in-out infinite alternate-reverse;will-change:transform"></div>'
+    '<div style="position:relative;z-index:1">'
+    f'<div style="font-family:{_FONT_DISPLAY};font-size:28px;line-height:34px;'
+    'font-weight:700;color:#1D1B20;margin-bottom:8px;'
+    'letter-spacing:-0.016em">{title}</div>'
+    '{sub}'
+    '</div>'
+    '</div>'
+)
+
+# Hero stat card; its look lives in the .lm-hero-* rules of apple_theme.css
+# and its accent in a shared .lm-accent-* class, so only the per-card fields
+# travel with each card.
+_HERO_STAT_TMPL = (
+    '<div class="lm-hero-card {accent}" style="--i:{index}">'
+    '<div class="lm-hero-body">'
+    '<div class="lm-hero-icon">{icon}</div>'
+    '<div class="lm-hero-value">{value}</div>'
+    '<div class="lm-hero-label">{label}</div>'
+    '{delta_html}'
+    '</div>'
+    '</div>'
+)
+
+# Delta line under a hero stat: (modifier class, arrow) by leading sign;
+# colours and spacing live in the .lm-hero-delta rules of apple_theme.css.
+_DELTA_TMPL = '<div class="lm-hero-delta {cls}">{arrow}{d}</div>'
+_DELTA_MAP = {
+    "+": ("lm-delta-up", "&#9650; "),
+    "-": ("lm-delta-down", "&#9660; "),
+}
+_DELTA_FLAT = ("lm-delta-flat", "")
+
+_GLASS_CARD_TMPL = (
+    '<div style="background:#FFFFFF;'
+    'border:1px solid rgba(0,0,0,0.08);'
+    f'border-radius:{_RADIUS_XL};padding:20px;'
+    'box-shadow:0 1px 3px rgba(0,0,0,0.06);'
+    'position:relative;overflow:hidden;margin-bottom:16px">'
+    '<div style="position:absolute;bottom:-40px;right:-20px;'
+    'width:120px;height:120px;border-radius:50%;pointer-events:none;'
+    'background:radial-gradient(circle,{color}10 0%,transparent 70%)"></div>'
+    '<div style="position:relative;z-index:1">'
+    '<div style="font-size:11px;font-weight:600;text-transform:uppercase;'
+    'letter-spacing:0.06em;margin-bottom:8px;color:{color}">{icon} {title}</div>'
+    '<div style="font-size:15px;line-height:1.5;'
+    f'color:{_LABEL_SECONDARY}">{{content}}</div>'
+    '</div>'
+    '</div>'
+)
+
+_SECTION_SUB_TMPL = (
+    '<div style="font-size:13px;line-height:18px;'
+    f'color:{_LABEL_TERTIARY};margin-top:4px">{{subtitle}}</div>'
+)
+
+_SECTION_HEADER_TMPL = (
+    '<div style="margin-bottom:16px;margin-top:8px">'
+    f'<div style="font-family:{_FONT_DISPLAY};font-size:20px;'
+    f'line-height:24px;font-weight:600;color:{_LABEL_PRIMARY};'
+    'letter-spacing:-0.01em">{title}</div>'
+    '{sub}'
+    '</div>'
+)
+
+_PILLAR_TMPL = (
+    '<div style="background:#FFFFFF;'
+    'border:1px solid rgba(0,0,0,0.08);'
+    f'border-radius:{_RADIUS_LG};padding:12px;'
+    'box-shadow:0 1px 3px rgba(0,0,0,0.04);'
+    'text-align:center;min-width:72px">'
+    '<div style="font-size:1.5rem">{emoji}</div>'
+    '<div style="font-size:11px;font-weight:600;text-transform:uppercase;'
+    f'letter-spacing:0.06em;color:{_LABEL_TERTIARY};'
+    'margin-top:4px">{name}</div>'
+    '</div>'
+)
+
+_PILLAR_ROW_TMPL = (
+    '<div style="display:flex;justify-content:center;'
+    'gap:16px;flex-wrap:wrap;margin-bottom:32px">'
+    '{cards}'
+    '</div>'
+)
+
+# (emoji entity, label) for the six ACLM pillars.
+_PILLARS = (
+    ("&#127823;", "Nutrition"),
+    ("&#127939;", "Activity"),
+    ("&#128564;", "Sleep"),
+    ("&#129495;", "Stress"),
+    ("&#129309;", "Social"),
+    ("&#128170;", "Clean"),
+)
+
+
+def _hero_banner_html(title: str, subtitle: str) -> str:
+    """Return the hero banner HTML."""
+    sub = _HERO_BANNER_SUB_TMPL.format(subtitle=subtitle) if subtitle else ""
+    return _HERO_BANNER_TMPL.format(title=title, sub=sub)
+
 
 def render_hero_banner(title: str, subtitle: str = "") -> None:
     """Render a gradient hero banner with subtle decorative orbs."""
-    sub = ""
-    if subtitle:
-        sub = (
-            f'<div style="font-family:{A["font_text"]};font-size:15px;'
-            f'line-height:20px;color:#49454F;font-style:italic;'
-            f'max-width:600px">{subtitle}</div>'
-        )
-    html = (
-        f'<div style="background:{A["hero_gradient"]};border-radius:{A["radius_2xl"]};'
-        f'padding:32px;position:relative;overflow:hidden;margin-bottom:24px;'
-        f'box-shadow:0 2px 8px rgba(103,80,164,0.12)">'
-        f'<div style="position:absolute;top:-60px;left:-60px;width:280px;height:280px;'
-        f'background:radial-gradient(circle,rgba(103,80,164,0.20) 0%,transparent 70%);'
-        f'pointer-events:none;border-radius:50%;'
-        f'animation:anim-orb-drift 8s ease-in-out infinite alternate"></div>'
-        f'<div style="position:absolute;bottom:-70px;right:-30px;width:320px;height:320px;'
-        f'background:radial-gradient(circle,rgba(26,115,232,0.15) 0%,transparent 70%);'
-        f'pointer-events:none;border-radius:50%;'
-        f'animation:anim-orb-drift 10s ease-in-out infinite alternate-reverse"></div>'
-        f'<div style="position:relative;z-index:1">'
-        f'<div style="font-family:{A["font_display"]};font-size:28px;line-height:34px;'
-        f'font-weight:700;color:#1D1B20;margin-bottom:8px;'
-        f'letter-spacing:-0.016em">{title}</div>'
-        f'{sub}'
-        f'</div>'
+    st.markdown(_hero_banner_html(title, subtitle), unsafe_allow_html=True)
+
+
+# Stat labels are a small fixed vocabulary; keep their escaped form across
+# card-cache misses, which usually come from a changed value alone.
+_escape_label = lru_cache(maxsize=1024)(escape_html)
+
+
+@lru_cache(maxsize=256, typed=True)
+def _hero_card_html(
+    icon: str, value: Any, label: str, color: str, delta: Any, index: int = 0,
+) -> str:
+    """Return one hero stat card's HTML; ``index`` drives the entry stagger.
+
+    Value, label and delta are escaped; ``icon`` may carry an HTML entity
+    and is inserted as-is. Memoized per field tuple (``typed`` so ``1`` and
+    ``1.0`` stay distinct) since dashboards re-render the same cards on
+    every rerun.
+    """
+    d = escape_html(delta)
+    delta_html = ""
+    if d:
+        cls, arrow = _DELTA_MAP.get(d[:1], _DELTA_FLAT)
+        delta_html = _DELTA_TMPL.format(cls=cls, arrow=arrow, d=d)
+    return _HERO_STAT_TMPL.format(
+        accent=_accent_class(color), index=index, icon=icon, value=escape_html(value),
+        label=_escape_label(label), delta_html=delta_html,
+    )
+
+
+@lru_cache(maxsize=64)
+def _accent_class(color: str) -> str:
+    """Return the stable ``lm-accent-*`` class name for an accent colour."""
+    return "lm-accent-" + hashlib.blake2s(color.encode(), digest_size=4).hexdigest()
+
+
+def _hex_to_rgba(color: str, alpha: float) -> str | None:
+    """Return ``rgba(...)`` for a ``#rgb``/``#rrggbb`` colour, else None."""
+    h = color.lstrip("#")
+    if len(h) == 3:
+        h = "".join(c * 2 for c in h)
+    if not color.startswith("#") or len(h) != 6:
+        return None
+    try:
+        r, g, b = int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16)
+    except ValueError:
+        return None
+    return f"rgba({r},{g},{b},{alpha})"
+
+
+@lru_cache(maxsize=64)
+def _accent_rule(color: str) -> str:
+    """Return the ``.lm-accent-*`` rule setting a card's accent and glow.
+
+    The glow is the accent at 7% opacity (the old ``{color}12`` hex alpha),
+    resolved here so the browser never evaluates ``color-mix()``; non-hex
+    colours fall back to it.
+    """
+    glow = _hex_to_rgba(color, 0.07) or f"color-mix(in srgb,{color} 7%,transparent)"
+    return f".{_accent_class(color)}{{--card-accent:{color};--card-glow:{glow}}}"
+
+
+def _as_hero_stat(stat) -> HeroStat:
+    """Normalise a HeroStat or dict, with value/delta already as text.
+
+    Stringifying up front is what escaping would do anyway, and keeps the
+    grid cache key exact (``(1,) == (1.0,)`` as tuples).
+    """
+    stat = stat if isinstance(stat, HeroStat) else HeroStat(**stat)
+    value, delta = stat.value, stat.delta
+    return stat._replace(
+        value="" if value is None else str(value),
+        delta=None if delta is None else str(delta),
+    )
+
+
+def _hero_stats_html(stats: list) -> str:
+    """Return the accent rules plus stat grid HTML, or "" for no stats."""
+    if not stats:
+        return ""
+    return _hero_grid_html(tuple(map(_as_hero_stat, stats)))
+
+
+@lru_cache(maxsize=128)
+def _hero_grid_html(stats: tuple) -> str:
+    """Return the grid HTML for a tuple of HeroStats; memoized per payload."""
+    accents = "".join(_accent_rule(color) for color in dict.fromkeys(s.color for s in stats))
+    # Transpose the tuples into per-field columns so map() feeds the
+    # memoized builder positionally, with the card index as the last field.
+    cards = "".join(map(_hero_card_html, *zip(*stats), range(len(stats))))
+    return (
+        f'<style>{accents}</style>'
+        f'<div class="lm-hero-wrap">'
+        f'<div class="lm-hero-grid" style="--lm-cols:{min(len(stats), 4)}">{cards}</div>'
         f'</div>'
     )
-    st.markdown(html, unsafe_allow_html=True)
 
 
 def render_hero_stats(stats: list) -> None:
-    """Render Material-style stat cards."""
-    if not stats:
-        return
-    max_cols = 4
-    for row_start in range(0, len(stats), max_cols):
-        row_stats = stats[row_start: row_start + max_cols]
-        cols = st.columns(len(row_stats))
-        for i, col in enumerate(cols):
-            with col:
-                s = row_stats[i]
-                icon = s.get("icon", "")
-                value = s.get("value", "")
-                label = s.get("label", "")
-                color = s.get("color", A["green"])
-                delta = s.get("delta")
-
-                delta_html = ""
-                if delta is not None and str(delta) != "":
-                    d = str(delta)
-                    if d.startswith("+"):
-                        delta_html = (
-                            f'<div style="font-size:13px;font-weight:600;'
-                            f'margin-top:8px;color:{A["green"]}">&#9650; {d}</div>'
-                        )
-                    elif d.startswith("-"):
-                        delta_html = (
-                            f'<div style="font-size:13px;font-weight:600;'
-                            f'margin-top:8px;color:{A["red"]}">&#9660; {d}</div>'
-                        )
-                    else:
-                        delta_html = (
-                            f'<div style="font-size:13px;margin-top:8px;'
-                            f'color:{A["label_tertiary"]}">{d}</div>'
-                        )
-
-                html = (
-                    f'<div style="background:#FFFFFF;'
-                    f'border:1px solid rgba(0,0,0,0.08);'
-                    f'border-left:3px solid {color};'
-                    f'border-radius:{A["radius_xl"]};padding:20px;'
-                    f'box-shadow:0 1px 3px rgba(0,0,0,0.06);'
-                    f'position:relative;overflow:hidden;margin-bottom:12px">'
-                    f'<div style="position:absolute;top:-30px;right:-20px;'
-                    f'width:120px;height:120px;border-radius:50%;pointer-events:none;'
-                    f'background:radial-gradient(circle,{color}12 0%,transparent 70%)"></div>'
-                    f'<div style="position:relative;z-index:1">'
-                    f'<div style="font-size:22px;line-height:1;margin-bottom:8px">{icon}</div>'
-                    f'<div style="font-family:{A["font_display"]};font-size:28px;'
-                    f'font-weight:700;color:{A["label_primary"]};'
-                    f'font-variant-numeric:tabular-nums;line-height:1;'
-                    f'letter-spacing:-0.016em">{value}</div>'
-                    f'<div style="font-size:11px;font-weight:600;text-transform:uppercase;'
-                    f'letter-spacing:0.06em;color:{A["label_tertiary"]};'
-                    f'margin-top:8px">{label}</div>'
-                    f'{delta_html}'
-                    f'</div>'
-                    f'</div>'
-                )
-                st.markdown(html, unsafe_allow_html=True)
+    """Render Material-style stat cards as one grid (at most 4 per row).
+
+    ``stats`` holds ``HeroStat`` tuples; plain dicts with the same keys are
+    still accepted. Each distinct accent colour gets one ``.lm-accent-*``
+    rule, shared by every card that uses it.
+    """
+    if stats:
+        st.markdown(_hero_stats_html(stats), unsafe_allow_html=True)
+
+
+def render_page_header(title: str, subtitle: str = "", stats: list | None = None) -> None:
+    """Render the hero banner and, optionally, its stat grid as one element.
+
+    Same output as ``render_hero_banner`` followed by ``render_hero_stats``,
+    but sent to the browser as a single markdown delta.
+    """
+    st.markdown(
+        _hero_banner_html(title, subtitle) + _hero_stats_html(stats),
+        unsafe_allow_html=True,
+    )
+
+
+@lru_cache(maxsize=256)
+def _glass_card_html(title: str, content: str, color: str, icon: str) -> str:
+    """Return glass-card HTML; memoized since most cards are static copy."""
+    return _GLASS_CARD_TMPL.format(title=title, content=content, color=color, icon=icon)
 
 
 def render_glass_card(title: str, content: str, color: str = "#6750A4", icon: str = "") -> None:
     """Render a card with accent color."""
-    html = (
-        f'<div style="background:#FFFFFF;'
-        f'border:1px solid rgba(0,0,0,0.08);'
-        f'border-radius:{A["radius_xl"]};padding:20px;'
-        f'box-shadow:0 1px 3px rgba(0,0,0,0.06);'
-        f'position:relative;overflow:hidden;margin-bottom:16px">'
-        f'<div style="position:absolute;bottom:-40px;right:-20px;'
-        f'width:120px;height:120px;border-radius:50%;pointer-events:none;'
-        f'background:radial-gradient(circle,{color}10 0%,transparent 70%)"></div>'
-        f'<div style="position:relative;z-index:1">'
-        f'<div style="font-size:11px;font-weight:600;text-transform:uppercase;'
-        f'letter-spacing:0.06em;margin-bottom:8px;color:{color}">{icon} {title}</div>'
-        f'<div style="font-size:15px;line-height:1.5;'
-        f'color:{A["label_secondary"]}">{content}</div>'
-        f'</div>'
-        f'</div>'
-    )
-    st.markdown(html, unsafe_allow_html=True)
+    st.markdown(_glass_card_html(title, content, color, icon), unsafe_allow_html=True)
+
+
+@lru_cache(maxsize=256)
+def _section_header_html(title: str, subtitle: str) -> str:
+    """Return section-header HTML; headers repeat verbatim across reruns."""
+    sub = _SECTION_SUB_TMPL.format(subtitle=subtitle) if subtitle else ""
+    return _SECTION_HEADER_TMPL.format(title=title, sub=sub)
 
 
 def render_section_header(title: str, subtitle: str = "") -> None:
     """Render a section header with Material typography."""
-    sub = ""
-    if subtitle:
-        sub = (
-            f'<div style="font-size:13px;line-height:18px;'
-            f'color:{A["label_tertiary"]};margin-top:4px">{subtitle}</div>'
-        )
-    html = (
-        f'<div style="margin-bottom:16px;margin-top:8px">'
-        f'<div style="font-family:{A["font_display"]};font-size:20px;'
-        f'line-height:24px;font-weight:600;color:{A["label_primary"]};'
-        f'letter-spacing:-0.01em">{title}</div>'
-        f'{sub}'
-        f'</div>'
-    )
-    st.markdown(html, unsafe_allow_html=True)
+    st.markdown(_section_header_html(title, subtitle), unsafe_allow_html=True)
 
 
 def render_pillar_icons() -> None:
     """Render the 6 ACLM pillar icons in a horizontal flex row."""
-    pillars = [
-        ("&#127823;", "Nutrition"),
-        ("&#127939;", "Activity"),
-        ("&#128564;", "Sleep"),
-        ("&#129495;", "Stress"),
-        ("&#129309;", "Social"),
-        ("&#128170;", "Clean"),
-    ]
-    cards = ""
-    for emoji, name in pillars:
-        cards += (
-            f'<div style="background:#FFFFFF;'
-            f'border:1px solid rgba(0,0,0,0.08);'
-            f'border-radius:{A["radius_lg"]};padding:12px;'
-            f'box-shadow:0 1px 3px rgba(0,0,0,0.04);'
-            f'text-align:center;min-width:72px">'
-            f'<div style="font-size:1.5rem">{emoji}</div>'
-            f'<div style="font-size:11px;font-weight:600;text-transform:uppercase;'
-            f'letter-spacing:0.06em;color:{A["label_tertiary"]};'
-            f'margin-top:4px">{name}</div>'
-            f'</div>'
-        )
-    html = (
-        f'<div style="display:flex;justify-content:center;'
-        f'gap:16px;flex-wrap:wrap;margin-bottom:32px">'
-        f'{cards}'
-        f'</div>'
+    cards = "".join(
+        _PILLAR_TMPL.format(emoji=emoji, name=name) for emoji, name in _PILLARS
     )
-    st.markdown(html, unsafe_allow_html=True)
+    st.markdown(_PILLAR_ROW_TMPL.format(cards=cards), unsafe_allow_html=True)
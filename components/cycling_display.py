@@ -1,41 +1,105 @@
 """Display components for the Cycling Training prescription page."""
 
 from __future__ import annotations
+from functools import lru_cache
 import streamlit as st
 import plotly.graph_objects as go
 from datetime import date, timedelta
 from components.custom_theme import APPLE
-from config.cycling_data import POWER_ZONES, WORKOUT_TYPES, DIFFICULTY_SURVEY_OPTIONS
+from config.cycling_data import (
+    POWER_ZONES,
+    WORKOUT_TYPES,
+    DIFFICULTY_SURVEY_OPTIONS,
+    WORKOUT_LIBRARY_BY_ID,
+)
 
 A = APPLE
 
+# Theme tokens bound once at import; the HTML builders below use these names.
+_BG_ELEVATED = A["bg_elevated"]
+_SEPARATOR = A["separator"]
+_LABEL_TERTIARY = A["label_tertiary"]
+_RADIUS_XL = A["radius_xl"]
+_BLUE = A["blue"]
+_LABEL_PRIMARY = A["label_primary"]
+_LABEL_SECONDARY = A["label_secondary"]
+_RADIUS_LG = A["radius_lg"]
+_ORANGE = A["orange"]
+_GREEN = A["green"]
+_CHART_BG = A["chart_bg"]
+_FONT_TEXT = A["font_text"]
+_CHART_TEXT = A["chart_text"]
+_CHART_GRID = A["chart_grid"]
+_RADIUS_SM = A["radius_sm"]
+_RADIUS_MD = A["radius_md"]
+_LABEL_QUATERNARY = A["label_quaternary"]
+_RED = A["red"]
+_YELLOW = A["yellow"]
+
 
 # ── Zone Color Helper ──────────────────────────────────────────────────────
 
+# Zone color indexed by integer percent of FTP, filled once at import so the
+# per-interval lookup is a list index. Percents outside every zone (or past
+# the end of the table) fall back to the recovery grey.
+_ZONE_FALLBACK_COLOR = "#9E9E9E"
+_ZONE_COLOR_BY_PCT = [_ZONE_FALLBACK_COLOR] * (
+    max(z["max_pct"] for z in POWER_ZONES.values()) + 1
+)
+for _zone in reversed(POWER_ZONES.values()):
+    _ZONE_COLOR_BY_PCT[_zone["min_pct"]:_zone["max_pct"] + 1] = (
+        [_zone["color"]] * (_zone["max_pct"] - _zone["min_pct"] + 1)
+    )
+del _zone
+
+
 def _pct_to_zone_color(power_pct: float) -> str:
     """Map a power fraction (e.g. 0.92) to the corresponding zone color."""
-    pct_int = int(power_pct * 100)
-    for zone in POWER_ZONES.values():
-        if zone["min_pct"] <= pct_int <= zone["max_pct"]:
-            return zone["color"]
-    return "#9E9E9E"
+    idx = int(power_pct * 100)
+    if 0 <= idx < len(_ZONE_COLOR_BY_PCT):
+        return _ZONE_COLOR_BY_PCT[idx]
+    return _ZONE_FALLBACK_COLOR
 
 
 # ── FTP Card ───────────────────────────────────────────────────────────────
 
+# Placeholder shown before an FTP is entered; fully static.
+_FTP_EMPTY_HTML = (
+    f'<div style="background:{_BG_ELEVATED};border:1px solid {_SEPARATOR};'
+    f'border-left:4px solid {_LABEL_TERTIARY};border-radius:{_RADIUS_XL};'
+    f'padding:20px;text-align:center">'
+    f'<div style="font-size:13px;color:{_LABEL_TERTIARY}">FTP not set</div>'
+    f'<div style="font-size:11px;color:{_LABEL_TERTIARY};margin-top:4px">'
+    f'Go to Settings to enter your FTP</div>'
+    f'</div>'
+)
+
+# FTP card with the theme baked in; ftp, athlete type and the tested/W/kg
+# line are filled per call.
+_FTP_CARD_TMPL = (
+    f'<div style="background:{_BG_ELEVATED};border:1px solid {_SEPARATOR};'
+    f'border-left:4px solid {_BLUE};border-radius:{_RADIUS_XL};'
+    f'padding:20px;box-shadow:0 1px 3px rgba(0,0,0,0.06)">'
+    f'<div style="font-size:11px;font-weight:600;text-transform:uppercase;'
+    f'letter-spacing:0.06em;color:{_BLUE};margin-bottom:6px">'
+    'Functional Threshold Power</div>'
+    f'<div style="font-size:40px;font-weight:800;color:{_LABEL_PRIMARY};'
+    'line-height:1;margin-bottom:4px">{ftp}<span style="font-size:16px;'
+    f'font-weight:400;color:{_LABEL_SECONDARY}"> W</span></div>'
+    f'<div style="font-size:12px;color:{_LABEL_SECONDARY}">'
+    f'<span style="background:{_BLUE}15;color:{_BLUE};padding:2px 8px;'
+    'border-radius:20px;font-weight:600;font-size:11px">{athlete}</span>'
+    f'<span style="color:{_LABEL_TERTIARY};margin-left:8px">'
+    '{meta}</span>'
+    '</div>'
+    '</div>'
+)
+
+
 def render_ftp_card(profile: dict | None) -> None:
     """Render a prominent FTP display card."""
     if not profile:
-        html = (
-            f'<div style="background:{A["bg_elevated"]};border:1px solid {A["separator"]};'
-            f'border-left:4px solid {A["label_tertiary"]};border-radius:{A["radius_xl"]};'
-            f'padding:20px;text-align:center">'
-            f'<div style="font-size:13px;color:{A["label_tertiary"]}">FTP not set</div>'
-            f'<div style="font-size:11px;color:{A["label_tertiary"]};margin-top:4px">'
-            f'Go to Settings to enter your FTP</div>'
-            f'</div>'
-        )
-        st.markdown(html, unsafe_allow_html=True)
+        st.markdown(_FTP_EMPTY_HTML, unsafe_allow_html=True)
         return
 
     ftp = profile.get("ftp_watts", 200)
@@ -45,25 +109,9 @@ def render_ftp_card(profile: dict | None) -> None:
     if profile.get("weight_kg"):
         wkg_val = ftp / profile["weight_kg"]
         wkg = f" &middot; {wkg_val:.2f} W/kg"
+    meta = ("Tested " + tested if tested else "Enter FTP in Settings") + wkg
 
-    html = (
-        f'<div style="background:{A["bg_elevated"]};border:1px solid {A["separator"]};'
-        f'border-left:4px solid {A["blue"]};border-radius:{A["radius_xl"]};'
-        f'padding:20px;box-shadow:0 1px 3px rgba(0,0,0,0.06)">'
-        f'<div style="font-size:11px;font-weight:600;text-transform:uppercase;'
-        f'letter-spacing:0.06em;color:{A["blue"]};margin-bottom:6px">'
-        f'Functional Threshold Power</div>'
-        f'<div style="font-size:40px;font-weight:800;color:{A["label_primary"]};'
-        f'line-height:1;margin-bottom:4px">{ftp}<span style="font-size:16px;'
-        f'font-weight:400;color:{A["label_secondary"]}"> W</span></div>'
-        f'<div style="font-size:12px;color:{A["label_secondary"]}">'
-        f'<span style="background:{A["blue"]}15;color:{A["blue"]};padding:2px 8px;'
-        f'border-radius:20px;font-weight:600;font-size:11px">{athlete}</span>'
-        f'<span style="color:{A["label_tertiary"]};margin-left:8px">'
-        f'{("Tested " + tested) if tested else "Enter FTP in Settings"}{wkg}</span>'
-        f'</div>'
-        f'</div>'
-    )
+    html = _FTP_CARD_TMPL.format(ftp=ftp, athlete=athlete, meta=meta)
     st.markdown(html, unsafe_allow_html=True)
 
 
@@ -71,37 +119,37 @@ def render_ftp_card(profile: dict | None) -> None:
 
 def render_zones_table(zones: dict) -> None:
     """Render a 7-row power zone reference table."""
-    rows = ""
+    rows = []
     for key, zone in zones.items():
         min_w = zone.get("min_watts", 0)
         max_w = zone.get("max_watts", 0)
         color = zone["color"]
         bar_width = min((zone["max_pct"] - zone["min_pct"]) * 1.8, 100)
-        rows += (
+        rows.append(
             f'<div style="display:flex;align-items:center;gap:10px;'
-            f'padding:9px 0;border-bottom:1px solid {A["separator"]}30">'
+            f'padding:9px 0;border-bottom:1px solid {_SEPARATOR}30">'
             f'<div style="min-width:28px;height:20px;background:{color};'
             f'border-radius:4px;display:flex;align-items:center;justify-content:center;'
             f'font-size:10px;font-weight:700;color:#fff">{key.upper()}</div>'
-            f'<div style="flex:1.5;font-size:12px;font-weight:600;color:{A["label_primary"]}">'
+            f'<div style="flex:1.5;font-size:12px;font-weight:600;color:{_LABEL_PRIMARY}">'
             f'{zone["name"]}</div>'
-            f'<div style="flex:1;font-size:12px;color:{A["label_secondary"]};text-align:right">'
+            f'<div style="flex:1;font-size:12px;color:{_LABEL_SECONDARY};text-align:right">'
             f'{min_w}–{max_w} W</div>'
             f'<div style="flex:2;margin-left:8px">'
             f'<div style="background:rgba(0,0,0,0.06);border-radius:999px;height:6px">'
             f'<div style="width:{bar_width:.0f}%;background:{color};height:6px;border-radius:999px"></div>'
             f'</div></div>'
-            f'<div style="flex:3;font-size:11px;color:{A["label_tertiary"]};line-height:14px">'
-            f'{zone["description"][:60]}{"…" if len(zone["description"])>60 else ""}</div>'
+            f'<div style="flex:3;font-size:11px;color:{_LABEL_TERTIARY};line-height:14px">'
+            f'{zone["short_description"]}</div>'
             f'</div>'
         )
     html = (
-        f'<div style="background:{A["bg_elevated"]};border:1px solid {A["separator"]};'
-        f'border-radius:{A["radius_lg"]};padding:16px">'
+        f'<div style="background:{_BG_ELEVATED};border:1px solid {_SEPARATOR};'
+        f'border-radius:{_RADIUS_LG};padding:16px">'
         f'<div style="font-size:11px;font-weight:600;text-transform:uppercase;'
-        f'letter-spacing:0.06em;color:{A["label_tertiary"]};margin-bottom:10px">'
+        f'letter-spacing:0.06em;color:{_LABEL_TERTIARY};margin-bottom:10px">'
         f'Power Zones</div>'
-        f'{rows}'
+        f'{"".join(rows)}'
         f'</div>'
     )
     st.markdown(html, unsafe_allow_html=True)
@@ -109,17 +157,25 @@ def render_zones_table(zones: dict) -> None:
 
 # ── PMC Chart ──────────────────────────────────────────────────────────────
 
-def render_pmc_chart(pmc_data: list[dict]) -> None:
-    """Render the Performance Management Chart (CTL/ATL/TSB + daily TSS)."""
-    if not pmc_data:
-        st.caption("No ride data yet. Log rides to see your PMC chart.")
-        return
-
-    dates = [d["date"] for d in pmc_data]
-    ctl_vals = [d["ctl"] for d in pmc_data]
-    atl_vals = [d["atl"] for d in pmc_data]
-    tsb_vals = [d["tsb"] for d in pmc_data]
-    tss_vals = [d["tss"] for d in pmc_data]
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _build_pmc_figure(pmc_rows: tuple) -> go.Figure:
+    """Build the PMC figure from ``(date, ctl, atl, tsb, tss)`` rows.
+
+    Cached per rows tuple, so reruns from unrelated widgets reuse the
+    figure. ``st.plotly_chart`` serializes without mutating it, which is
+    what makes sharing one instance safe.
+    """
+    # One pass over the rows, tracking the TSS peak for the secondary axis.
+    dates, ctl_vals, atl_vals, tsb_vals, tss_vals = [], [], [], [], []
+    tss_max = 0
+    for date_str, ctl, atl, tsb, tss in pmc_rows:
+        dates.append(date_str)
+        ctl_vals.append(ctl)
+        atl_vals.append(atl)
+        tsb_vals.append(tsb)
+        tss_vals.append(tss)
+        if tss > tss_max:
+            tss_max = tss
 
     fig = go.Figure()
 
@@ -136,7 +192,7 @@ def render_pmc_chart(pmc_data: list[dict]) -> None:
     fig.add_trace(go.Scatter(
         x=dates, y=ctl_vals,
         name="CTL — Fitness",
-        line=dict(color=A["blue"], width=2.5),
+        line=dict(color=_BLUE, width=2.5),
         hovertemplate="%{x}<br>CTL: %{y:.1f}<extra></extra>",
     ))
 
@@ -144,7 +200,7 @@ def render_pmc_chart(pmc_data: list[dict]) -> None:
     fig.add_trace(go.Scatter(
         x=dates, y=atl_vals,
         name="ATL — Fatigue",
-        line=dict(color=A["orange"], width=2, dash="dot"),
+        line=dict(color=_ORANGE, width=2, dash="dot"),
         hovertemplate="%{x}<br>ATL: %{y:.1f}<extra></extra>",
     ))
 
@@ -152,7 +208,7 @@ def render_pmc_chart(pmc_data: list[dict]) -> None:
     fig.add_trace(go.Scatter(
         x=dates, y=tsb_vals,
         name="TSB — Form",
-        line=dict(color=A["green"], width=1.5),
+        line=dict(color=_GREEN, width=1.5),
         fill="tozeroy",
         fillcolor="rgba(30,142,62,0.10)",
         hovertemplate="%{x}<br>TSB: %{y:+.1f}<extra></extra>",
@@ -160,15 +216,15 @@ def render_pmc_chart(pmc_data: list[dict]) -> None:
 
     fig.update_layout(
         height=360,
-        plot_bgcolor=A["chart_bg"],
-        paper_bgcolor=A["chart_bg"],
-        font=dict(family=A["font_text"], color=A["chart_text"], size=11),
+        plot_bgcolor=_CHART_BG,
+        paper_bgcolor=_CHART_BG,
+        font=dict(family=_FONT_TEXT, color=_CHART_TEXT, size=11),
         legend=dict(orientation="h", yanchor="bottom", y=-0.30, xanchor="center", x=0.5),
         margin=dict(t=20, b=70, l=50, r=50),
-        xaxis=dict(gridcolor=A["chart_grid"], showgrid=True),
+        xaxis=dict(gridcolor=_CHART_GRID, showgrid=True),
         yaxis=dict(
             title="CTL / ATL / TSB",
-            gridcolor=A["chart_grid"],
+            gridcolor=_CHART_GRID,
             zeroline=True,
             zerolinecolor="rgba(0,0,0,0.15)",
         ),
@@ -177,15 +233,34 @@ def render_pmc_chart(pmc_data: list[dict]) -> None:
             overlaying="y",
             side="right",
             showgrid=False,
-            range=[0, max(tss_vals) * 4 if any(v > 0 for v in tss_vals) else 100],
+            range=[0, tss_max * 4 if tss_max > 0 else 100],
         ),
         hovermode="x unified",
     )
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
+
+
+def render_pmc_chart(pmc_data: list[dict]) -> None:
+    """Render the Performance Management Chart (CTL/ATL/TSB + daily TSS)."""
+    if not pmc_data:
+        st.caption("No ride data yet. Log rides to see your PMC chart.")
+        return
+
+    pmc_rows = tuple(
+        (d["date"], d["ctl"], d["atl"], d["tsb"], d["tss"]) for d in pmc_data
+    )
+    st.plotly_chart(_build_pmc_figure(pmc_rows), use_container_width=True)
 
 
 # ── Interval Diagram ───────────────────────────────────────────────────────
 
+@lru_cache(maxsize=256)
+def _fmt_mmss(sec: int) -> str:
+    """Format a duration in seconds as ``m:ss`` for interval tooltips."""
+    m, s = divmod(int(sec), 60)
+    return f"{m}:{s:02d}"
+
+
 def render_interval_diagram(intervals: list, ftp_watts: int) -> None:
     """Render a horizontal colour-coded bar showing workout intervals."""
     if not intervals:
@@ -194,17 +269,19 @@ def render_interval_diagram(intervals: list, ftp_watts: int) -> None:
     if total_sec == 0:
         return
 
-    blocks = ""
+    scale = 100.0 / total_sec
+    blocks = []
     for iv in intervals:
         dur = iv.get("duration_sec", 0)
         pct = iv.get("power_pct", 0.55)
         label = iv.get("label", "")
         watts = round(ftp_watts * pct)
-        width = max(dur / total_sec * 100, 0.5)
+        width = dur * scale
+        if width < 0.5:
+            width = 0.5
         color = _pct_to_zone_color(pct)
-        m, s = divmod(dur, 60)
-        tooltip = f"{label} — {int(pct*100)}% FTP ({watts}W) — {m}:{s:02d}"
-        blocks += (
+        tooltip = f"{label} — {int(pct*100)}% FTP ({watts}W) — {_fmt_mmss(dur)}"
+        blocks.append(
             f'<div style="width:{width:.2f}%;height:32px;background:{color};'
             f'display:inline-block;vertical-align:top;'
             f'border-right:1px solid rgba(255,255,255,0.25)" '
@@ -212,11 +289,11 @@ def render_interval_diagram(intervals: list, ftp_watts: int) -> None:
         )
 
     html = (
-        f'<div style="width:100%;border-radius:{A["radius_sm"]};overflow:hidden;'
+        f'<div style="width:100%;border-radius:{_RADIUS_SM};overflow:hidden;'
         f'display:flex;margin:8px 0 2px 0;box-shadow:0 1px 2px rgba(0,0,0,0.08)">'
-        f'{blocks}'
+        f'{"".join(blocks)}'
         f'</div>'
-        f'<div style="font-size:10px;color:{A["label_tertiary"]};margin-bottom:8px">'
+        f'<div style="font-size:10px;color:{_LABEL_TERTIARY};margin-bottom:8px">'
         f'Hover bars for interval details &middot; '
         f'Total: {total_sec//60} min</div>'
     )
@@ -225,32 +302,43 @@ def render_interval_diagram(intervals: list, ftp_watts: int) -> None:
 
 # ── Workout Card ───────────────────────────────────────────────────────────
 
+# Workout card shell; the type color/badge and workout fields vary per call.
+_WORKOUT_CARD_TMPL = (
+    f'<div style="background:{_BG_ELEVATED};border:1px solid {_SEPARATOR};'
+    f'border-top:3px solid {{color}};border-radius:{_RADIUS_LG};'
+    'padding:14px;margin-bottom:4px">'
+    '<div style="display:flex;justify-content:space-between;align-items:flex-start;'
+    'margin-bottom:6px">'
+    f'<div style="font-size:15px;font-weight:700;color:{_LABEL_PRIMARY}">'
+    '{name}</div>'
+    '<span style="font-size:10px;font-weight:600;padding:3px 10px;'
+    'border-radius:20px;background:{color}18;color:{color};white-space:nowrap">'
+    '{icon} {type_label}</span>'
+    '</div>'
+    f'<div style="font-size:11px;color:{_LABEL_TERTIARY};margin-bottom:8px">'
+    '{duration_min} min &middot; '
+    '~{tss_estimate} TSS &middot; '
+    'Level {difficulty_level:.1f} / 10</div>'
+    f'<div style="font-size:12px;color:{_LABEL_SECONDARY};line-height:18px;'
+    'margin-bottom:10px">{description}</div>'
+    '</div>'
+)
+
+
 def render_workout_card(workout: dict, ftp_watts: int) -> None:
     """Render a structured workout card with type badge, stats, and interval diagram."""
     wtype = workout.get("type", "endurance")
     type_info = WORKOUT_TYPES.get(wtype, WORKOUT_TYPES["endurance"])
-    color = type_info["color"]
-    icon = type_info["icon"]
 
-    html = (
-        f'<div style="background:{A["bg_elevated"]};border:1px solid {A["separator"]};'
-        f'border-top:3px solid {color};border-radius:{A["radius_lg"]};'
-        f'padding:14px;margin-bottom:4px">'
-        f'<div style="display:flex;justify-content:space-between;align-items:flex-start;'
-        f'margin-bottom:6px">'
-        f'<div style="font-size:15px;font-weight:700;color:{A["label_primary"]}">'
-        f'{workout.get("name","")}</div>'
-        f'<span style="font-size:10px;font-weight:600;padding:3px 10px;'
-        f'border-radius:20px;background:{color}18;color:{color};white-space:nowrap">'
-        f'{icon} {type_info["label"]}</span>'
-        f'</div>'
-        f'<div style="font-size:11px;color:{A["label_tertiary"]};margin-bottom:8px">'
-        f'{workout.get("duration_min",0)} min &middot; '
-        f'~{workout.get("tss_estimate",0)} TSS &middot; '
-        f'Level {workout.get("difficulty_level",1.0):.1f} / 10</div>'
-        f'<div style="font-size:12px;color:{A["label_secondary"]};line-height:18px;'
-        f'margin-bottom:10px">{workout.get("description","")}</div>'
-        f'</div>'
+    html = _WORKOUT_CARD_TMPL.format(
+        color=type_info["color"],
+        icon=type_info["icon"],
+        type_label=type_info["label"],
+        name=workout.get("name", ""),
+        duration_min=workout.get("duration_min", 0),
+        tss_estimate=workout.get("tss_estimate", 0),
+        difficulty_level=workout.get("difficulty_level", 1.0),
+        description=workout.get("description", ""),
     )
     st.markdown(html, unsafe_allow_html=True)
     render_interval_diagram(workout.get("intervals", []), ftp_watts)
@@ -258,6 +346,51 @@ def render_workout_card(workout: dict, ftp_watts: int) -> None:
 
 # ── Weekly Plan Calendar ───────────────────────────────────────────────────
 
+_DAY_NAMES = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_TODAY_BORDER = f"2px solid {_BLUE}"
+_TODAY_BG = f"{_BLUE}08"
+_DAY_BORDER = f"1px solid {_SEPARATOR}"
+
+# Day cell: the border/background pair, day heading and body vary per day.
+_DAY_CELL_TMPL = (
+    '<div style="border:{border};background:{bg};'
+    f'border-radius:{_RADIUS_MD};padding:8px 6px;text-align:center;'
+    'min-height:80px">'
+    f'<div style="font-size:10px;font-weight:600;color:{_LABEL_SECONDARY}">'
+    '{heading}</div>'
+    '{body}'
+    '</div>'
+)
+_DAY_WORKOUT_TMPL = (
+    '<div style="font-size:9px;font-weight:700;color:{color};'
+    'margin:4px 0;text-transform:uppercase">{type_label}</div>'
+    f'<div style="font-size:10px;color:{_LABEL_TERTIARY}">'
+    '{duration_min} min</div>'
+    '<div style="font-size:12px;color:{status_color}">'
+    '{status_badge}</div>'
+)
+_DAY_REST_HTML = (
+    f'<div style="font-size:11px;color:{_LABEL_QUATERNARY};margin-top:16px">Rest</div>'
+)
+_STATUS_BADGES = {"completed": "&#10003;", "rescheduled": "&#8680;"}
+
+
+def _day_body_html(workout_entry: dict | None) -> str:
+    """Return the inner HTML of one day cell: the workout summary or "Rest"."""
+    if not workout_entry:
+        return _DAY_REST_HTML
+    workout = WORKOUT_LIBRARY_BY_ID.get(workout_entry.get("workout_id", ""), {})
+    type_info = WORKOUT_TYPES.get(workout.get("type", "endurance"), {})
+    status = workout_entry.get("status", "scheduled")
+    return _DAY_WORKOUT_TMPL.format(
+        color=type_info.get("color", _LABEL_TERTIARY),
+        type_label=type_info.get("label", ""),
+        duration_min=workout.get("duration_min", "?"),
+        status_color="#1E8E3E" if status == "completed" else _LABEL_TERTIARY,
+        status_badge=_STATUS_BADGES.get(status, ""),
+    )
+
+
 def render_weekly_plan(week_workouts: list, today: date) -> None:
     """Render a 7-column weekly calendar with workout assignments."""
     # Build a dict keyed by date string
@@ -265,72 +398,40 @@ def render_weekly_plan(week_workouts: list, today: date) -> None:
     for w in week_workouts:
         by_date[w.get("date", "")] = w
 
-    from config.cycling_data import WORKOUT_LIBRARY_BY_ID
     week_start = today - timedelta(days=today.weekday())  # Monday
 
-    cols = st.columns(7)
-    day_names = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-    for i, col in enumerate(cols):
+    cells = []
+    for i in range(7):
         day = week_start + timedelta(days=i)
-        d_str = day.isoformat()
         is_today = day == today
-        workout_entry = by_date.get(d_str)
-
-        with col:
-            border = f"2px solid {A['blue']}" if is_today else f"1px solid {A['separator']}"
-            bg = f"{A['blue']}08" if is_today else A["bg_elevated"]
-
-            if workout_entry:
-                workout = WORKOUT_LIBRARY_BY_ID.get(workout_entry.get("workout_id", ""), {})
-                wtype = workout.get("type", "endurance")
-                type_info = WORKOUT_TYPES.get(wtype, {})
-                color = type_info.get("color", A["label_tertiary"])
-                status = workout_entry.get("status", "scheduled")
-                status_badge = "&#10003;" if status == "completed" else ("&#8680;" if status == "rescheduled" else "")
-                st.markdown(
-                    f'<div style="border:{border};background:{bg};'
-                    f'border-radius:{A["radius_md"]};padding:8px 6px;text-align:center;'
-                    f'min-height:80px">'
-                    f'<div style="font-size:10px;font-weight:600;color:{A["label_secondary"]}">'
-                    f'{"[TODAY] " if is_today else ""}{day_names[i]} {day.day}</div>'
-                    f'<div style="font-size:9px;font-weight:700;color:{color};'
-                    f'margin:4px 0;text-transform:uppercase">{type_info.get("label","")}</div>'
-                    f'<div style="font-size:10px;color:{A["label_tertiary"]}">'
-                    f'{workout.get("duration_min","?")} min</div>'
-                    f'<div style="font-size:12px;color:{"#1E8E3E" if status=="completed" else A["label_tertiary"]}">'
-                    f'{status_badge}</div>'
-                    f'</div>',
-                    unsafe_allow_html=True,
-                )
-            else:
-                st.markdown(
-                    f'<div style="border:{border};background:{bg};'
-                    f'border-radius:{A["radius_md"]};padding:8px 6px;text-align:center;'
-                    f'min-height:80px">'
-                    f'<div style="font-size:10px;font-weight:600;color:{A["label_secondary"]}">'
-                    f'{"[TODAY] " if is_today else ""}{day_names[i]} {day.day}</div>'
-                    f'<div style="font-size:11px;color:{A["label_quaternary"]};margin-top:16px">Rest</div>'
-                    f'</div>',
-                    unsafe_allow_html=True,
-                )
+        cells.append(_DAY_CELL_TMPL.format(
+            border=_TODAY_BORDER if is_today else _DAY_BORDER,
+            bg=_TODAY_BG if is_today else _BG_ELEVATED,
+            heading=f'{"[TODAY] " if is_today else ""}{_DAY_NAMES[i]} {day.day}',
+            body=_day_body_html(by_date.get(day.isoformat())),
+        ))
+    st.markdown(
+        f'<div class="lm-week-grid">{"".join(cells)}</div>',
+        unsafe_allow_html=True,
+    )
 
 
 # ── Progression Levels ─────────────────────────────────────────────────────
 
 def render_progression_levels(levels: dict) -> None:
     """Render horizontal progress bars for each energy system level (1–10)."""
-    html_rows = ""
+    html_rows = []
     for energy_type, level in levels.items():
         type_info = WORKOUT_TYPES.get(energy_type, {})
-        color = type_info.get("color", A["blue"])
+        color = type_info.get("color", _BLUE)
         label = type_info.get("label", energy_type.replace("_", " ").title())
         icon = type_info.get("icon", "&#127947;")
         bar_pct = max((level - 1.0) / 9.0 * 100, 2)
-        html_rows += (
+        html_rows.append(
             f'<div style="margin-bottom:10px">'
             f'<div style="display:flex;justify-content:space-between;align-items:center;'
             f'font-size:12px;margin-bottom:4px">'
-            f'<span style="font-weight:600;color:{A["label_secondary"]}">'
+            f'<span style="font-weight:600;color:{_LABEL_SECONDARY}">'
             f'{icon} {label}</span>'
             f'<span style="font-weight:700;color:{color}">{level:.1f}</span>'
             f'</div>'
@@ -342,14 +443,14 @@ def render_progression_levels(levels: dict) -> None:
         )
 
     html = (
-        f'<div style="background:{A["bg_elevated"]};border:1px solid {A["separator"]};'
-        f'border-radius:{A["radius_lg"]};padding:16px">'
+        f'<div style="background:{_BG_ELEVATED};border:1px solid {_SEPARATOR};'
+        f'border-radius:{_RADIUS_LG};padding:16px">'
         f'<div style="font-size:11px;font-weight:600;text-transform:uppercase;'
-        f'letter-spacing:0.06em;color:{A["label_tertiary"]};margin-bottom:12px">'
+        f'letter-spacing:0.06em;color:{_LABEL_TERTIARY};margin-bottom:12px">'
         f'Progression Levels &nbsp;'
-        f'<span style="font-size:10px;font-weight:400;color:{A["label_tertiary"]}">'
+        f'<span style="font-size:10px;font-weight:400;color:{_LABEL_TERTIARY}">'
         f'1.0 = beginner · 10.0 = elite</span></div>'
-        f'{html_rows}'
+        f'{"".join(html_rows)}'
         f'</div>'
     )
     st.markdown(html, unsafe_allow_html=True)
@@ -357,8 +458,9 @@ def render_progression_levels(levels: dict) -> None:
 
 # ── Ramp Test Guide ────────────────────────────────────────────────────────
 
-def render_ramp_test_guide() -> None:
-    """Render step-by-step FTP Ramp Test protocol."""
+@lru_cache(maxsize=1)
+def _ramp_test_html() -> str:
+    """Return the ramp test protocol card; it has no inputs, so build it once."""
     steps = [
         ("Set up", "Set your trainer to ERG mode (smart trainer) or use a flat resistance setting. Have a fan ready — it will get hot."),
         ("Warm up", "Pedal easy for 10 minutes at 50% of your current FTP. Get your legs spinning smoothly."),
@@ -367,92 +469,114 @@ def render_ramp_test_guide() -> None:
         ("Calculate FTP", "Your new FTP = the highest 1-minute power you fully completed × 0.75."),
         ("Recover", "Spin easy for 10+ minutes. Allow 48 hours of easy training before your next hard session."),
     ]
-    step_html = ""
+    step_html = []
     for i, (title, desc) in enumerate(steps, 1):
-        step_html += (
+        step_html.append(
             f'<div style="display:flex;gap:12px;margin-bottom:12px">'
-            f'<div style="min-width:28px;height:28px;background:{A["blue"]};'
+            f'<div style="min-width:28px;height:28px;background:{_BLUE};'
             f'border-radius:50%;display:flex;align-items:center;justify-content:center;'
             f'font-size:12px;font-weight:700;color:#fff;flex-shrink:0">{i}</div>'
             f'<div>'
-            f'<div style="font-size:13px;font-weight:600;color:{A["label_primary"]};'
+            f'<div style="font-size:13px;font-weight:600;color:{_LABEL_PRIMARY};'
             f'margin-bottom:2px">{title}</div>'
-            f'<div style="font-size:12px;color:{A["label_secondary"]};line-height:18px">{desc}</div>'
+            f'<div style="font-size:12px;color:{_LABEL_SECONDARY};line-height:18px">{desc}</div>'
             f'</div>'
             f'</div>'
         )
     tip_html = (
-        f'<div style="background:{A["blue"]}08;border-left:3px solid {A["blue"]};'
-        f'padding:10px 12px;border-radius:0 {A["radius_sm"]} {A["radius_sm"]} 0;margin-top:4px">'
-        f'<div style="font-size:11px;font-weight:600;color:{A["blue"]};margin-bottom:2px">&#128161; Pro Tip</div>'
-        f'<div style="font-size:11px;color:{A["label_secondary"]};line-height:16px">'
+        f'<div style="background:{_BLUE}08;border-left:3px solid {_BLUE};'
+        f'padding:10px 12px;border-radius:0 {_RADIUS_SM} {_RADIUS_SM} 0;margin-top:4px">'
+        f'<div style="font-size:11px;font-weight:600;color:{_BLUE};margin-bottom:2px">&#128161; Pro Tip</div>'
+        f'<div style="font-size:11px;color:{_LABEL_SECONDARY};line-height:16px">'
         f'Retest every 6–8 weeks or after a significant jump in training load. '
         f'An accurate FTP ensures all your zones are correct — everything depends on it.</div>'
         f'</div>'
     )
-    html = (
-        f'<div style="background:{A["bg_elevated"]};border:1px solid {A["separator"]};'
-        f'border-radius:{A["radius_lg"]};padding:16px">'
-        f'<div style="font-size:14px;font-weight:700;color:{A["label_primary"]};margin-bottom:12px">'
+    return (
+        f'<div style="background:{_BG_ELEVATED};border:1px solid {_SEPARATOR};'
+        f'border-radius:{_RADIUS_LG};padding:16px">'
+        f'<div style="font-size:14px;font-weight:700;color:{_LABEL_PRIMARY};margin-bottom:12px">'
         f'FTP Ramp Test Protocol</div>'
-        f'{step_html}'
+        f'{"".join(step_html)}'
         f'{tip_html}'
         f'</div>'
     )
-    st.markdown(html, unsafe_allow_html=True)
+
+
+def render_ramp_test_guide() -> None:
+    """Render step-by-step FTP Ramp Test protocol."""
+    st.markdown(_ramp_test_html(), unsafe_allow_html=True)
 
 
 # ── Ride Summary Card ──────────────────────────────────────────────────────
 
+# Compact ride row; the theme is baked in and the ride metrics are filled per call.
+_RIDE_CARD_TMPL = (
+    f'<div style="background:{_BG_ELEVATED};border:1px solid {_SEPARATOR};'
+    f'border-radius:{_RADIUS_MD};padding:12px 14px;margin-bottom:8px;'
+    'display:flex;align-items:center;gap:12px">'
+    '<div style="flex:1">'
+    f'<div style="font-size:13px;font-weight:600;color:{_LABEL_PRIMARY}">'
+    '&#128690; {ride_date}</div>'
+    f'<div style="font-size:11px;color:{_LABEL_TERTIARY};margin-top:2px">'
+    '{dur} min{notes}'
+    '</div>'
+    '</div>'
+    '<div style="display:flex;gap:14px;align-items:center">'
+    '<div style="text-align:center">'
+    f'<div style="font-size:15px;font-weight:700;color:{_LABEL_PRIMARY}">'
+    '{avg_power}W</div>'
+    f'<div style="font-size:10px;color:{_LABEL_TERTIARY}">Avg Power</div>'
+    '</div>'
+    '<div style="text-align:center">'
+    '<div style="font-size:15px;font-weight:700;color:{if_color}">'
+    '{if_score:.3f}</div>'
+    f'<div style="font-size:10px;color:{_LABEL_TERTIARY}">IF</div>'
+    '</div>'
+    '<div style="text-align:center">'
+    f'<div style="font-size:15px;font-weight:700;color:{_ORANGE}">'
+    '{tss:.0f}</div>'
+    f'<div style="font-size:10px;color:{_LABEL_TERTIARY}">TSS</div>'
+    '</div>'
+    '{survey_html}'
+    '</div>'
+    '</div>'
+)
+
+
+@lru_cache(maxsize=16)
+def _survey_emoji(survey: int | None) -> str:
+    """Return the emoji for a post-ride difficulty rating, or "" if unrated."""
+    if not survey:
+        return ""
+    option = DIFFICULTY_SURVEY_OPTIONS.get(survey)
+    return option["emoji"] if option else ""
+
+
+# Intensity Factor color bands, highest first; below the last band is green.
+_IF_THRESHOLDS = ((1.0, _RED), (0.90, _ORANGE), (0.75, _YELLOW))
+
+
 def render_ride_summary_card(ride: dict) -> None:
     """Render a compact summary card for a completed ride."""
     avg_power = ride.get("avg_power") or 0
     if_score = ride.get("if_score") or 0
     tss = ride.get("tss") or 0
     dur = ride.get("duration_min", 0)
-    survey = ride.get("difficulty_survey")
-    survey_emoji = DIFFICULTY_SURVEY_OPTIONS.get(survey, {}).get("emoji", "") if survey else ""
-
-    # IF color coding
-    if if_score >= 1.0:
-        if_color = A["red"]
-    elif if_score >= 0.90:
-        if_color = A["orange"]
-    elif if_score >= 0.75:
-        if_color = A["yellow"]
-    else:
-        if_color = A["green"]
-
-    html = (
-        f'<div style="background:{A["bg_elevated"]};border:1px solid {A["separator"]};'
-        f'border-radius:{A["radius_md"]};padding:12px 14px;margin-bottom:8px;'
-        f'display:flex;align-items:center;gap:12px">'
-        f'<div style="flex:1">'
-        f'<div style="font-size:13px;font-weight:600;color:{A["label_primary"]}">'
-        f'&#128690; {ride.get("ride_date","")}</div>'
-        f'<div style="font-size:11px;color:{A["label_tertiary"]};margin-top:2px">'
-        f'{dur} min'
-        f'{(" &middot; " + ride.get("notes","")[:40]) if ride.get("notes") else ""}'
-        f'</div>'
-        f'</div>'
-        f'<div style="display:flex;gap:14px;align-items:center">'
-        f'<div style="text-align:center">'
-        f'<div style="font-size:15px;font-weight:700;color:{A["label_primary"]}">'
-        f'{avg_power}W</div>'
-        f'<div style="font-size:10px;color:{A["label_tertiary"]}">Avg Power</div>'
-        f'</div>'
-        f'<div style="text-align:center">'
-        f'<div style="font-size:15px;font-weight:700;color:{if_color}">'
-        f'{if_score:.3f}</div>'
-        f'<div style="font-size:10px;color:{A["label_tertiary"]}">IF</div>'
-        f'</div>'
-        f'<div style="text-align:center">'
-        f'<div style="font-size:15px;font-weight:700;color:{A["orange"]}">'
-        f'{tss:.0f}</div>'
-        f'<div style="font-size:10px;color:{A["label_tertiary"]}">TSS</div>'
-        f'</div>'
-        f'{("<div style='font-size:18px'>" + survey_emoji + "</div>") if survey_emoji else ""}'
-        f'</div>'
-        f'</div>'
+    survey_emoji = _survey_emoji(ride.get("difficulty_survey"))
+    survey_html = f'<div style="font-size:18px">{survey_emoji}</div>' if survey_emoji else ""
+
+    if_color = next((c for t, c in _IF_THRESHOLDS if if_score >= t), _GREEN)
+    notes = ride.get("notes") or ""
+
+    html = _RIDE_CARD_TMPL.format(
+        ride_date=ride.get("ride_date", ""),
+        dur=dur,
+        notes=f" &middot; {notes[:40]}" if notes else "",
+        avg_power=avg_power,
+        if_color=if_color,
+        if_score=if_score,
+        tss=tss,
+        survey_html=survey_html,
     )
     st.markdown(html, unsafe_allow_html=True)
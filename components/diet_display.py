@@ -1,44 +1,82 @@
 """Diet assessment display components — HEI score circle, diet pattern card, component bars."""
 
+import math
+from functools import lru_cache
+
 import streamlit as st
 from components.custom_theme import APPLE
+from config.diet_data import HEI_COMPONENTS
+from services.diet_service import get_hei_score_zone
 
 A = APPLE
 
+# Theme tokens used by the HEI and diet-pattern cards, resolved at import.
+_BG_TERTIARY = A["bg_tertiary"]
+_LABEL_PRIMARY = A["label_primary"]
+_FONT_DISPLAY = A["font_display"]
+_FONT_TEXT = A["font_text"]
+_LABEL_SECONDARY = A["label_secondary"]
+_LABEL_TERTIARY = A["label_tertiary"]
+_BLUE = A["blue"]
+_LABEL_QUATERNARY = A["label_quaternary"]
+_BG_ELEVATED = A["bg_elevated"]
+_SEPARATOR = A["separator"]
+_RADIUS_LG = A["radius_lg"]
+_FILL_TERTIARY = A["fill_tertiary"]
+
+_HEI_RADIUS = 54
+_HEI_CIRCUMFERENCE = 2 * math.pi * _HEI_RADIUS
+
+# (key, label, max score, color, adequacy/moderation arrow) per HEI-2020
+# component, in display order.
+_HEI_ROWS = tuple(
+    (
+        key,
+        info["label"],
+        info["max_score"],
+        info["color"],
+        "&#9650;" if info["type"] == "adequacy" else "&#9660;",
+    )
+    for key, info in HEI_COMPONENTS.items()
+)
 
-def render_hei_score_circle(score, label="Diet Quality Score"):
-    """Render an HEI score circle gauge (same SVG technique as sleep score)."""
-    if score is None:
-        st.caption("No diet assessment yet. Take the quiz to see your score.")
-        return
 
-    from services.diet_service import get_hei_score_zone
+@lru_cache(maxsize=512, typed=True)
+def _hei_score_html(score, label):
+    """Return the HEI gauge HTML, cached per distinct score and label."""
     zone = get_hei_score_zone(score)
     color = zone["color"]
 
-    radius = 54
-    circumference = 2 * 3.14159 * radius
+    radius = _HEI_RADIUS
+    circumference = _HEI_CIRCUMFERENCE
     offset = circumference * (1 - score / 100)
 
-    html = (
+    return (
         f'<div style="text-align:center;padding:16px">'
         f'<svg width="140" height="140" viewBox="0 0 140 140">'
-        f'<circle cx="70" cy="70" r="{radius}" fill="none" stroke="{A["bg_tertiary"]}" stroke-width="10"/>'
+        f'<circle cx="70" cy="70" r="{radius}" fill="none" stroke="{_BG_TERTIARY}" stroke-width="10"/>'
         f'<circle cx="70" cy="70" r="{radius}" fill="none" stroke="{color}" stroke-width="10" '
         f'stroke-linecap="round" stroke-dasharray="{circumference}" '
         f'stroke-dashoffset="{offset}" transform="rotate(-90 70 70)"/>'
-        f'<text x="70" y="64" text-anchor="middle" fill="{A["label_primary"]}" '
-        f'font-family="{A["font_display"]}" font-size="28" font-weight="700">{score}</text>'
+        f'<text x="70" y="64" text-anchor="middle" fill="{_LABEL_PRIMARY}" '
+        f'font-family="{_FONT_DISPLAY}" font-size="28" font-weight="700">{score}</text>'
         f'<text x="70" y="84" text-anchor="middle" fill="{color}" '
-        f'font-family="{A["font_text"]}" font-size="11" font-weight="600">{zone["label"]}</text>'
+        f'font-family="{_FONT_TEXT}" font-size="11" font-weight="600">{zone["label"]}</text>'
         f'</svg>'
-        f'<div style="font-size:12px;font-weight:600;color:{A["label_secondary"]};'
+        f'<div style="font-size:12px;font-weight:600;color:{_LABEL_SECONDARY};'
         f'text-transform:uppercase;letter-spacing:0.06em;margin-top:4px">{label}</div>'
-        f'<div style="font-size:12px;color:{A["label_tertiary"]};margin-top:4px">'
+        f'<div style="font-size:12px;color:{_LABEL_TERTIARY};margin-top:4px">'
         f'{zone["message"]}</div>'
         f'</div>'
     )
-    st.markdown(html, unsafe_allow_html=True)
+
+
+def render_hei_score_circle(score, label="Diet Quality Score"):
+    """Render an HEI score circle gauge (same SVG technique as sleep score)."""
+    if score is None:
+        st.caption("No diet assessment yet. Take the quiz to see your score.")
+        return
+    st.markdown(_hei_score_html(score, label), unsafe_allow_html=True)
 
 
 def render_diet_pattern_card(assessment):
@@ -50,54 +88,52 @@ def render_diet_pattern_card(assessment):
     name = data.get("name", "Unknown")
     subtitle = data.get("subtitle", "")
     icon = data.get("icon", "")
-    color = data.get("color", A["blue"])
+    color = data.get("color", _BLUE)
     description = data.get("description", "")
     hei_score = assessment.get("hei_score", "")
 
-    strengths_html = ""
-    for s in data.get("strengths", []):
-        strengths_html += (
-            f'<div style="font-size:12px;color:{A["label_secondary"]};'
-            f'padding:2px 0">&#9989; {s}</div>'
-        )
+    strengths_html = "".join(
+        f'<div style="font-size:12px;color:{_LABEL_SECONDARY};'
+        f'padding:2px 0">&#9989; {s}</div>'
+        for s in data.get("strengths", [])
+    )
 
-    improvements_html = ""
-    for imp in data.get("improvements", []):
-        improvements_html += (
-            f'<div style="font-size:12px;color:{A["label_tertiary"]};'
-            f'padding:2px 0">&#128161; {imp}</div>'
-        )
+    improvements_html = "".join(
+        f'<div style="font-size:12px;color:{_LABEL_TERTIARY};'
+        f'padding:2px 0">&#128161; {imp}</div>'
+        for imp in data.get("improvements", [])
+    )
 
     evidence_html = ""
     evidence = data.get("evidence", "")
     if evidence:
         evidence_html = (
-            f'<div style="font-size:11px;color:{A["label_quaternary"]};'
+            f'<div style="font-size:11px;color:{_LABEL_QUATERNARY};'
             f'margin-top:8px;font-style:italic">{evidence}</div>'
         )
 
     card_html = (
-        f'<div style="background:{A["bg_elevated"]};border:1px solid {A["separator"]};'
-        f'border-left:3px solid {color};border-radius:{A["radius_lg"]};'
+        f'<div style="background:{_BG_ELEVATED};border:1px solid {_SEPARATOR};'
+        f'border-left:3px solid {color};border-radius:{_RADIUS_LG};'
         f'padding:20px;margin-bottom:16px">'
         f'<div style="display:flex;align-items:center;gap:12px;margin-bottom:8px">'
         f'<span style="font-size:32px">{icon}</span>'
         f'<div>'
-        f'<div style="font-family:{A["font_display"]};font-size:20px;'
+        f'<div style="font-family:{_FONT_DISPLAY};font-size:20px;'
         f'font-weight:700;color:{color}">{name}</div>'
-        f'<div style="font-size:12px;color:{A["label_tertiary"]}">'
+        f'<div style="font-size:12px;color:{_LABEL_TERTIARY}">'
         f'{subtitle} &middot; HEI Score: {hei_score}</div>'
         f'</div>'
         f'</div>'
-        f'<div style="font-size:13px;line-height:20px;color:{A["label_secondary"]};'
+        f'<div style="font-size:13px;line-height:20px;color:{_LABEL_SECONDARY};'
         f'margin-bottom:10px">{description}</div>'
         f'<div style="margin-bottom:6px">'
-        f'<div style="font-size:11px;font-weight:600;color:{A["label_primary"]};'
+        f'<div style="font-size:11px;font-weight:600;color:{_LABEL_PRIMARY};'
         f'text-transform:uppercase;letter-spacing:0.06em;margin-bottom:4px">Strengths</div>'
         f'{strengths_html}'
         f'</div>'
         f'<div>'
-        f'<div style="font-size:11px;font-weight:600;color:{A["label_primary"]};'
+        f'<div style="font-size:11px;font-weight:600;color:{_LABEL_PRIMARY};'
         f'text-transform:uppercase;letter-spacing:0.06em;margin-bottom:4px">Areas to Improve</div>'
         f'{improvements_html}'
         f'</div>'
@@ -112,21 +148,15 @@ def render_hei_component_bars(component_scores):
     if not component_scores:
         return
 
-    from config.diet_data import HEI_COMPONENTS
-
-    bars_html = ""
-    for key, info in HEI_COMPONENTS.items():
+    bars_html = []
+    for key, label, max_score, color, comp_type in _HEI_ROWS:
         score = component_scores.get(key, 0)
-        max_score = info["max_score"]
         pct = (score / max_score * 100) if max_score > 0 else 0
-        color = info["color"]
-        comp_type = "&#9650;" if info["type"] == "adequacy" else "&#9660;"
-
-        bars_html += (
+        bars_html.append(
             f'<div style="display:flex;align-items:center;gap:8px;margin-bottom:6px">'
-            f'<div style="font-size:11px;color:{A["label_secondary"]};min-width:150px;text-align:right">'
-            f'{comp_type} {info["label"]}</div>'
-            f'<div style="flex:1;background:{A["fill_tertiary"]};border-radius:9999px;height:6px;overflow:hidden">'
+            f'<div style="font-size:11px;color:{_LABEL_SECONDARY};min-width:150px;text-align:right">'
+            f'{comp_type} {label}</div>'
+            f'<div style="flex:1;background:{_FILL_TERTIARY};border-radius:9999px;height:6px;overflow:hidden">'
             f'<div style="background:{color};width:{pct:.0f}%;height:100%;border-radius:9999px"></div>'
             f'</div>'
             f'<div style="font-size:11px;font-weight:600;color:{color};min-width:40px">'
@@ -135,12 +165,12 @@ def render_hei_component_bars(component_scores):
         )
 
     html = (
-        f'<div style="background:{A["bg_elevated"]};border:1px solid {A["separator"]};'
-        f'border-radius:{A["radius_lg"]};padding:16px;margin-bottom:16px">'
-        f'<div style="font-size:12px;font-weight:600;color:{A["label_primary"]};'
+        f'<div style="background:{_BG_ELEVATED};border:1px solid {_SEPARATOR};'
+        f'border-radius:{_RADIUS_LG};padding:16px;margin-bottom:16px">'
+        f'<div style="font-size:12px;font-weight:600;color:{_LABEL_PRIMARY};'
         f'text-transform:uppercase;letter-spacing:0.06em;margin-bottom:12px">'
         f'HEI-2020 Components (&#9650; Adequacy &middot; &#9660; Moderation)</div>'
-        f'{bars_html}'
+        f'{"".join(bars_html)}'
         f'</div>'
     )
     st.markdown(html, unsafe_allow_html=True)
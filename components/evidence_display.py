@@ -4,6 +4,8 @@ All HTML built as single-line strings (Streamlit markdown parser requirement).
 Uses APPLE design tokens from custom_theme.py.
 """
 
+from functools import lru_cache
+
 import streamlit as st
 from components.custom_theme import APPLE as A
 from config.evidence import (
@@ -11,27 +13,34 @@ from config.evidence import (
     JOURNAL_TIERS, RESEARCH_DOMAINS,
 )
 
+# Theme tokens, looked up once here rather than in every badge and card.
+_FONT_TEXT = A["font_text"]
+_LABEL_SECONDARY = A["label_secondary"]
+_SEPARATOR = A["separator"]
+_LABEL_TERTIARY = A["label_tertiary"]
+_BG_ELEVATED = A["bg_elevated"]
+_RADIUS_LG = A["radius_lg"]
+_FONT_DISPLAY = A["font_display"]
+_LABEL_PRIMARY = A["label_primary"]
+_TEAL = A["teal"]
+_ORANGE = A["orange"]
+_BLUE = A["blue"]
+_RADIUS_XL = A["radius_xl"]
+_RADIUS_MD = A["radius_md"]
+
 # ── Evidence Badge (compact inline) ─────────────────────────────────────────
 
 def render_evidence_badge(grade, study_type, year=None):
     """Render a compact inline badge like [A] Meta-analysis (2023)."""
-    g = EVIDENCE_GRADES.get(grade, EVIDENCE_GRADES["D"])
-    st_info = STUDY_TYPES.get(study_type, {"short": "?", "label": study_type})
-    year_str = f" ({year})" if year else ""
-    html = (
-        f'<span style="display:inline-flex;align-items:center;gap:6px;'
-        f'background:rgba(0,0,0,0.3);border:1px solid {g["color"]}40;'
-        f'border-radius:6px;padding:2px 8px;font-size:11px;font-weight:600;'
-        f'font-family:{A["font_text"]};line-height:16px">'
-        f'<span style="color:{g["color"]}">{grade}</span>'
-        f'<span style="color:{A["label_secondary"]}">{st_info["label"]}{year_str}</span>'
-        f'</span>'
-    )
-    st.markdown(html, unsafe_allow_html=True)
+    st.markdown(render_evidence_badge_inline(grade, study_type, year), unsafe_allow_html=True)
 
 
+@lru_cache(maxsize=1024)
 def render_evidence_badge_inline(grade, study_type, year=None):
-    """Return badge HTML string (for embedding in other components)."""
+    """Return badge HTML string (for embedding in other components).
+
+    Cached: the output depends only on the arguments and static config.
+    """
     g = EVIDENCE_GRADES.get(grade, EVIDENCE_GRADES["D"])
     st_info = STUDY_TYPES.get(study_type, {"short": "?", "label": study_type})
     year_str = f" ({year})" if year else ""
@@ -39,193 +48,287 @@ def render_evidence_badge_inline(grade, study_type, year=None):
         f'<span style="display:inline-flex;align-items:center;gap:6px;'
         f'background:rgba(0,0,0,0.3);border:1px solid {g["color"]}40;'
         f'border-radius:6px;padding:2px 8px;font-size:11px;font-weight:600;'
-        f'font-family:{A["font_text"]};line-height:16px">'
+        f'font-family:{_FONT_TEXT};line-height:16px">'
         f'<span style="color:{g["color"]}">{grade}</span>'
-        f'<span style="color:{A["label_secondary"]}">{st_info["label"]}{year_str}</span>'
+        f'<span style="color:{_LABEL_SECONDARY}">{st_info["label"]}{year_str}</span>'
         f'</span>'
     )
 
 
 # ── Journal Tier Badge ─────────────────────────────────────────────────────
 
-def render_journal_tier_badge_inline(tier):
-    """Return HTML for a journal quality tier badge (Elite/Q1/Q2/Q3/Q4)."""
-    if not tier:
-        return ""
-    t = JOURNAL_TIERS.get(tier)
-    if not t:
-        return ""
+def _tier_badge_html(t):
     flag_icon = " &#9888;" if t.get("flag") else ""
     return (
         f'<span style="display:inline-flex;align-items:center;gap:3px;'
         f'background:{t["color"]}18;border:1px solid {t["color"]}40;'
         f'border-radius:4px;padding:1px 6px;font-size:10px;font-weight:700;'
         f'letter-spacing:0.04em;color:{t["color"]};'
-        f'font-family:{A["font_text"]};line-height:14px">'
+        f'font-family:{_FONT_TEXT};line-height:14px">'
         f'{t["label"]}{flag_icon}</span>'
     )
 
 
-def render_domain_badge_inline(domain):
-    """Return HTML for a research domain badge."""
-    if not domain:
-        return ""
-    d = RESEARCH_DOMAINS.get(domain)
-    label = d["label"] if d else domain.replace("_", " ").title()
+def _domain_badge_html(label):
     return (
         f'<span style="display:inline-flex;align-items:center;'
-        f'background:rgba(0,0,0,0.04);border:1px solid {A["separator"]};'
+        f'background:rgba(0,0,0,0.04);border:1px solid {_SEPARATOR};'
         f'border-radius:4px;padding:1px 6px;font-size:10px;font-weight:500;'
-        f'color:{A["label_tertiary"]};'
-        f'font-family:{A["font_text"]};line-height:14px">'
+        f'color:{_LABEL_TERTIARY};'
+        f'font-family:{_FONT_TEXT};line-height:14px">'
         f'{label}</span>'
     )
 
 
+# Every configured tier and domain badge, rendered once at import.
+_TIER_BADGES = {key: _tier_badge_html(t) for key, t in JOURNAL_TIERS.items()}
+_DOMAIN_BADGES = {key: _domain_badge_html(d["label"]) for key, d in RESEARCH_DOMAINS.items()}
+
+
+def render_journal_tier_badge_inline(tier):
+    """Return HTML for a journal quality tier badge (Elite/Q1/Q2/Q3/Q4)."""
+    return _TIER_BADGES.get(tier, "")
+
+
+def render_domain_badge_inline(domain):
+    """Return HTML for a research domain badge."""
+    if not domain:
+        return ""
+    badge = _DOMAIN_BADGES.get(domain)
+    if badge is None:
+        badge = _domain_badge_html(domain.replace("_", " ").title())
+    return badge
+
+
 # ── Evidence Card (full citation) ───────────────────────────────────────────
 
-def render_evidence_card(evidence, show_details=True):
-    """Render a full evidence card with citation details."""
+# Evidence card shell with the theme baked in at import. The optional
+# sections are pre-rendered fragments (or "") slotted into the body.
+_EVIDENCE_CARD_TMPL = (
+    f'<div style="background:{_BG_ELEVATED};border:1px solid {_SEPARATOR};'
+    f'border-radius:{_RADIUS_LG};padding:16px;margin-bottom:12px;'
+    'transition:border-color 0.25s">'
+    '<div style="display:flex;justify-content:space-between;align-items:flex-start;'
+    'flex-wrap:wrap;gap:8px">'
+    '<div style="flex:1;min-width:200px">'
+    f'<div style="font-family:{_FONT_DISPLAY};font-size:14px;font-weight:600;'
+    f'color:{_LABEL_PRIMARY};line-height:18px">{{title}}</div>'
+    f'<div style="font-size:12px;color:{_LABEL_TERTIARY};margin-top:4px">'
+    '{authors}'
+    ' &middot; <em>{journal}</em>'
+    '{sample_html}</div>'
+    '<div style="display:flex;gap:6px;margin-top:6px;flex-wrap:wrap">'
+    '{tier_badge}{domain_badge}</div>'
+    '</div>'
+    '<div>{badge}</div>'
+    '</div>'
+    '{body_html}'
+    '<div style="margin-top:8px">{link_html}</div>'
+    '</div>'
+)
+_FINDING_TMPL = (
+    f'<div style="font-size:14px;line-height:20px;color:{_LABEL_PRIMARY};'
+    'margin-top:8px;padding:8px 12px;background:rgba(0,0,0,0.03);'
+    'border-radius:8px;border-left:2px solid {color}">'
+    '{text}</div>'
+)
+_EFFECT_TMPL = (
+    f'<div style="font-size:12px;color:{_LABEL_SECONDARY};margin-top:6px">'
+    f'<span style="color:{_LABEL_TERTIARY}">Effect: </span>'
+    '{text}</div>'
+)
+_SAMPLE_TMPL = (
+    f'<span style="font-size:11px;color:{_LABEL_TERTIARY};margin-left:12px">'
+    'N={n}</span>'
+)
+_DOSE_TMPL = (
+    f'<div style="font-size:12px;color:{_TEAL};margin-top:6px;'
+    'font-style:italic">&#x1F4C8; {text}</div>'
+)
+# Amber caution box shared by the causation note and the low-tier flag.
+_CAUTION_TMPL = (
+    f'<div style="font-size:11px;color:{_ORANGE};margin-top:6px;'
+    'padding:4px 8px;background:rgba(255,159,10,0.08);border-radius:6px">'
+    '&#9888; {text}</div>'
+)
+_LINK_STYLE = (
+    f'target="_blank" style="font-size:11px;color:{_BLUE};'
+    'text-decoration:none;margin-top:6px;display:inline-block"'
+)
+_PUBMED_TMPL = (
+    '<a href="https://pubmed.ncbi.nlm.nih.gov/{pmid}/" '
+    f'{_LINK_STYLE}>'
+    'PubMed: {pmid} &#8599;</a>'
+)
+_DOI_TMPL = (
+    '<a href="https://doi.org/{doi}" '
+    f'{_LINK_STYLE}>'
+    'DOI: {doi} &#8599;</a>'
+)
+
+
+def _format_evidence_card(
+    evidence, sample_html="", effect_html="", dose_html="", causation_html=""
+):
+    """Fill the card template; the detail fragments default to omitted."""
     g = EVIDENCE_GRADES.get(evidence["evidence_grade"], EVIDENCE_GRADES["D"])
-    st_info = STUDY_TYPES.get(evidence["study_type"], {"label": evidence["study_type"]})
     badge = render_evidence_badge_inline(
         evidence["evidence_grade"], evidence["study_type"], evidence.get("year")
     )
 
     # Key finding
     finding_html = ""
-    if evidence.get("key_finding"):
-        finding_html = (
-            f'<div style="font-size:14px;line-height:20px;color:{A["label_primary"]};'
-            f'margin-top:8px;padding:8px 12px;background:rgba(0,0,0,0.03);'
-            f'border-radius:8px;border-left:2px solid {g["color"]}">'
-            f'{evidence["key_finding"]}</div>'
-        )
+    if finding := evidence.get("key_finding"):
+        finding_html = _FINDING_TMPL.format(color=g["color"], text=finding)
 
+    # Journal tier flag
+    tier_flag_html = ""
+    journal_tier = evidence.get("journal_tier")
+    if journal_tier in ("q3", "q4"):
+        t = JOURNAL_TIERS.get(journal_tier, {})
+        if t.get("flag"):
+            tier_flag_html = _CAUTION_TMPL.format(text=t["flag"])
+
+    # PubMed link
+    link_html = ""
+    if pmid := evidence.get("pmid"):
+        link_html = _PUBMED_TMPL.format(pmid=pmid)
+    elif doi := evidence.get("doi"):
+        link_html = _DOI_TMPL.format(doi=doi)
+
+    # Only the optional rows this evidence actually has
+    body_parts = (finding_html, effect_html, dose_html, causation_html, tier_flag_html)
+    body_html = "".join(part for part in body_parts if part)
+
+    return _EVIDENCE_CARD_TMPL.format(
+        title=evidence["title"],
+        authors=evidence.get("authors", ""),
+        journal=evidence.get("journal", ""),
+        sample_html=sample_html,
+        tier_badge=render_journal_tier_badge_inline(journal_tier),
+        domain_badge=render_domain_badge_inline(evidence.get("domain")),
+        badge=badge,
+        body_html=body_html,
+        link_html=link_html,
+    )
+
+
+def _evidence_card_full_html(evidence):
+    """Card with effect size, sample size, dose-response and causation note."""
     # Effect size
     effect_html = ""
-    if evidence.get("effect_size") and show_details:
-        effect_html = (
-            f'<div style="font-size:12px;color:{A["label_secondary"]};margin-top:6px">'
-            f'<span style="color:{A["label_tertiary"]}">Effect: </span>'
-            f'{evidence["effect_size"]}</div>'
-        )
+    if effect := evidence.get("effect_size"):
+        effect_html = _EFFECT_TMPL.format(text=effect)
 
     # Sample size
     sample_html = ""
-    if evidence.get("sample_size") and show_details:
-        n = f"{evidence['sample_size']:,}" if isinstance(evidence["sample_size"], int) else str(evidence["sample_size"])
-        sample_html = (
-            f'<span style="font-size:11px;color:{A["label_tertiary"]};margin-left:12px">'
-            f'N={n}</span>'
-        )
+    if sample_size := evidence.get("sample_size"):
+        try:
+            n = format(sample_size, ",")
+        except (TypeError, ValueError):
+            n = str(sample_size)
+        sample_html = _SAMPLE_TMPL.format(n=n)
 
     # Dose-response
     dose_html = ""
-    if evidence.get("dose_response") and show_details:
-        dose_html = (
-            f'<div style="font-size:12px;color:{A["teal"]};margin-top:6px;'
-            f'font-style:italic">&#x1F4C8; {evidence["dose_response"]}</div>'
-        )
+    if dose := evidence.get("dose_response"):
+        dose_html = _DOSE_TMPL.format(text=dose)
 
     # Causation note
     causation_html = ""
-    if evidence.get("causation_note") and show_details:
-        causation_html = (
-            f'<div style="font-size:11px;color:{A["orange"]};margin-top:6px;'
-            f'padding:4px 8px;background:rgba(255,159,10,0.08);border-radius:6px">'
-            f'&#9888; {evidence["causation_note"]}</div>'
-        )
+    if causation := evidence.get("causation_note"):
+        causation_html = _CAUTION_TMPL.format(text=causation)
 
-    # Journal tier + domain badges
-    tier_badge = render_journal_tier_badge_inline(evidence.get("journal_tier"))
-    domain_badge = render_domain_badge_inline(evidence.get("domain"))
-    tier_flag_html = ""
-    if evidence.get("journal_tier") in ("q3", "q4"):
-        t = JOURNAL_TIERS.get(evidence["journal_tier"], {})
-        if t.get("flag"):
-            tier_flag_html = (
-                f'<div style="font-size:11px;color:{A["orange"]};margin-top:6px;'
-                f'padding:4px 8px;background:rgba(255,159,10,0.08);border-radius:6px">'
-                f'&#9888; {t["flag"]}</div>'
-            )
+    return _format_evidence_card(
+        evidence, sample_html, effect_html, dose_html, causation_html
+    )
 
-    # PubMed link
-    link_html = ""
-    if evidence.get("pmid"):
-        link_html = (
-            f'<a href="https://pubmed.ncbi.nlm.nih.gov/{evidence["pmid"]}/" '
-            f'target="_blank" style="font-size:11px;color:{A["blue"]};'
-            f'text-decoration:none;margin-top:6px;display:inline-block">'
-            f'PubMed: {evidence["pmid"]} &#8599;</a>'
-        )
-    elif evidence.get("doi"):
-        link_html = (
-            f'<a href="https://doi.org/{evidence["doi"]}" '
-            f'target="_blank" style="font-size:11px;color:{A["blue"]};'
-            f'text-decoration:none;margin-top:6px;display:inline-block">'
-            f'DOI: {evidence["doi"]} &#8599;</a>'
-        )
 
-    html = (
-        f'<div style="background:{A["bg_elevated"]};border:1px solid {A["separator"]};'
-        f'border-radius:{A["radius_lg"]};padding:16px;margin-bottom:12px;'
-        f'transition:border-color 0.25s">'
-        f'<div style="display:flex;justify-content:space-between;align-items:flex-start;'
-        f'flex-wrap:wrap;gap:8px">'
-        f'<div style="flex:1;min-width:200px">'
-        f'<div style="font-family:{A["font_display"]};font-size:14px;font-weight:600;'
-        f'color:{A["label_primary"]};line-height:18px">{evidence["title"]}</div>'
-        f'<div style="font-size:12px;color:{A["label_tertiary"]};margin-top:4px">'
-        f'{evidence.get("authors", "")}'
-        f' &middot; <em>{evidence.get("journal", "")}</em>'
-        f'{sample_html}</div>'
-        f'<div style="display:flex;gap:6px;margin-top:6px;flex-wrap:wrap">'
-        f'{tier_badge}{domain_badge}</div>'
-        f'</div>'
-        f'<div>{badge}</div>'
-        f'</div>'
-        f'{finding_html}'
-        f'{effect_html}'
-        f'{dose_html}'
-        f'{causation_html}'
-        f'{tier_flag_html}'
-        f'<div style="margin-top:8px">{link_html}</div>'
-        f'</div>'
-    )
-    st.markdown(html, unsafe_allow_html=True)
+def _evidence_card_compact_html(evidence):
+    """Card without the detail rows, for linked-evidence lists."""
+    return _format_evidence_card(evidence)
+
+
+# Every evidence key the card reads; together they form its cache key.
+_CARD_FIELDS = (
+    "title", "authors", "journal", "year", "evidence_grade", "study_type",
+    "journal_tier", "domain", "key_finding", "effect_size", "sample_size",
+    "dose_response", "causation_note", "pmid", "doi",
+)
+
+
+@lru_cache(maxsize=256)
+def _cached_evidence_card_html(fields, show_details):
+    """Build a card from the ``(key, value)`` pairs picked by _evidence_card_html."""
+    evidence = dict(fields)
+    if show_details:
+        return _evidence_card_full_html(evidence)
+    return _evidence_card_compact_html(evidence)
+
+
+def _evidence_card_html(evidence, show_details=True):
+    """Return the HTML for one evidence card with citation details."""
+    fields = tuple((f, evidence[f]) for f in _CARD_FIELDS if f in evidence)
+    try:
+        return _cached_evidence_card_html(fields, show_details)
+    except TypeError:
+        # An unhashable field value; build this one uncached.
+        return _cached_evidence_card_html.__wrapped__(fields, show_details)
+
+
+def render_evidence_card(evidence, show_details=True):
+    """Render a full evidence card with citation details."""
+    st.markdown(_evidence_card_html(evidence, show_details), unsafe_allow_html=True)
+
+
+def render_evidence_cards(evidences, show_details=True):
+    """Render a list of evidence cards as one markdown element.
+
+    Use this instead of calling ``render_evidence_card`` in a loop: a
+    50-study list becomes a single frontend delta.
+    """
+    cards_html = "".join(_evidence_card_html(ev, show_details) for ev in evidences)
+    if cards_html:
+        st.markdown(cards_html, unsafe_allow_html=True)
 
 
 # ── Evidence Pyramid ────────────────────────────────────────────────────────
 
-def render_evidence_pyramid():
-    """Render the evidence hierarchy as a visual pyramid."""
-    layers = ""
+def _pyramid_html():
+    layers = []
     for level in EVIDENCE_PYRAMID:
         g = EVIDENCE_GRADES[level["grade"]]
-        layers += (
+        layers.append(
             f'<div style="width:{level["width"]}%;margin:0 auto 4px auto;'
             f'background:linear-gradient(90deg,{g["color"]}20,{g["color"]}08);'
             f'border:1px solid {g["color"]}30;border-radius:8px;padding:10px 16px;'
             f'text-align:center">'
             f'<div style="font-size:13px;font-weight:600;color:{g["color"]}">'
             f'{level["label"]}</div>'
-            f'<div style="font-size:11px;color:{A["label_tertiary"]};margin-top:2px">'
+            f'<div style="font-size:11px;color:{_LABEL_TERTIARY};margin-top:2px">'
             f'{level["description"]}</div>'
             f'</div>'
         )
-    html = (
-        f'<div style="background:{A["bg_elevated"]};border:1px solid {A["separator"]};'
-        f'border-radius:{A["radius_xl"]};padding:24px;margin-bottom:16px">'
-        f'<div style="font-family:{A["font_display"]};font-size:17px;font-weight:600;'
-        f'color:{A["label_primary"]};text-align:center;margin-bottom:16px">'
+    return (
+        f'<div style="background:{_BG_ELEVATED};border:1px solid {_SEPARATOR};'
+        f'border-radius:{_RADIUS_XL};padding:24px;margin-bottom:16px">'
+        f'<div style="font-family:{_FONT_DISPLAY};font-size:17px;font-weight:600;'
+        f'color:{_LABEL_PRIMARY};text-align:center;margin-bottom:16px">'
         f'Evidence Hierarchy</div>'
-        f'<div style="font-size:12px;color:{A["label_tertiary"]};text-align:center;'
+        f'<div style="font-size:12px;color:{_LABEL_TERTIARY};text-align:center;'
         f'margin-bottom:16px">Stronger evidence at the top, weaker at the bottom</div>'
-        f'{layers}'
+        f'{"".join(layers)}'
         f'</div>'
     )
-    st.markdown(html, unsafe_allow_html=True)
+
+
+# The pyramid reads only static config, so it is rendered once at import.
+_PYRAMID_HTML = _pyramid_html()
+
+
+def render_evidence_pyramid():
+    """Render the evidence hierarchy as a visual pyramid."""
+    st.markdown(_PYRAMID_HTML, unsafe_allow_html=True)
 
 
 # ── Dose-Response Note ──────────────────────────────────────────────────────
@@ -234,11 +337,11 @@ def render_dose_response_note(text):
     """Styled callout box for dose-response information."""
     html = (
         f'<div style="background:rgba(30,200,198,0.06);border:1px solid rgba(30,200,198,0.2);'
-        f'border-radius:{A["radius_md"]};padding:12px 16px;margin:8px 0">'
+        f'border-radius:{_RADIUS_MD};padding:12px 16px;margin:8px 0">'
         f'<div style="font-size:11px;font-weight:600;text-transform:uppercase;'
-        f'letter-spacing:0.06em;color:{A["teal"]};margin-bottom:4px">'
+        f'letter-spacing:0.06em;color:{_TEAL};margin-bottom:4px">'
         f'&#x1F4C8; Dose-Response</div>'
-        f'<div style="font-size:13px;line-height:18px;color:{A["label_secondary"]}">'
+        f'<div style="font-size:13px;line-height:18px;color:{_LABEL_SECONDARY}">'
         f'{text}</div>'
         f'</div>'
     )
@@ -251,11 +354,11 @@ def render_causation_warning(note):
     """Amber callout distinguishing correlation vs causation."""
     html = (
         f'<div style="background:rgba(255,159,10,0.06);border:1px solid rgba(255,159,10,0.2);'
-        f'border-radius:{A["radius_md"]};padding:12px 16px;margin:8px 0">'
+        f'border-radius:{_RADIUS_MD};padding:12px 16px;margin:8px 0">'
         f'<div style="font-size:11px;font-weight:600;text-transform:uppercase;'
-        f'letter-spacing:0.06em;color:{A["orange"]};margin-bottom:4px">'
+        f'letter-spacing:0.06em;color:{_ORANGE};margin-bottom:4px">'
         f'&#9888; Correlation vs Causation</div>'
-        f'<div style="font-size:13px;line-height:18px;color:{A["label_secondary"]}">'
+        f'<div style="font-size:13px;line-height:18px;color:{_LABEL_SECONDARY}">'
         f'{note}</div>'
         f'</div>'
     )
@@ -264,52 +367,68 @@ def render_causation_warning(note):
 
 # ── Evidence Summary Strip ──────────────────────────────────────────────────
 
-def render_evidence_summary_strip(stats):
-    """Render a compact strip showing evidence counts by grade."""
-    parts = ""
-    for grade_key in ["A", "B", "C", "D"]:
-        count = stats.get("by_grade", {}).get(grade_key, 0)
+# Display order of the grade and journal-tier counts in the summary strip.
+_STRIP_GRADES = ("A", "B", "C", "D")
+_STRIP_TIERS = ("elite", "q1", "q2", "q3", "q4")
+
+
+@lru_cache(maxsize=64)
+def _summary_strip_html(total, grade_counts, tier_counts):
+    """Return the strip HTML for counts aligned with _STRIP_GRADES/_STRIP_TIERS."""
+    parts = []
+    for grade_key, count in zip(_STRIP_GRADES, grade_counts):
         if count == 0:
             continue
         g = EVIDENCE_GRADES[grade_key]
-        parts += (
+        parts.append(
             f'<div style="display:flex;align-items:center;gap:4px">'
             f'<span style="width:8px;height:8px;border-radius:50%;'
             f'background:{g["color"]};display:inline-block"></span>'
-            f'<span style="font-size:12px;color:{A["label_secondary"]}">'
+            f'<span style="font-size:12px;color:{_LABEL_SECONDARY}">'
             f'{count} {g["name"]}</span>'
             f'</div>'
         )
     # Tier breakdown
-    tier_parts = ""
-    for tier_key in ["elite", "q1", "q2", "q3", "q4"]:
-        count = stats.get("by_tier", {}).get(tier_key, 0)
+    tier_parts = []
+    for tier_key, count in zip(_STRIP_TIERS, tier_counts):
         if count == 0:
             continue
         t = JOURNAL_TIERS[tier_key]
-        tier_parts += (
+        tier_parts.append(
             f'<div style="display:flex;align-items:center;gap:4px">'
             f'<span style="width:8px;height:8px;border-radius:50%;'
             f'background:{t["color"]};display:inline-block"></span>'
-            f'<span style="font-size:12px;color:{A["label_secondary"]}">'
+            f'<span style="font-size:12px;color:{_LABEL_SECONDARY}">'
             f'{count} {t["label"]}</span>'
             f'</div>'
         )
     html = (
         f'<div style="display:flex;gap:16px;align-items:center;'
         f'padding:8px 0;flex-wrap:wrap">'
-        f'<span style="font-size:13px;font-weight:600;color:{A["label_primary"]}">'
-        f'{stats.get("total", 0)} Studies</span>'
-        f'{parts}'
+        f'<span style="font-size:13px;font-weight:600;color:{_LABEL_PRIMARY}">'
+        f'{total} Studies</span>'
+        f'{"".join(parts)}'
         f'</div>'
     )
     if tier_parts:
         html += (
             f'<div style="display:flex;gap:16px;align-items:center;'
             f'padding:4px 0;flex-wrap:wrap">'
-            f'<span style="font-size:12px;font-weight:500;color:{A["label_tertiary"]}">'
+            f'<span style="font-size:12px;font-weight:500;color:{_LABEL_TERTIARY}">'
             f'Journal Tiers:</span>'
-            f'{tier_parts}'
+            f'{"".join(tier_parts)}'
             f'</div>'
         )
+    return html
+
+
+def render_evidence_summary_strip(stats):
+    """Render a compact strip showing evidence counts by grade."""
+    by_grade = stats.get("by_grade", {})
+    by_tier = stats.get("by_tier", {})
+    html = _summary_strip_html(
+        stats.get("total", 0),
+        tuple(by_grade.get(k, 0) for k in _STRIP_GRADES),
+        tuple(by_tier.get(k, 0) for k in _STRIP_TIERS),
+    )
     st.markdown(html, unsafe_allow_html=True)
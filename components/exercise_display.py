@@ -1,5 +1,8 @@
 """Exercise display components — score gauge, weekly progress, workout cards."""
 
+import math
+from functools import lru_cache
+
 import streamlit as st
 from components.html_utils import escape_html
 from components.custom_theme import APPLE
@@ -12,47 +15,125 @@ from config.exercise_data import (
 
 A = APPLE
 
+# Resolved theme tokens shared by the gauge, strips and workout cards.
+_BG_TERTIARY = A["bg_tertiary"]
+_LABEL_PRIMARY = A["label_primary"]
+_FONT_DISPLAY = A["font_display"]
+_LABEL_TERTIARY = A["label_tertiary"]
+_FONT_TEXT = A["font_text"]
+_LABEL_SECONDARY = A["label_secondary"]
+_BG_ELEVATED = A["bg_elevated"]
+_SEPARATOR = A["separator"]
+_RADIUS_LG = A["radius_lg"]
+_RADIUS_MD = A["radius_md"]
+
+_GAUGE_RADIUS = 54
+_GAUGE_CIRCUMFERENCE = math.tau * _GAUGE_RADIUS
+
+# (min score, color, zone) from the top band down; below 50 is "Needs Work".
+_GAUGE_BANDS = (
+    (85, "#30D158", "Excellent"),
+    (70, "#64D2FF", "Good"),
+    (50, "#FFD60A", "Fair"),
+)
+_GAUGE_FLOOR = ("#FF453A", "Needs Work")
+
+# (min % of the aerobic target, bar color), highest first.
+_AEROBIC_COLORS = ((100, "#30D158"), (66, "#64D2FF"), (33, "#FFD60A"))
+
+# Fallbacks for unknown exercise types and intensities.
+_OTHER_TYPE = EXERCISE_TYPES["other"]
+_MODERATE_INTENSITY = INTENSITY_LEVELS["moderate"]
+
+# Imported-activity badges, keyed by source; manual entries get none.
+_SOURCE_BADGES = {
+    source: (
+        '<span style="font-size:9px;font-weight:600;padding:1px 5px;'
+        f'border-radius:3px;background:{color}20;color:{color};'
+        f'margin-left:6px">{source.upper()}</span>'
+    )
+    for source, color in (("strava", "#FC4C02"), ("garmin", "#007DC3"))
+}
+
+# Workout card with theme tokens baked in; the per-exercise fields are
+# filled with str.format.
+_EXERCISE_CARD_TMPL = (
+    f'<div style="background:{_BG_ELEVATED};border:1px solid {_SEPARATOR};'
+    'border-left:3px solid {int_color};'
+    f'border-radius:{_RADIUS_MD};padding:12px 16px;margin-bottom:8px">'
+    '<div style="display:flex;justify-content:space-between;align-items:center">'
+    '<div style="display:flex;align-items:center;gap:8px">'
+    '<span style="font-size:18px">{icon}</span>'
+    '<div>'
+    f'<div style="font-family:{_FONT_DISPLAY};font-size:14px;font-weight:600;'
+    f'color:{_LABEL_PRIMARY}">{{type_label}}{{source_badge}}</div>'
+    f'<div style="font-size:11px;color:{_LABEL_TERTIARY}">'
+    '{exercise_date}</div>'
+    '</div>'
+    '</div>'
+    '<div style="text-align:right">'
+    f'<div style="font-size:16px;font-weight:700;color:{_LABEL_PRIMARY}">'
+    '{duration} min</div>'
+    '<span style="font-size:10px;font-weight:600;padding:2px 6px;'
+    'border-radius:4px;background:{int_color}20;'
+    'color:{int_color}">{int_label}</span>'
+    '</div>'
+    '</div>'
+    '{details_html}'
+    '{notes_html}'
+    '</div>'
+)
+_DETAILS_TMPL = (
+    f'<div style="font-size:11px;color:{_LABEL_TERTIARY};margin-top:4px">'
+    '{chips}</div>'
+)
+_NOTES_TMPL = (
+    f'<div style="font-size:11px;color:{_LABEL_TERTIARY};'
+    'margin-top:4px;font-style:italic">{notes}</div>'
+)
+
+
+# Gauge SVG with the ring geometry and theme tokens baked in; only the
+# band color, dash offset, score, zone and label vary.
+_GAUGE_TMPL = (
+    '<div style="text-align:center;padding:16px">'
+    '<svg width="140" height="140" viewBox="0 0 140 140">'
+    f'<circle cx="70" cy="70" r="{_GAUGE_RADIUS}" fill="none" stroke="{_BG_TERTIARY}" stroke-width="10"/>'
+    f'<circle cx="70" cy="70" r="{_GAUGE_RADIUS}" fill="none" stroke="{{color}}" stroke-width="10" '
+    f'stroke-linecap="round" stroke-dasharray="{_GAUGE_CIRCUMFERENCE}" '
+    'stroke-dashoffset="{offset}" transform="rotate(-90 70 70)"/>'
+    f'<text x="70" y="64" text-anchor="middle" fill="{_LABEL_PRIMARY}" '
+    f'font-family="{_FONT_DISPLAY}" font-size="28" font-weight="700">{{score}}</text>'
+    f'<text x="70" y="84" text-anchor="middle" fill="{_LABEL_TERTIARY}" '
+    f'font-family="{_FONT_TEXT}" font-size="11" font-weight="600">{{zone}}</text>'
+    '</svg>'
+    f'<div style="font-size:12px;font-weight:600;color:{_LABEL_SECONDARY};'
+    'text-transform:uppercase;letter-spacing:0.06em;margin-top:4px">{label}</div>'
+    '</div>'
+)
+
+
+@lru_cache(maxsize=256, typed=True)
+def _gauge_html(score, label):
+    """Return the exercise gauge HTML, memoized on ``(score, label)``."""
+    color, zone = next(
+        ((c, z) for t, c, z in _GAUGE_BANDS if score >= t), _GAUGE_FLOOR
+    )
+    return _GAUGE_TMPL.format(
+        color=color,
+        offset=_GAUGE_CIRCUMFERENCE * (1 - score / 100),
+        score=score,
+        zone=zone,
+        label=label,
+    )
+
 
 def render_exercise_score_gauge(score, label="Exercise Score"):
     """Render a circular score gauge for the weekly exercise score."""
     if score is None:
         st.caption("No exercise data this week. Log your first workout to see your score.")
         return
-
-    if score >= 85:
-        color = "#30D158"
-        zone = "Excellent"
-    elif score >= 70:
-        color = "#64D2FF"
-        zone = "Good"
-    elif score >= 50:
-        color = "#FFD60A"
-        zone = "Fair"
-    else:
-        color = "#FF453A"
-        zone = "Needs Work"
-
-    radius = 54
-    circumference = 2 * 3.14159 * radius
-    offset = circumference * (1 - score / 100)
-
-    gauge_html = (
-        f'<div style="text-align:center;padding:16px">'
-        f'<svg width="140" height="140" viewBox="0 0 140 140">'
-        f'<circle cx="70" cy="70" r="{radius}" fill="none" stroke="{A["bg_tertiary"]}" stroke-width="10"/>'
-        f'<circle cx="70" cy="70" r="{radius}" fill="none" stroke="{color}" stroke-width="10" '
-        f'stroke-linecap="round" stroke-dasharray="{circumference}" '
-        f'stroke-dashoffset="{offset}" transform="rotate(-90 70 70)"/>'
-        f'<text x="70" y="64" text-anchor="middle" fill="{A["label_primary"]}" '
-        f'font-family="{A["font_display"]}" font-size="28" font-weight="700">{score}</text>'
-        f'<text x="70" y="84" text-anchor="middle" fill="{A["label_tertiary"]}" '
-        f'font-family="{A["font_text"]}" font-size="11" font-weight="600">{zone}</text>'
-        f'</svg>'
-        f'<div style="font-size:12px;font-weight:600;color:{A["label_secondary"]};'
-        f'text-transform:uppercase;letter-spacing:0.06em;margin-top:4px">{label}</div>'
-        f'</div>'
-    )
-    st.markdown(gauge_html, unsafe_allow_html=True)
+    st.markdown(_gauge_html(score, label), unsafe_allow_html=True)
 
 
 def render_weekly_progress_bar(stats):
@@ -65,47 +146,39 @@ def render_weekly_progress_bar(stats):
     aerobic_pct = min(100, round(aeq / target_aerobic * 100)) if target_aerobic > 0 else 0
     strength_pct = min(100, round(strength_days / target_strength * 100)) if target_strength > 0 else 0
 
-    # Aerobic color
-    if aerobic_pct >= 100:
-        aero_color = "#30D158"
-    elif aerobic_pct >= 66:
-        aero_color = "#64D2FF"
-    elif aerobic_pct >= 33:
-        aero_color = "#FFD60A"
-    else:
-        aero_color = "#FF453A"
+    aero_color = next((c for t, c in _AEROBIC_COLORS if aerobic_pct >= t), "#FF453A")
 
     # Strength color
     str_color = "#30D158" if strength_pct >= 100 else ("#FFD60A" if strength_pct >= 50 else "#FF453A")
 
     html = (
-        f'<div style="background:{A["bg_elevated"]};border:1px solid {A["separator"]};'
-        f'border-radius:{A["radius_lg"]};padding:16px;margin-bottom:12px">'
+        f'<div style="background:{_BG_ELEVATED};border:1px solid {_SEPARATOR};'
+        f'border-radius:{_RADIUS_LG};padding:16px;margin-bottom:12px">'
         # Aerobic
         f'<div style="margin-bottom:14px">'
         f'<div style="display:flex;justify-content:space-between;align-items:center;margin-bottom:6px">'
-        f'<div style="font-size:13px;font-weight:600;color:{A["label_primary"]}">&#10084; Aerobic</div>'
+        f'<div style="font-size:13px;font-weight:600;color:{_LABEL_PRIMARY}">&#10084; Aerobic</div>'
         f'<div style="font-size:13px;font-weight:700;color:{aero_color}">{aeq}/{target_aerobic} min</div>'
         f'</div>'
-        f'<div style="height:10px;background:{A["bg_tertiary"]};border-radius:5px;overflow:hidden">'
+        f'<div style="height:10px;background:{_BG_TERTIARY};border-radius:5px;overflow:hidden">'
         f'<div style="height:100%;width:{aerobic_pct}%;background:{aero_color};'
         f'border-radius:5px;transition:width 0.3s"></div>'
         f'</div>'
-        f'<div style="font-size:10px;color:{A["label_tertiary"]};margin-top:3px">'
+        f'<div style="font-size:10px;color:{_LABEL_TERTIARY};margin-top:3px">'
         f'Moderate + 2&times;Vigorous min (WHO guideline: 150 min/wk)</div>'
         f'</div>'
         # Strength
         f'<div>'
         f'<div style="display:flex;justify-content:space-between;align-items:center;margin-bottom:6px">'
-        f'<div style="font-size:13px;font-weight:600;color:{A["label_primary"]}">&#127947; Strength</div>'
+        f'<div style="font-size:13px;font-weight:600;color:{_LABEL_PRIMARY}">&#127947; Strength</div>'
         f'<div style="font-size:13px;font-weight:700;color:{str_color}">'
         f'{strength_days}/{target_strength} days</div>'
         f'</div>'
-        f'<div style="height:10px;background:{A["bg_tertiary"]};border-radius:5px;overflow:hidden">'
+        f'<div style="height:10px;background:{_BG_TERTIARY};border-radius:5px;overflow:hidden">'
         f'<div style="height:100%;width:{strength_pct}%;background:{str_color};'
         f'border-radius:5px;transition:width 0.3s"></div>'
         f'</div>'
-        f'<div style="font-size:10px;color:{A["label_tertiary"]};margin-top:3px">'
+        f'<div style="font-size:10px;color:{_LABEL_TERTIARY};margin-top:3px">'
         f'Strength training days (WHO guideline: 2+ days/wk)</div>'
         f'</div>'
         f'</div>'
@@ -120,35 +193,35 @@ def render_exercise_summary_strip(stats):
         ("Cardio", f"{stats.get('cardio_min', 0)}m", "#FF453A"),
         ("Strength", f"{stats.get('strength_min', 0)}m", "#0A84FF"),
         ("Flex", f"{stats.get('flexibility_min', 0)}m", "#BF5AF2"),
-        ("Total", f"{stats.get('total_min', 0)}m", A["label_primary"]),
+        ("Total", f"{stats.get('total_min', 0)}m", _LABEL_PRIMARY),
     ]
-    cards = ""
+    cards = []
     for label, value, color in items:
-        cards += (
+        cards.append(
             f'<div style="text-align:center;min-width:55px">'
-            f'<div style="font-family:{A["font_display"]};font-size:20px;'
+            f'<div style="font-family:{_FONT_DISPLAY};font-size:20px;'
             f'font-weight:700;color:{color}">{value}</div>'
             f'<div style="font-size:10px;font-weight:600;text-transform:uppercase;'
-            f'letter-spacing:0.06em;color:{A["label_tertiary"]}">{label}</div>'
+            f'letter-spacing:0.06em;color:{_LABEL_TERTIARY}">{label}</div>'
             f'</div>'
         )
     strip_html = (
-        f'<div style="background:{A["bg_elevated"]};border:1px solid {A["separator"]};'
-        f'border-radius:{A["radius_lg"]};padding:16px;margin-bottom:12px">'
+        f'<div style="background:{_BG_ELEVATED};border:1px solid {_SEPARATOR};'
+        f'border-radius:{_RADIUS_LG};padding:16px;margin-bottom:12px">'
         f'<div style="display:flex;justify-content:space-around;flex-wrap:wrap;gap:8px">'
-        f'{cards}'
+        f'{"".join(cards)}'
         f'</div>'
         f'</div>'
     )
     st.markdown(strip_html, unsafe_allow_html=True)
 
 
-def render_exercise_card(exercise):
-    """Render a single exercise/workout card."""
+def _exercise_card_html(exercise):
+    """Return the HTML for one exercise/workout card."""
     ex_type = exercise.get("exercise_type", "other")
-    type_info = EXERCISE_TYPES.get(ex_type, EXERCISE_TYPES["other"])
+    type_info = EXERCISE_TYPES.get(ex_type, _OTHER_TYPE)
     intensity = exercise.get("intensity", "moderate")
-    int_info = INTENSITY_LEVELS.get(intensity, INTENSITY_LEVELS["moderate"])
+    int_info = INTENSITY_LEVELS.get(intensity, _MODERATE_INTENSITY)
 
     duration = exercise.get("duration_min", 0)
     distance = exercise.get("distance_km")
@@ -170,57 +243,32 @@ def render_exercise_card(exercise):
 
     details_html = ""
     if details:
-        chips = " &nbsp;&middot;&nbsp; ".join(details)
-        details_html = (
-            f'<div style="font-size:11px;color:{A["label_tertiary"]};margin-top:4px">'
-            f'{chips}</div>'
-        )
+        details_html = _DETAILS_TMPL.format(chips=" &nbsp;&middot;&nbsp; ".join(details))
 
-    source_badge = ""
-    if source == "strava":
-        source_badge = (
-            f'<span style="font-size:9px;font-weight:600;padding:1px 5px;'
-            f'border-radius:3px;background:#FC4C0220;color:#FC4C02;'
-            f'margin-left:6px">STRAVA</span>'
-        )
-    elif source == "garmin":
-        source_badge = (
-            f'<span style="font-size:9px;font-weight:600;padding:1px 5px;'
-            f'border-radius:3px;background:#007DC320;color:#007DC3;'
-            f'margin-left:6px">GARMIN</span>'
-        )
+    source_badge = _SOURCE_BADGES.get(source, "")
 
-    notes_html = ""
-    if notes:
-        notes_html = (
-            f'<div style="font-size:11px;color:{A["label_tertiary"]};'
-            f'margin-top:4px;font-style:italic">{notes}</div>'
-        )
+    notes_html = _NOTES_TMPL.format(notes=notes) if notes else ""
 
-    card_html = (
-        f'<div style="background:{A["bg_elevated"]};border:1px solid {A["separator"]};'
-        f'border-left:3px solid {int_info["color"]};'
-        f'border-radius:{A["radius_md"]};padding:12px 16px;margin-bottom:8px">'
-        f'<div style="display:flex;justify-content:space-between;align-items:center">'
-        f'<div style="display:flex;align-items:center;gap:8px">'
-        f'<span style="font-size:18px">{type_info["icon"]}</span>'
-        f'<div>'
-        f'<div style="font-family:{A["font_display"]};font-size:14px;font-weight:600;'
-        f'color:{A["label_primary"]}">{type_info["label"]}{source_badge}</div>'
-        f'<div style="font-size:11px;color:{A["label_tertiary"]}">'
-        f'{exercise.get("exercise_date", "")}</div>'
-        f'</div>'
-        f'</div>'
-        f'<div style="text-align:right">'
-        f'<div style="font-size:16px;font-weight:700;color:{A["label_primary"]}">'
-        f'{duration} min</div>'
-        f'<span style="font-size:10px;font-weight:600;padding:2px 6px;'
-        f'border-radius:4px;background:{int_info["color"]}20;'
-        f'color:{int_info["color"]}">{int_info["label"]}</span>'
-        f'</div>'
-        f'</div>'
-        f'{details_html}'
-        f'{notes_html}'
-        f'</div>'
+    return _EXERCISE_CARD_TMPL.format(
+        int_color=int_info["color"],
+        icon=type_info["icon"],
+        type_label=type_info["label"],
+        source_badge=source_badge,
+        exercise_date=exercise.get("exercise_date", ""),
+        duration=duration,
+        int_label=int_info["label"],
+        details_html=details_html,
+        notes_html=notes_html,
     )
-    st.markdown(card_html, unsafe_allow_html=True)
+
+
+def render_exercise_card(exercise):
+    """Render a single exercise/workout card."""
+    st.markdown(_exercise_card_html(exercise), unsafe_allow_html=True)
+
+
+def render_exercise_cards(exercises):
+    """Render a list of workout cards in a single markdown element."""
+    cards_html = "".join(_exercise_card_html(ex) for ex in exercises)
+    if cards_html:
+        st.markdown(cards_html, unsafe_allow_html=True)
@@ -13,67 +13,70 @@ from config.exercise_library_data import MUSCLE_GROUPS, EQUIPMENT_TYPES
 A = APPLE
 
 
+# The key-terms guide depends only on theme tokens, so it is built once.
+_KEY_TERMS_HTML = (
+    f'<div style="background:{A["bg_secondary"]};border:1px solid {A["separator"]};'
+    f'border-radius:{A["radius_lg"]};padding:16px;margin-bottom:16px">'
+    f'<div style="font-size:13px;font-weight:700;color:{A["label_primary"]};'
+    f'margin-bottom:10px">&#128218; Quick Guide — Key Terms &amp; Colors</div>'
+    # Terms grid
+    f'<div style="display:grid;grid-template-columns:1fr 1fr;gap:8px 16px;margin-bottom:12px">'
+    # RIR
+    f'<div style="font-size:12px;line-height:16px">'
+    f'<span style="font-weight:700;color:{A["label_primary"]}">RIR</span>'
+    f'<span style="color:{A["label_secondary"]}"> = Reps In Reserve — '
+    f'how many more reps you <em>could</em> do before failure. '
+    f'Lower RIR = harder effort.</span></div>'
+    # Sets
+    f'<div style="font-size:12px;line-height:16px">'
+    f'<span style="font-weight:700;color:{A["label_primary"]}">Sets &times; Reps</span>'
+    f'<span style="color:{A["label_secondary"]}"> = e.g. "4 &times; 6-10" means '
+    f'do 4 sets of 6 to 10 repetitions each.</span></div>'
+    # Compound
+    f'<div style="font-size:12px;line-height:16px">'
+    f'<span style="font-weight:700;color:{A["blue"]}">Compound</span>'
+    f'<span style="color:{A["label_secondary"]}"> = multi-joint exercise (e.g. squat, bench press) — '
+    f'works several muscles at once.</span></div>'
+    # Isolation
+    f'<div style="font-size:12px;line-height:16px">'
+    f'<span style="font-weight:700;color:{A["purple"]}">Isolation</span>'
+    f'<span style="color:{A["label_secondary"]}"> = single-joint exercise (e.g. curl, fly) — '
+    f'targets one specific muscle.</span></div>'
+    # Mesocycle
+    f'<div style="font-size:12px;line-height:16px">'
+    f'<span style="font-weight:700;color:{A["label_primary"]}">Mesocycle</span>'
+    f'<span style="color:{A["label_secondary"]}"> = a training block (4-6 weeks) that starts easy, '
+    f'gets progressively harder, then deloads.</span></div>'
+    # Deload
+    f'<div style="font-size:12px;line-height:16px">'
+    f'<span style="font-weight:700;color:{A["green"]}">Deload</span>'
+    f'<span style="color:{A["label_secondary"]}"> = a recovery week with reduced volume (fewer sets) '
+    f'to let your body recover and adapt.</span></div>'
+    f'</div>'
+    # Color meanings
+    f'<div style="font-size:12px;font-weight:700;color:{A["label_primary"]};'
+    f'margin-bottom:6px">Volume Bar Colors</div>'
+    f'<div style="display:flex;gap:16px;flex-wrap:wrap">'
+    f'<div style="font-size:11px;display:flex;align-items:center;gap:4px">'
+    f'<span style="display:inline-block;width:10px;height:10px;'
+    f'background:{A["green"]};border-radius:3px"></span>'
+    f'<span style="color:{A["label_secondary"]}">Optimal zone — good stimulus for growth</span></div>'
+    f'<div style="font-size:11px;display:flex;align-items:center;gap:4px">'
+    f'<span style="display:inline-block;width:10px;height:10px;'
+    f'background:{A["orange"]};border-radius:3px"></span>'
+    f'<span style="color:{A["label_secondary"]}">Near max recoverable — high fatigue risk</span></div>'
+    f'<div style="font-size:11px;display:flex;align-items:center;gap:4px">'
+    f'<span style="display:inline-block;width:10px;height:10px;'
+    f'background:{A["red"]};border-radius:3px"></span>'
+    f'<span style="color:{A["label_secondary"]}">Too low or too high — adjust volume</span></div>'
+    f'</div>'
+    f'</div>'
+)
+
+
 def render_key_terms_guide():
     """Render a compact reference card explaining all key terms and colors."""
-    html = (
-        f'<div style="background:{A["bg_secondary"]};border:1px solid {A["separator"]};'
-        f'border-radius:{A["radius_lg"]};padding:16px;margin-bottom:16px">'
-        f'<div style="font-size:13px;font-weight:700;color:{A["label_primary"]};'
-        f'margin-bottom:10px">&#128218; Quick Guide — Key Terms &amp; Colors</div>'
-        # Terms grid
-        f'<div style="display:grid;grid-template-columns:1fr 1fr;gap:8px 16px;margin-bottom:12px">'
-        # RIR
-        f'<div style="font-size:12px;line-height:16px">'
-        f'<span style="font-weight:700;color:{A["label_primary"]}">RIR</span>'
-        f'<span style="color:{A["label_secondary"]}"> = Reps In Reserve — '
-        f'how many more reps you <em>could</em> do before failure. '
-        f'Lower RIR = harder effort.</span></div>'
-        # Sets
-        f'<div style="font-size:12px;line-height:16px">'
-        f'<span style="font-weight:700;color:{A["label_primary"]}">Sets &times; Reps</span>'
-        f'<span style="color:{A["label_secondary"]}"> = e.g. "4 &times; 6-10" means '
-        f'do 4 sets of 6 to 10 repetitions each.</span></div>'
-        # Compound
-        f'<div style="font-size:12px;line-height:16px">'
-        f'<span style="font-weight:700;color:{A["blue"]}">Compound</span>'
-        f'<span style="color:{A["label_secondary"]}"> = multi-joint exercise (e.g. squat, bench press) — '
-        f'works several muscles at once.</span></div>'
-        # Isolation
-        f'<div style="font-size:12px;line-height:16px">'
-        f'<span style="font-weight:700;color:{A["purple"]}">Isolation</span>'
-        f'<span style="color:{A["label_secondary"]}"> = single-joint exercise (e.g. curl, fly) — '
-        f'targets one specific muscle.</span></div>'
-        # Mesocycle
-        f'<div style="font-size:12px;line-height:16px">'
-        f'<span style="font-weight:700;color:{A["label_primary"]}">Mesocycle</span>'
-        f'<span style="color:{A["label_secondary"]}"> = a training block (4-6 weeks) that starts easy, '
-        f'gets progressively harder, then deloads.</span></div>'
-        # Deload
-        f'<div style="font-size:12px;line-height:16px">'
-        f'<span style="font-weight:700;color:{A["green"]}">Deload</span>'
-        f'<span style="color:{A["label_secondary"]}"> = a recovery week with reduced volume (fewer sets) '
-        f'to let your body recover and adapt.</span></div>'
-        f'</div>'
-        # Color meanings
-        f'<div style="font-size:12px;font-weight:700;color:{A["label_primary"]};'
-        f'margin-bottom:6px">Volume Bar Colors</div>'
-        f'<div style="display:flex;gap:16px;flex-wrap:wrap">'
-        f'<div style="font-size:11px;display:flex;align-items:center;gap:4px">'
-        f'<span style="display:inline-block;width:10px;height:10px;'
-        f'background:{A["green"]};border-radius:3px"></span>'
-        f'<span style="color:{A["label_secondary"]}">Optimal zone — good stimulus for growth</span></div>'
-        f'<div style="font-size:11px;display:flex;align-items:center;gap:4px">'
-        f'<span style="display:inline-block;width:10px;height:10px;'
-        f'background:{A["orange"]};border-radius:3px"></span>'
-        f'<span style="color:{A["label_secondary"]}">Near max recoverable — high fatigue risk</span></div>'
-        f'<div style="font-size:11px;display:flex;align-items:center;gap:4px">'
-        f'<span style="display:inline-block;width:10px;height:10px;'
-        f'background:{A["red"]};border-radius:3px"></span>'
-        f'<span style="color:{A["label_secondary"]}">Too low or too high — adjust volume</span></div>'
-        f'</div>'
-        f'</div>'
-    )
-    st.markdown(html, unsafe_allow_html=True)
+    st.markdown(_KEY_TERMS_HTML, unsafe_allow_html=True)
 
 
 def render_program_overview(program: dict):
@@ -329,12 +332,11 @@ def render_volume_chart(volume: dict, level: str = "intermediate"):
     st.markdown(card_html, unsafe_allow_html=True)
 
 
-def render_rir_guide():
-    """Render the RIR (Reps In Reserve) reference guide."""
-    rows = ""
+def _rir_guide_html():
+    rows = []
     for rir_val in [4, 3, 2, 1, 0]:
         info = RIR_GUIDE[rir_val]
-        rows += (
+        rows.append(
             f'<div style="display:flex;align-items:center;gap:10px;padding:8px 0;'
             f'border-bottom:1px solid {A["separator"]}">'
             f'<div style="min-width:50px;text-align:center">'
@@ -348,28 +350,34 @@ def render_rir_guide():
             f'</div>'
             f'</div>'
         )
-
-    html = (
+    return (
         f'<div style="background:{A["bg_elevated"]};border:1px solid {A["separator"]};'
         f'border-radius:{A["radius_lg"]};padding:16px">'
         f'<div style="font-size:11px;font-weight:600;text-transform:uppercase;'
         f'letter-spacing:0.06em;color:{A["label_tertiary"]};margin-bottom:8px">'
         f'RIR — Reps In Reserve Guide</div>'
-        f'{rows}'
+        f'{"".join(rows)}'
         f'<div style="font-size:11px;color:{A["label_tertiary"]};margin-top:8px;'
         f'line-height:16px">RIR = how many reps you <em>could</em> still do if pushed. '
         f'Compounds: stay at RIR 2-3. Isolations: can go to RIR 0-1. '
         f'(Helms et al., 2016 — PMID: 27834585)</div>'
         f'</div>'
     )
-    st.markdown(html, unsafe_allow_html=True)
 
 
-def render_volume_landmarks_table():
-    """Render a reference table of RP volume landmarks."""
-    rows = ""
-    for key, vl in VOLUME_LANDMARKS.items():
-        rows += (
+# RIR_GUIDE is static reference data; render the guide once at import.
+_RIR_GUIDE_HTML = _rir_guide_html()
+
+
+def render_rir_guide():
+    """Render the RIR (Reps In Reserve) reference guide."""
+    st.markdown(_RIR_GUIDE_HTML, unsafe_allow_html=True)
+
+
+def _volume_landmarks_html():
+    rows = []
+    for vl in VOLUME_LANDMARKS.values():
+        rows.append(
             f'<tr>'
             f'<td style="font-size:12px;font-weight:600;color:{A["label_primary"]};padding:6px 8px">'
             f'{vl["label"]}</td>'
@@ -383,8 +391,7 @@ def render_volume_landmarks_table():
             f'{vl["mrv"]}</td>'
             f'</tr>'
         )
-
-    html = (
+    return (
         f'<div style="background:{A["bg_elevated"]};border:1px solid {A["separator"]};'
         f'border-radius:{A["radius_lg"]};padding:16px;overflow-x:auto">'
         f'<div style="font-size:11px;font-weight:600;text-transform:uppercase;'
@@ -406,7 +413,7 @@ def render_volume_landmarks_table():
         f'<th style="text-align:center;font-size:10px;font-weight:600;color:{A["red"]};'
         f'padding:6px"><div>MRV</div><div style="font-weight:400;font-size:9px">Max Recoverable</div></th>'
         f'</tr></thead>'
-        f'<tbody>{rows}</tbody>'
+        f'<tbody>{"".join(rows)}</tbody>'
         f'</table>'
         f'<div style="font-size:10px;color:{A["label_tertiary"]};margin-top:10px;line-height:16px">'
         f'<strong>MV</strong> = Maintenance Volume (keep muscle, no growth) &middot; '
@@ -417,7 +424,15 @@ def render_volume_landmarks_table():
         f'Schoenfeld et al. (2017, PMID: 28032998)</div>'
         f'</div>'
     )
-    st.markdown(html, unsafe_allow_html=True)
+
+
+# Same for the landmarks table, which reads only VOLUME_LANDMARKS.
+_VOLUME_LANDMARKS_HTML = _volume_landmarks_html()
+
+
+def render_volume_landmarks_table():
+    """Render a reference table of RP volume landmarks."""
+    st.markdown(_VOLUME_LANDMARKS_HTML, unsafe_allow_html=True)
 
 
 def render_mesocycle_timeline(program: dict):
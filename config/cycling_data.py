@@ -61,6 +61,13 @@ POWER_ZONES = {
     },
 }
 
+# Table-width description for the zones reference card, derived once here so
+# renders don't re-slice the full text.
+for _zone in POWER_ZONES.values():
+    _desc = _zone["description"]
+    _zone["short_description"] = _desc[:60] + ("…" if len(_desc) > 60 else "")
+del _zone, _desc
+
 # ── Workout Types ──────────────────────────────────────────────────────────
 
 WORKOUT_TYPES = {
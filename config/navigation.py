@@ -0,0 +1,75 @@
+"""Navigation tree for the authenticated app.
+
+Plain data only — ``app.py`` turns these entries into ``st.Page`` objects, so
+this module stays importable without Streamlit and every deployment shares a
+single source of truth for page order, titles, and icons.
+"""
+
+# (path, title, icon)
+LOGIN_PAGE = ("pages/login.py", "Login", ":material/login:")
+
+# Section name -> ordered (path, title, icon) entries. The first page of the
+# first section is the default landing page after login.
+NAV_SECTIONS = {
+    "Overview": (
+        ("pages/clinical_command_center.py", "Clinical Summary", ":material/clinical_notes:"),
+        ("pages/precision_plans.py", "Precision Plans", ":material/auto_awesome:"),
+        ("pages/dashboard.py", "Dashboard", ":material/dashboard:"),
+        ("pages/wheel_assessment.py", "Wheel of Life", ":material/donut_large:"),
+        ("pages/recovery.py", "Recovery", ":material/hotel:"),
+    ),
+    "Planning": (
+        ("pages/weekly_plan.py", "Weekly Plan", ":material/calendar_view_week:"),
+        ("pages/monthly_plan.py", "Monthly Plan", ":material/calendar_month:"),
+        ("pages/goals.py", "Goals", ":material/flag:"),
+        ("pages/microhabits.py", "Micro Habits", ":material/psychology_alt:"),
+    ),
+    "Tracking": (
+        ("pages/progress.py", "Progress", ":material/trending_up:"),
+        ("pages/exercise_tracker.py", "Exercise", ":material/fitness_center:"),
+        ("pages/exercise_library.py", "Exercise Library", ":material/menu_book:"),
+        ("pages/exercise_prescription.py", "Training Program", ":material/assignment:"),
+        ("pages/hpr_movement_lab.py", "HPR Movement Lab", ":material/directions_run:"),
+        ("pages/running_training.py", "Running Training", ":material/directions_run:"),
+        ("pages/cycling_prescription.py", "Cycling Training", ":material/directions_bike:"),
+        ("pages/body_metrics.py", "Body Metrics", ":material/monitor_weight:"),
+        ("pages/inbody_report.py", "InBody Coach", ":material/scale:"),
+        ("pages/cpet_report.py", "CPET Coach", ":material/monitor_heart:"),
+        ("pages/biomarkers.py", "Biomarkers", ":material/bloodtype:"),
+        ("pages/organ_health.py", "Organ Scores", ":material/monitor_heart:"),
+        ("pages/healthscore_v2.py", "Health Score v2 (beta)", ":material/science:"),
+        ("pages/sleep_tracker.py", "Sleep", ":material/bedtime:"),
+        ("pages/nutrition_logger.py", "Nutrition", ":material/restaurant:"),
+        ("pages/diet_assessment.py", "Diet Pattern", ":material/eco:"),
+        ("pages/fasting_tracker.py", "Fasting", ":material/timer:"),
+        ("pages/sibo_tracker.py", "SIBO & FODMAP", ":material/science:"),
+        ("pages/analytics.py", "Analytics", ":material/insights:"),
+        ("pages/ai_coach.py", "AI Coach", ":material/psychology:"),
+    ),
+    "Science": (
+        ("pages/science_review.py", "Science Review", ":material/fact_check:"),
+        ("pages/research_library.py", "Research Library", ":material/science:"),
+        ("pages/protocols.py", "Daily Protocols", ":material/labs:"),
+    ),
+    "Growth": (
+        ("pages/daily_growth.py", "Daily Growth", ":material/spa:"),
+        ("pages/lessons.py", "Micro-Lessons", ":material/school:"),
+        ("pages/challenges.py", "Challenges", ":material/emoji_events:"),
+        ("pages/future_self.py", "Future Self", ":material/mail:"),
+    ),
+    "Reports": (
+        ("pages/reports.py", "Health Report", ":material/summarize:"),
+    ),
+    "Wearables": (
+        ("pages/wearable_wheel.py", "Wearable Wheel", ":material/watch:"),
+    ),
+    "Account": (
+        ("pages/settings_page.py", "Settings", ":material/settings:"),
+        ("pages/garmin_import.py", "Garmin Connect", ":material/watch:"),
+    ),
+}
+
+ADMIN_SECTION = (
+    "Administration",
+    (("pages/admin_console.py", "Admin Console", ":material/admin_panel_settings:"),),
+)
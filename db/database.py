@@ -1,6 +1,8 @@
 import sqlite3
 import os
 import logging
+import threading
+from contextlib import contextmanager
 
 DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "lifestyle_medicine.db")
 SCHEMA_PATH = os.path.join(os.path.dirname(__file__), "schema.sql")
@@ -15,6 +17,62 @@ def get_connection() -> sqlite3.Connection:
     return conn
 
 
+_SHARED_CONN: sqlite3.Connection | None = None
+_SHARED_LOCK = threading.RLock()
+
+
+def _get_shared_connection() -> sqlite3.Connection:
+    """Return the process-wide connection, opening it on first use.
+
+    Callers must hold ``_SHARED_LOCK``; the connection is shared across
+    Streamlit script threads, so it is opened with ``check_same_thread=False``.
+    """
+    global _SHARED_CONN
+    if _SHARED_CONN is None:
+        conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        _SHARED_CONN = conn
+    return _SHARED_CONN
+
+
+@contextmanager
+def db_cursor():
+    """Yield a cursor on the shared connection, serialized by a lock.
+
+    Avoids the connect/PRAGMA/close round-trip of ``get_connection()`` for
+    short hot-path queries. Commits on success and rolls back on error.
+    """
+    with _SHARED_LOCK:
+        conn = _get_shared_connection()
+        cur = conn.cursor()
+        try:
+            yield cur
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cur.close()
+
+
+def warm_shared_connection() -> None:
+    """Open the shared connection ahead of the first page render."""
+    with db_cursor() as cur:
+        cur.execute("SELECT 1").fetchone()
+
+
+def close_shared_connection() -> None:
+    """Close the shared connection; the next ``db_cursor()`` reopens it."""
+    global _SHARED_CONN
+    with _SHARED_LOCK:
+        if _SHARED_CONN is not None:
+            _SHARED_CONN.close()
+            _SHARED_CONN = None
+
+
 def init_db():
     conn = get_connection()
     with open(SCHEMA_PATH, "r", encoding="utf-8") as f:
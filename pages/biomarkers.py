@@ -6,7 +6,7 @@ import pandas as pd
 from datetime import date, datetime
 from components.custom_theme import APPLE, render_hero_banner, render_section_header
 from components.biomarker_display import (
-    render_biomarker_range_bar,
+    render_biomarker_range_bars,
     render_biomarker_score_gauge,
     render_biomarker_summary_strip,
     render_category_header,
@@ -153,8 +153,7 @@ with tab_dashboard:
                 continue
             cat_info = BIOMARKER_CATEGORIES[cat_key]
             render_category_header(cat_key, cat_info)
-            for r in grouped[cat_key]:
-                render_biomarker_range_bar(r)
+            render_biomarker_range_bars(grouped[cat_key])
 
 # ══════════════════════════════════════════════════════════════════════════
 # Tab 2: Log Results
@@ -297,20 +296,24 @@ with tab_trends:
 # ══════════════════════════════════════════════════════════════════════════
 # Tab 4: Lab History
 # ══════════════════════════════════════════════════════════════════════════
-with tab_history:
-    render_section_header("Lab History", "View results by lab date")
-
-    lab_dates = get_lab_dates(user_id)
+@st.fragment
+def _render_lab_history(uid):
+    """Lab-date picker + range bars; picking a date reruns only this block."""
+    lab_dates = get_lab_dates(uid)
     if not lab_dates:
         st.caption("No lab results recorded yet.")
-    else:
-        selected_date = st.selectbox("Select Lab Date", lab_dates)
-        date_results = get_results_by_date(user_id, selected_date)
+        return
+    selected_date = st.selectbox("Select Lab Date", lab_dates)
+    date_results = get_results_by_date(uid, selected_date)
 
-        if date_results:
-            st.caption(f"Showing {len(date_results)} markers from {selected_date}")
-            for r in date_results:
-                render_biomarker_range_bar(r)
+    if date_results:
+        st.caption(f"Showing {len(date_results)} markers from {selected_date}")
+        render_biomarker_range_bars(date_results)
+
+
+with tab_history:
+    render_section_header("Lab History", "View results by lab date")
+    _render_lab_history(user_id)
 
 # ══════════════════════════════════════════════════════════════════════════
 # Tab 5: AI Analysis (BloodGPT)
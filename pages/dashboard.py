@@ -6,7 +6,7 @@ import plotly.graph_objects as go
 from config.settings import PILLARS, MOTIVATIONAL_QUOTES, get_score_label, get_score_color
 from services.wheel_service import get_current_wheel, get_stages, get_total_score, get_score_summary
 from components.wheel_chart import create_wheel_chart
-from components.custom_theme import APPLE, render_hero_stats, render_hero_banner, render_section_header
+from components.custom_theme import APPLE, HeroStat, render_hero_stats, render_hero_banner, render_section_header
 from services.nudge_engine import get_active_nudges
 from services.coin_service import get_coin_balance, award_daily_coins
 from services.dashboard_experience_service import (
@@ -168,14 +168,14 @@ else:
 
     # ── Hero Stat Cards (Apple Health colors) ────────────────────────────
     _hero_cards = [
-        {"label": "Current Streak", "value": f"{streak} days", "icon": "\U0001f525", "color": "#FA2D55"},
-        {"label": "Habits Today", "value": f"{habits_done}/{habits_total}", "icon": "\u2705", "color": "#34C759"},
-        {"label": "Active Goals", "value": str(active_goals), "icon": "\U0001f3af", "color": "#5E5CE6"},
-        {"label": "Wheel Score", "value": f"{get_total_score(scores)}/60", "icon": "\U0001f3a1", "color": "#BF5AF2"},
-        {"label": "Sleep Score", "value": _sleep_val, "icon": "\U0001f319", "color": "#5E5CE6"},
-        {"label": "Recovery", "value": _recovery_val, "icon": "\u2764\ufe0f", "color": _recovery_color},
-        {"label": "Weight", "value": _weight_val, "icon": "\u2696\ufe0f", "color": "#64D2FF"},
-        {"label": "LifeCoins", "value": str(coins), "icon": "\u2b50", "color": "#FFD60A"},
+        HeroStat(label="Current Streak", value=f"{streak} days", icon="\U0001f525", color="#FA2D55"),
+        HeroStat(label="Habits Today", value=f"{habits_done}/{habits_total}", icon="\u2705", color="#34C759"),
+        HeroStat(label="Active Goals", value=str(active_goals), icon="\U0001f3af", color="#5E5CE6"),
+        HeroStat(label="Wheel Score", value=f"{get_total_score(scores)}/60", icon="\U0001f3a1", color="#BF5AF2"),
+        HeroStat(label="Sleep Score", value=_sleep_val, icon="\U0001f319", color="#5E5CE6"),
+        HeroStat(label="Recovery", value=_recovery_val, icon="\u2764\ufe0f", color=_recovery_color),
+        HeroStat(label="Weight", value=_weight_val, icon="\u2696\ufe0f", color="#64D2FF"),
+        HeroStat(label="LifeCoins", value=str(coins), icon="\u2b50", color="#FFD60A"),
     ]
 
     # If actively fasting, replace LifeCoins with fast timer
@@ -183,7 +183,7 @@ else:
         _af = _get_active_fast(user_id)
         if _af:
             _elapsed = _af.get("elapsed_hours", 0)
-            _hero_cards[-1] = {"label": "Fasting", "value": f"{_elapsed:.1f}h", "icon": "\u23f1\ufe0f", "color": "#FF9F0A"}
+            _hero_cards[-1] = HeroStat(label="Fasting", value=f"{_elapsed:.1f}h", icon="\u23f1\ufe0f", color="#FF9F0A")
     except Exception:
         pass
 
@@ -11,7 +11,7 @@ from components.exercise_display import (
     render_exercise_score_gauge,
     render_weekly_progress_bar,
     render_exercise_summary_strip,
-    render_exercise_card,
+    render_exercise_cards,
 )
 from config.exercise_data import (
     EXERCISE_TYPES,
@@ -77,8 +77,7 @@ with tab_dashboard:
 
     recent = get_exercise_history(user_id, days=7)
     if recent:
-        for ex in recent:
-            render_exercise_card(ex)
+        render_exercise_cards(recent)
     else:
         st.caption("No recent workouts. Start logging to see your activity here.")
 
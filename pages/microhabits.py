@@ -6,8 +6,8 @@ from datetime import date, timedelta
 
 from components.html_utils import escape_html
 from components.custom_theme import (
-    APPLE, render_hero_banner, render_section_header,
-    render_hero_stats, render_glass_card,
+    APPLE, render_page_header, render_section_header,
+    HeroStat, render_glass_card,
 )
 from config.settings import (
     PILLARS, FOUR_LAWS_QUESTIONS, SCIENCE_TIPS,
@@ -30,12 +30,7 @@ from services.microhabit_service import (
 A = APPLE
 user_id = st.session_state.user_id
 
-render_hero_banner(
-    "Micro Habits",
-    "Small changes, remarkable results. Build habits using the science of behavior change.",
-)
-
-# ── Hero Stats ───────────────────────────────────────────────────────────────
+# ── Hero Banner + Stats ──────────────────────────────────────────────────────
 
 habits = get_active_habits(user_id)
 stacks = get_user_stacks(user_id)
@@ -48,12 +43,16 @@ for h in habits:
     s = get_habit_streak(h["id"], user_id)
     best_streak = max(best_streak, s)
 
-render_hero_stats([
-    {"label": "Active Habits", "value": str(len(habits)), "icon": "\u2705", "color": A["green"]},
-    {"label": "Best Streak", "value": f"{best_streak}d", "icon": "\U0001F525", "color": A["move"]},
-    {"label": "4 Laws Avg", "value": f"{avg_score:.1f}/5", "icon": "\U0001F3AF", "color": A["indigo"]},
-    {"label": "Badges Earned", "value": str(milestone_summary["total_earned"]), "icon": "\U0001F3C6", "color": "#FFD700"},
-])
+render_page_header(
+    "Micro Habits",
+    "Small changes, remarkable results. Build habits using the science of behavior change.",
+    [
+        HeroStat(label="Active Habits", value=str(len(habits)), icon="\u2705", color=A["green"]),
+        HeroStat(label="Best Streak", value=f"{best_streak}d", icon="\U0001F525", color=A["move"]),
+        HeroStat(label="4 Laws Avg", value=f"{avg_score:.1f}/5", icon="\U0001F3AF", color=A["indigo"]),
+        HeroStat(label="Badges Earned", value=str(milestone_summary["total_earned"]), icon="\U0001F3C6", color="#FFD700"),
+    ],
+)
 
 
 # ── Science Card Helper ──────────────────────────────────────────────────────
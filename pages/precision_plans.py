@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import streamlit as st
 
-from components.custom_theme import render_hero_banner, render_hero_stats, render_section_header
+from components.custom_theme import HeroStat, render_hero_banner, render_hero_stats, render_section_header
 from services.ai_cds_service import (
     build_lifestyle_intervention_support,
     build_precision_plan,
@@ -176,10 +176,10 @@ if plan.get("disclaimer"):
 
 render_hero_stats(
     [
-        {"icon": "🎯", "value": plan.get("goal_label", "N/A"), "label": "Primary Goal", "color": "#6750A4"},
-        {"icon": "🧭", "value": plan.get("template_label", "N/A"), "label": "Template", "color": "#1A73E8"},
-        {"icon": "📅", "value": f"{plan.get('horizon_weeks', 8)} Weeks", "label": "Horizon", "color": "#1E8E3E"},
-        {"icon": "🫀", "value": len(plan.get("priority_domains", [])), "label": "Priority Domains", "color": "#E8710A"},
+        HeroStat(icon="🎯", value=plan.get("goal_label", "N/A"), label="Primary Goal", color="#6750A4"),
+        HeroStat(icon="🧭", value=plan.get("template_label", "N/A"), label="Template", color="#1A73E8"),
+        HeroStat(icon="📅", value=f"{plan.get('horizon_weeks', 8)} Weeks", label="Horizon", color="#1E8E3E"),
+        HeroStat(icon="🫀", value=len(plan.get("priority_domains", [])), label="Priority Domains", color="#E8710A"),
     ]
 )
 
@@ -3,8 +3,8 @@
 import streamlit as st
 import plotly.graph_objects as go
 from datetime import date, timedelta
-from components.custom_theme import APPLE, render_hero_banner, render_section_header, render_hero_stats
-from components.evidence_display import render_evidence_card
+from components.custom_theme import APPLE, HeroStat, render_hero_banner, render_section_header, render_hero_stats
+from components.evidence_display import render_evidence_cards
 from config.settings import PILLARS
 from services.protocol_service import (
     get_user_protocols,
@@ -74,10 +74,10 @@ for up in user_protocols:
 avg_adherence = round(sum(adherence_values) / len(adherence_values)) if adherence_values else 0
 
 render_hero_stats([
-    {"label": "Today's Progress", "value": f"{completed_today}/{total_protocols}", "icon": "\u2705", "color": A["green"]},
-    {"label": "Completion", "value": f"{completion_pct}%", "icon": "\U0001f4ca", "color": A["blue"]},
-    {"label": "Active Protocols", "value": str(total_protocols), "icon": "\U0001f52c", "color": A["purple"]},
-    {"label": "30-Day Adherence", "value": f"{avg_adherence}%", "icon": "\U0001f4c8", "color": A["teal"]},
+    HeroStat(label="Today's Progress", value=f"{completed_today}/{total_protocols}", icon="\u2705", color=A["green"]),
+    HeroStat(label="Completion", value=f"{completion_pct}%", icon="\U0001f4ca", color=A["blue"]),
+    HeroStat(label="Active Protocols", value=str(total_protocols), icon="\U0001f52c", color=A["purple"]),
+    HeroStat(label="30-Day Adherence", value=f"{avg_adherence}%", icon="\U0001f4c8", color=A["teal"]),
 ])
 
 st.markdown("<div style='height:16px'></div>", unsafe_allow_html=True)
@@ -247,8 +247,7 @@ for up in user_protocols:
 
         if linked:
             st.markdown("**Supporting Research:**")
-            for ev in linked:
-                render_evidence_card(ev, show_details=False)
+            render_evidence_cards(linked, show_details=False)
 
         if audit:
             st.markdown("**Recommendation Audit Trail (Top Drivers):**")
@@ -5,7 +5,7 @@ from datetime import date
 import streamlit as st
 from components.custom_theme import APPLE, render_hero_banner, render_section_header
 from components.evidence_display import (
-    render_evidence_card,
+    render_evidence_cards,
     render_evidence_pyramid,
     render_evidence_summary_strip,
     render_evidence_badge_inline,
@@ -98,8 +98,7 @@ with tab_browse:
         st.caption("No studies found for the selected filters.")
     else:
         st.caption(f"Showing {len(evidences)} studies")
-        for ev in evidences:
-            render_evidence_card(ev)
+        render_evidence_cards(evidences)
 
 # ── Tab 2: Browse by Domain ─────────────────────────────────────────────────
 with tab_domain:
@@ -124,8 +123,7 @@ with tab_domain:
         st.caption("No studies found for the selected filters.")
     else:
         st.caption(f"Showing {len(domain_evidences)} studies")
-        for ev in domain_evidences:
-            render_evidence_card(ev)
+        render_evidence_cards(domain_evidences)
 
 # ── Tab 3: Search ─────────────────────────────────────────────────────────
 with tab_search:
@@ -134,8 +132,7 @@ with tab_search:
         results = search_evidence(query)
         if results:
             st.caption(f"Found {len(results)} studies matching \"{query}\"")
-            for ev in results:
-                render_evidence_card(ev)
+            render_evidence_cards(results)
         else:
             st.caption(f"No studies found for \"{query}\".")
     else:
@@ -205,8 +202,7 @@ with tab_latest:
     render_section_header("Newest Auto-Imported Studies", "Latest entries pulled via PubMed API")
     _auto_rows = get_latest_auto_evidence(limit=25, pillar_id=_latest_pid)
     if _auto_rows:
-        for _ev in _auto_rows:
-            render_evidence_card(_ev)
+        render_evidence_cards(_auto_rows)
     else:
         st.caption("No auto-imported studies yet. Use 'Refresh from PubMed' to pull the latest evidence.")
 
@@ -224,8 +220,7 @@ with tab_latest:
     if _all_rows:
         _ranking_mode = "Guideline-first" if _guideline_first else "Quality + recency"
         st.caption(f"Top {min(20, len(_all_rows))} ranked studies since {_cutoff_year} ({_ranking_mode})")
-        for _ev in _all_rows[:20]:
-            render_evidence_card(_ev)
+        render_evidence_cards(_all_rows[:20])
     else:
         st.caption("No studies available for the selected time window.")
 
@@ -433,8 +428,7 @@ with tab_protocols:
                 # Show linked evidence
                 if linked_evidence:
                     st.markdown("**Supporting Research:**")
-                    for ev in linked_evidence:
-                        render_evidence_card(ev, show_details=False)
+                    render_evidence_cards(linked_evidence, show_details=False)
 
                 # Adopt button
                 if not adopted:
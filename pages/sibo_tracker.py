@@ -20,7 +20,7 @@ from components.sibo_display import (
     render_evidence_coverage_box,
     render_diet_confidence_table,
 )
-from components.evidence_display import render_evidence_card
+from components.evidence_display import render_evidence_cards
 from config.sibo_data import (
     GI_SYMPTOMS, FODMAP_GROUPS, FODMAP_FOODS, FODMAP_FOOD_CATEGORIES,
     FODMAP_PHASES, SIBO_EVIDENCE, RESTRICTIVE_DIET_SAFETY,
@@ -422,8 +422,7 @@ with tab_science:
     render_sibo_disclaimer()
     render_section_header("Scientific Evidence", "Evidence scope and limitations by study design")
 
-    for ev in SIBO_EVIDENCE:
-        render_evidence_card(ev)
+    render_evidence_cards(SIBO_EVIDENCE)
 
     st.markdown("<div style='height:16px'></div>", unsafe_allow_html=True)
     render_evidence_coverage_box()
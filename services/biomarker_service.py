@@ -2,6 +2,7 @@
 
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from db.database import get_connection
 from datetime import date
@@ -21,9 +22,22 @@ def _effective_range(definition, age=None, sex=None):
     not carry the ``variants`` list, so we look the full static definition up by
     ``code`` to recover them.
     """
-    lookup = BIOMARKERS_BY_CODE.get(definition.get("code")) if definition.get("code") else None
-    source = lookup if (lookup and lookup.get("variants")) else definition
-    return resolve_reference_range(source, age=age, sex=sex)
+    code = definition.get("code")
+    lookup = BIOMARKERS_BY_CODE.get(code) if code else None
+    if lookup and lookup.get("variants"):
+        return dict(_static_variant_range(code, age, sex))
+    return resolve_reference_range(definition, age=age, sex=sex)
+
+
+@lru_cache(maxsize=1024)
+def _static_variant_range(code, age, sex):
+    """Memoized variant resolution for a static config biomarker.
+
+    The config definitions never change at runtime, so the resolved band only
+    depends on ``(code, age, sex)``. Callers receive a copy via
+    ``_effective_range`` so the cached dict is never mutated.
+    """
+    return resolve_reference_range(BIOMARKERS_BY_CODE[code], age=age, sex=sex)
 
 
 def _attach_target_evidence(defn: dict) -> dict:
@@ -203,17 +217,22 @@ def classify_result(value, definition, age=None, sex=None):
     return "in_range"
 
 
+_CLASSIFICATION_DISPLAYS = {
+    "in_range": {"label": "In Range", "color": "#30D158", "icon": "&#10004;"},
+    "low": {"label": "Below Range", "color": "#FF9F0A", "icon": "&#9660;"},
+    "high": {"label": "Above Range", "color": "#FF9F0A", "icon": "&#9650;"},
+    "critical_low": {"label": "Critical Low", "color": "#FF453A", "icon": "&#10071;"},
+    "critical_high": {"label": "Critical High", "color": "#FF453A", "icon": "&#10071;"},
+    "unknown": {"label": "Unknown", "color": "#AEAEB2", "icon": "&#8212;"},
+}
+
+
 def get_classification_display(classification):
-    """Return display properties for a lab classification."""
-    displays = {
-        "in_range": {"label": "In Range", "color": "#30D158", "icon": "&#10004;"},
-        "low": {"label": "Below Range", "color": "#FF9F0A", "icon": "&#9660;"},
-        "high": {"label": "Above Range", "color": "#FF9F0A", "icon": "&#9650;"},
-        "critical_low": {"label": "Critical Low", "color": "#FF453A", "icon": "&#10071;"},
-        "critical_high": {"label": "Critical High", "color": "#FF453A", "icon": "&#10071;"},
-        "unknown": {"label": "Unknown", "color": "#AEAEB2", "icon": "&#8212;"},
-    }
-    return displays.get(classification, displays["unknown"])
+    """Return display properties for a lab classification.
+
+    The returned dict is shared module state; treat it as read-only.
+    """
+    return _CLASSIFICATION_DISPLAYS.get(classification, _CLASSIFICATION_DISPLAYS["unknown"])
 
 
 def score_single_result(value, definition):
@@ -412,7 +412,7 @@ box-shadow:0 1px 3px rgba(20,24,31,.06);margin-bottom:var(--gap);break-inside:av
 .chip{display:inline-block;padding:2px 8px;border-radius:999px;font-size:10px;font-weight:700;letter-spacing:0;color:#fff;}
 table{width:100%;border-collapse:collapse;} th,td{padding:7px 9px;border-bottom:1px solid var(--hairline);text-align:left;vertical-align:top;}
 th{font-size:10px;text-transform:uppercase;letter-spacing:0;color:var(--ink-2);}
-td.num,th.num{text-align:right;} .table-wrap{overflow-x:auto;-webkit-overflow-scrolling:touch;}
+td.num,th.num{text-align:right;} .table-wrap{overflow-x:auto;}
 .dot{display:inline-block;width:9px;height:9px;border-radius:2px;margin-right:7px;vertical-align:middle;}
 svg{display:block;width:100%;height:auto;}
 .checks{list-style:none;margin:4px 0 0;padding:0;} .checks li{padding:3px 0;font-size:12px;}
@@ -435,7 +435,7 @@ p.lead{margin:0 0 12px;}
 body{font-size:14px;}.wrap{padding:10px;}.hdr{display:block;padding:18px 16px;}.hdr .meta{text-align:left;margin-top:14px;}
 .kpi-row{grid-template-columns:repeat(2,minmax(0,1fr));gap:10px;}.kpi{padding:12px;}.kpi__val{font-size:30px;}
 .card{padding:14px;}.section-title{margin-top:22px;}th,td{padding:7px 8px;min-width:92px;}.small{font-size:12px;}
-.zone-chart{overflow-x:auto;-webkit-overflow-scrolling:touch;}.zone-chart svg{min-width:620px;}
+.zone-chart{overflow-x:auto;}.zone-chart svg{min-width:620px;}
 }
 @media (max-width:380px){.kpi-row{grid-template-columns:1fr;}}
 @page{size:A4;margin:13mm;}
@@ -3,6 +3,7 @@
 from db.database import get_connection
 import json
 from datetime import date
+from functools import lru_cache
 
 
 def assess_diet_pattern(user_id, answers):
@@ -152,8 +153,14 @@ def get_assessment_history(user_id):
         conn.close()
 
 
+@lru_cache(maxsize=128)
 def get_hei_score_zone(score):
-    """Return the zone info for a given HEI score."""
+    """Return the zone info for a given HEI score.
+
+    Memoized: scores are 0-100 and the zone table is static config. The
+    returned dict is the shared ``HEI_SCORE_ZONES`` entry; treat it as
+    read-only.
+    """
     from config.diet_data import HEI_SCORE_ZONES
     for zone in HEI_SCORE_ZONES.values():
         if zone["min"] <= score <= zone["max"]:
@@ -4,6 +4,7 @@ that can be downloaded and printed to PDF from any browser.
 """
 
 from datetime import date, timedelta
+from html import escape
 from db.database import get_connection
 from config.settings import PILLARS
 from services.biomarker_service import classify_result
@@ -1383,7 +1384,7 @@ def _esc(text):
     """Basic HTML escaping."""
     if text is None:
         return ""
-    return str(text).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
+    return escape(str(text), quote=True)
 
 
 def _pearson(x, y):
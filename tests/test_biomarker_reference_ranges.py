@@ -62,3 +62,13 @@ def test_resolver_handles_missing_sex_gracefully():
     ranges = resolve_reference_range(hb)
     assert ranges["standard_low"] is not None
     assert ranges["standard_high"] is not None
+
+
+def test_effective_range_cache_returns_independent_copies():
+    from services.biomarker_service import _effective_range
+
+    row = {"code": "hemoglobin", "standard_low": 13.5, "standard_high": 17.5}
+    first = _effective_range(row, age=35, sex="female")
+    first["standard_low"] = -1
+    second = _effective_range(row, age=35, sex="female")
+    assert second["standard_low"] == 12.0
@@ -0,0 +1,39 @@
+from components.custom_theme import _APPLE_CSS_MIN, _hero_card_html, _hex_to_rgba, _minify_css
+
+
+def test_minify_css_collapses_whitespace_and_comments():
+    src = "/* note */\n.a  >  .b {\n    color: red ;\n    margin: 0 auto;\n}\n"
+    assert _minify_css(src) == ".a>.b{color:red;margin:0 auto}"
+
+
+def test_minify_css_keeps_space_before_pseudo_class():
+    assert _minify_css(".a :hover { color: red; }") == ".a :hover{color:red}"
+
+
+def test_minify_css_leaves_quoted_strings_alone():
+    src = ".a { font-family: 'Segoe  UI', sans-serif; content: \"x ;  y\"; }"
+    assert _minify_css(src) == ".a{font-family:'Segoe  UI',sans-serif;content:\"x ;  y\"}"
+
+
+def test_minify_css_tightens_important():
+    assert _minify_css(".a { color: red !important; }") == ".a{color:red!important}"
+
+
+def test_theme_stylesheet_is_a_single_line_style_block():
+    assert _APPLE_CSS_MIN.startswith('<style id="lm-theme">:root{')
+    assert _APPLE_CSS_MIN.endswith("</style>")
+    assert "\n" not in _APPLE_CSS_MIN
+
+
+def test_hero_card_escapes_text_fields_but_not_icon():
+    html = _hero_card_html("&#9989;", "<b>5</b>", 'A "quoted" label', "#1E8E3E", "+2 <i>")
+    assert "&#9989;" in html
+    assert "&lt;b&gt;5&lt;/b&gt;" in html
+    assert "A &quot;quoted&quot; label" in html
+    assert "&#9650; +2 &lt;i&gt;" in html
+
+
+def test_hex_to_rgba_expands_short_hex_and_rejects_other_formats():
+    assert _hex_to_rgba("#abc", 0.07) == "rgba(170,187,204,0.07)"
+    assert _hex_to_rgba("#1E8E3E", 0.5) == "rgba(30,142,62,0.5)"
+    assert _hex_to_rgba("red", 0.07) is None
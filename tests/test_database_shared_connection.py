@@ -0,0 +1,48 @@
+"""Tests for the shared-connection ``db_cursor`` helper in db.database."""
+
+import pytest
+
+import db.database as db_mod
+
+
+@pytest.fixture
+def shared_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(db_mod, "DB_PATH", str(tmp_path / "shared.db"))
+    db_mod.close_shared_connection()
+    with db_mod.db_cursor() as cur:
+        cur.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT)")
+    yield
+    db_mod.close_shared_connection()
+
+
+def test_db_cursor_reuses_one_connection(shared_db):
+    with db_mod.db_cursor() as first:
+        conn_a = first.connection
+    with db_mod.db_cursor() as second:
+        conn_b = second.connection
+    assert conn_a is conn_b
+
+
+def test_db_cursor_commits_on_success(shared_db):
+    with db_mod.db_cursor() as cur:
+        cur.execute("INSERT INTO t (name) VALUES (?)", ("kept",))
+    db_mod.close_shared_connection()
+    with db_mod.db_cursor() as cur:
+        row = cur.execute("SELECT name FROM t").fetchone()
+    assert row["name"] == "kept"
+
+
+def test_db_cursor_rolls_back_on_error(shared_db):
+    with pytest.raises(RuntimeError):
+        with db_mod.db_cursor() as cur:
+            cur.execute("INSERT INTO t (name) VALUES (?)", ("dropped",))
+            raise RuntimeError("boom")
+    with db_mod.db_cursor() as cur:
+        count = cur.execute("SELECT COUNT(*) FROM t").fetchone()[0]
+    assert count == 0
+
+
+def test_warm_shared_connection_opens_connection(shared_db):
+    db_mod.close_shared_connection()
+    db_mod.warm_shared_connection()
+    assert db_mod._SHARED_CONN is not None
@@ -0,0 +1,29 @@
+"""Integrity checks for the shared navigation tree in config/navigation.py."""
+
+import os
+
+from config.navigation import ADMIN_SECTION, LOGIN_PAGE, NAV_SECTIONS
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
+
+
+def _all_entries():
+    yield LOGIN_PAGE
+    for pages in NAV_SECTIONS.values():
+        yield from pages
+    yield from ADMIN_SECTION[1]
+
+
+def test_every_navigation_page_exists():
+    for path, _title, _icon in _all_entries():
+        assert os.path.isfile(os.path.join(_PROJECT_ROOT, path)), path
+
+
+def test_navigation_paths_are_unique():
+    paths = [path for path, _title, _icon in _all_entries()]
+    assert len(paths) == len(set(paths))
+
+
+def test_navigation_icons_use_material_symbols():
+    for _path, title, icon in _all_entries():
+        assert icon.startswith(":material/") and icon.endswith(":"), title